@@ -0,0 +1,151 @@
+# ==========================================================
+# Data Air Quality (UCI id=360) lokal + cache Parquet bertipe
+# ----------------------------------------------------------
+# - Pengganti fetch_ucirepo(id=360) di XGBoot (butuh internet setiap run)
+# - Sumber lokal (folder ini atau data_dir): AirQualityUCI.csv (file asli UCI: ';', desimal ',',
+#   Date dd/mm/yyyy, Time HH.MM.SS) atau AirQualityUCI.xlsx
+# - Run pertama: file mentah diparse sekali -> airquality.parquet
+#   (datetime, hour, dayofweek sudah dihitung; sensor float64, -200 tetap apa adanya)
+# - Run berikutnya: langsung dari cache (milidetik); cache dibangun ulang jika file mentah berubah
+# - Tanpa file lokal & tanpa cache: fallback fetch_ucirepo sekali (jika terpasang), lalu di-cache
+# - split_features(): langkah fitur yang sama untuk training (XGBoot) dan inference
+# Usage: python AirQualityData.py [folder_data]
+# ==========================================================
+
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+RAW_FILES = ("AirQualityUCI.csv", "AirQualityUCI.xlsx")
+CACHE_FILE = "airquality.parquet"
+CACHE_VERSION = "1"
+
+TARGET = "CO(GT)"
+MISSING_VALUE = -200  # penanda nilai hilang di dataset UCI
+SENSOR_COLUMNS = ["CO(GT)", "PT08.S1(CO)", "NMHC(GT)", "C6H6(GT)", "PT08.S2(NMHC)", "NOx(GT)",
+                  "PT08.S3(NOx)", "NO2(GT)", "PT08.S4(NO2)", "PT08.S5(O3)", "T", "RH", "AH"]
+TIME_FEATURES = ["hour", "dayofweek"]
+# urutan kolom X sama dengan XGBoot lama: df.drop(columns=["Date", "Time", "CO(GT)", "datetime"])
+FEATURE_COLUMNS = [c for c in SENSOR_COLUMNS if c != TARGET] + TIME_FEATURES
+
+# -------------------------
+# Fitur (dipakai training & inference)
+# -------------------------
+def add_time_features(df, date_format=None):
+    """
+    Tambah kolom datetime, hour, dayofweek dari Date + Time.
+    date_format None -> aturan lama XGBoot: pd.to_datetime(Date + " " + Time, dayfirst=True)
+    """
+    if "datetime" in df:
+        df["datetime"] = pd.to_datetime(df["datetime"], errors="coerce")
+    else:
+        text = df["Date"].astype(str) + " " + df["Time"].astype(str)
+        if date_format:
+            df["datetime"] = pd.to_datetime(text, format=date_format, errors="coerce")
+        else:
+            df["datetime"] = pd.to_datetime(text, dayfirst=True, errors="coerce")
+    df["hour"] = df["datetime"].dt.hour.astype("float32")
+    df["dayofweek"] = df["datetime"].dt.dayofweek.astype("float32")
+    return df
+
+def split_features(df):
+    """DataFrame (cache / input mentah) -> X, y dengan -200 -> NaN. y None jika target tidak ada."""
+    if "hour" not in df or "dayofweek" not in df:
+        df = add_time_features(df.copy())
+    X = df[FEATURE_COLUMNS].astype("float64").replace(MISSING_VALUE, np.nan)
+    y = df[TARGET].astype("float64").replace(MISSING_VALUE, np.nan) if TARGET in df else None
+    return X, y
+
+# -------------------------
+# Baca file mentah
+# -------------------------
+def read_raw(path):
+    """File UCI asli (.csv / .xlsx) -> DataFrame dengan datetime + kolom sensor."""
+    if path.endswith(".xlsx"):
+        df = pd.read_excel(path)  # butuh openpyxl
+        df = df.dropna(subset=["Date"])
+        df["datetime"] = pd.to_datetime(df["Date"].astype(str).str[:10] + " " + df["Time"].astype(str),
+                                        format="%Y-%m-%d %H:%M:%S", errors="coerce")
+    else:
+        df = pd.read_csv(path, sep=";", decimal=",")
+        df = df.loc[:, ~df.columns.str.startswith("Unnamed")].dropna(subset=["Date"])
+        df = add_time_features(df, date_format="%d/%m/%Y %H.%M.%S")
+    return df
+
+def _fetch_ucirepo():
+    from ucimlrepo import fetch_ucirepo
+    return add_time_features(fetch_ucirepo(id=360).data.features.copy())
+
+def _signature(path):
+    st = os.stat(path)
+    return f"{os.path.basename(path)}:{st.st_size}:{st.st_mtime_ns}"
+
+def _to_cache(df, cache_path, source):
+    df = add_time_features(df) if "hour" not in df else df
+    out = pd.DataFrame({"datetime": df["datetime"].astype("datetime64[s]")})
+    out["hour"] = df["hour"]
+    out["dayofweek"] = df["dayofweek"]
+    for col in SENSOR_COLUMNS:
+        out[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+    table = pa.Table.from_pandas(out.reset_index(drop=True), preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                           b"source": source.encode(), b"cache_version": CACHE_VERSION.encode()})
+    tmp = cache_path + ".tmp"
+    pq.write_table(table, tmp)
+    os.replace(tmp, cache_path)  # tidak ada cache setengah jadi jika proses terhenti
+    return out
+
+# -------------------------
+# API utama
+# -------------------------
+def find_raw(data_dir=DATA_DIR):
+    for name in RAW_FILES:
+        path = os.path.join(data_dir, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+def load_air_quality(data_dir=DATA_DIR, cache_file=None, refresh=False, columns=None):
+    """
+    Returns DataFrame: datetime, hour, dayofweek + kolom sensor (termasuk target CO(GT)).
+    columns: optional proyeksi kolom (hanya kolom ini yang dibaca dari cache).
+    """
+    cache_path = cache_file or os.path.join(data_dir, CACHE_FILE)
+    raw_path = find_raw(data_dir)
+    if not refresh and os.path.exists(cache_path):
+        meta = pq.read_schema(cache_path).metadata or {}
+        fresh = meta.get(b"cache_version", b"").decode() == CACHE_VERSION and (
+            raw_path is None or meta.get(b"source", b"").decode() == _signature(raw_path))
+        if fresh:
+            return pd.read_parquet(cache_path, columns=columns)
+
+    if raw_path is not None:
+        df, source = read_raw(raw_path), _signature(raw_path)
+    else:
+        try:
+            df, source = _fetch_ucirepo(), "ucimlrepo:360"
+        except ImportError:
+            message = f"Data Air Quality tidak ditemukan: letakkan salah satu dari {RAW_FILES} di {data_dir}"
+            raise FileNotFoundError(message) from None
+    out = _to_cache(df, cache_path, source)
+    return out[columns] if columns else out
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else DATA_DIR
+    t0 = time.perf_counter()
+    df = load_air_quality(data_dir)
+    t1 = time.perf_counter()
+    df = load_air_quality(data_dir)
+    t2 = time.perf_counter()
+    X, y = split_features(df)
+    print(f"{len(df)} baris, {X.shape[1]} fitur, target hilang: {int(y.isna().sum())}")
+    print(f"Load pertama {t1 - t0:.3f} s, dari cache {(t2 - t1) * 1000:.1f} ms")
+    print(df.head())
@@ -0,0 +1,264 @@
+# ==========================================================
+# Export model CO(GT) ke format native + loader ringan
+# ----------------------------------------------------------
+# - Pickle joblib (XGBRegressor + SimpleImputer) menarik object graph scikit-learn, terikat versi
+#   library yang sama persis, dan lambat saat cold start
+# - export_artifacts(): booster -> format native XGBoost (model.ubj biner + model.json),
+#   median imputer -> array float64 (imputer_medians.npy, urutan = kolom fitur),
+#   manifest.json: kolom fitur, target, penanda missing (-200), iteration_range, versi, sha256 file
+# - load_native(): rebuild predictor hanya dari artefak itu
+#     engine="numpy"  : pohon dari model.json dievaluasi dengan numpy (import: json + numpy saja;
+#                       `import xgboost` sendiri ikut memuat scikit-learn + pandas, ~2 detik)
+#     engine="xgboost": xgb.Booster.load_model(model.ubj) (cold start lambat, batch besar lebih cepat)
+#   pandas/AirQualityData hanya dimuat jika input berupa DataFrame mentah (hour/dayofweek)
+# - NativePredictor.predict_frame() kompatibel dengan MicroBatcher (AirQualityPredictor)
+# Usage: python AirQualityExport.py [folder_export]
+# ==========================================================
+
+import os
+import json
+import hashlib
+from datetime import datetime
+
+import numpy as np
+
+EXPORT_DIR = "airquality_model"
+MANIFEST_FILE = "manifest.json"
+MEDIANS_FILE = "imputer_medians.npy"
+FORMAT_VERSION = 1
+# objective dengan link identitas: prediksi = base_score + jumlah nilai daun
+IDENTITY_OBJECTIVES = ("reg:squarederror", "reg:absoluteerror", "reg:pseudohubererror", "reg:quantileerror")
+
+def _sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+# -------------------------
+# Export
+# -------------------------
+def export_artifacts(model, imputer, out_dir=EXPORT_DIR, formats=("ubj", "json")):
+    """
+    model: XGBRegressor terlatih (best_xgb), imputer: SimpleImputer(strategy="median") terlatih.
+    formats: format native booster yang ditulis (model.ubj, model.json). Returns manifest (dict).
+    """
+    import xgboost as xgb
+    from AirQualityData import FEATURE_COLUMNS, MISSING_VALUE, TARGET, TIME_FEATURES
+
+    if not formats or set(formats) - {"ubj", "json"}:
+        raise ValueError("formats hanya boleh berisi 'ubj' dan/atau 'json'")
+    if getattr(imputer, "strategy", None) != "median":
+        raise ValueError("Hanya SimpleImputer(strategy='median') yang bisa diekspor sebagai array median")
+    features = list(getattr(imputer, "feature_names_in_", FEATURE_COLUMNS))
+    if features != FEATURE_COLUMNS:
+        raise ValueError(f"Kolom imputer {features} tidak sama dengan FEATURE_COLUMNS {FEATURE_COLUMNS}")
+    medians = np.asarray(imputer.statistics_, dtype=np.float64)
+    if len(medians) != len(features) or np.isnan(medians).any():
+        # SimpleImputer membuang kolom yang seluruhnya kosong -> jumlah fitur tidak cocok dengan booster
+        raise ValueError("Imputer memiliki kolom tanpa median (kolom kosong saat training)")
+
+    booster = model.get_booster()
+    try:
+        iteration_range = [0, int(model.best_iteration) + 1]
+    except AttributeError:
+        iteration_range = [0, 0]
+
+    os.makedirs(out_dir, exist_ok=True)
+    files = {}
+    for fmt in formats:
+        files[fmt] = f"model.{fmt}"
+        booster.save_model(os.path.join(out_dir, files[fmt]))
+    np.save(os.path.join(out_dir, MEDIANS_FILE), medians)
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "xgboost_version": xgb.__version__,
+        "target": TARGET,
+        "features": features,
+        "time_features": TIME_FEATURES,
+        "missing_value": MISSING_VALUE,
+        "model": {"files": files, "objective": model.get_params()["objective"],
+                  "num_boosted_rounds": booster.num_boosted_rounds(), "iteration_range": iteration_range,
+                  "sha256": {fmt: _sha256(os.path.join(out_dir, f)) for fmt, f in files.items()}},
+        "imputer": {"strategy": "median", "file": MEDIANS_FILE, "dtype": "float64",
+                    "medians": dict(zip(features, medians.tolist())),
+                    "sha256": _sha256(os.path.join(out_dir, MEDIANS_FILE))},
+    }
+    with open(os.path.join(out_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+    return manifest
+
+def export_from_pickles(model_file="best_xgb_airquality_co.pkl", imputer_file="imputer.pkl",
+                        out_dir=EXPORT_DIR, formats=("ubj", "json")):
+    """Konversi sekali dari pickle joblib lama (butuh joblib + scikit-learn hanya di langkah ini)."""
+    import joblib
+    return export_artifacts(joblib.load(model_file), joblib.load(imputer_file), out_dir, formats)
+
+# -------------------------
+# Loader ringan
+# -------------------------
+class TreeEnsemble:
+    """
+    Evaluasi booster gbtree dari model.json dengan numpy (tanpa import xgboost).
+    Semua pohon digabung jadi array datar; semua baris x semua pohon ditelusuri bersamaan per level.
+    Aturan split sama dengan XGBoost: x < split_condition (float32) -> kiri, NaN -> default_left.
+    """
+    def __init__(self, json_file, iteration_range=(0, 0)):
+        with open(json_file, encoding="utf-8") as f:
+            learner = json.load(f)["learner"]
+        objective = learner["objective"]["name"]
+        booster = learner["gradient_booster"]
+        if objective not in IDENTITY_OBJECTIVES or booster["name"] != "gbtree":
+            raise ValueError(f"Engine numpy hanya untuk gbtree + {IDENTITY_OBJECTIVES}, bukan {objective!r}")
+        base = learner["learner_model_param"]["base_score"].strip("[]").split(",")
+        self.base_score = np.float32(float(base[0]))
+
+        trees = booster["model"]["trees"]
+        indptr = booster["model"]["iteration_indptr"]
+        start, end = iteration_range
+        if end > 0:  # (0, 0) = semua pohon
+            trees = trees[indptr[start]:indptr[end]]
+        if any(any(t.get("split_type", [])) for t in trees):
+            raise ValueError("Split kategorikal tidak didukung engine numpy")
+
+        sizes = [len(t["left_children"]) for t in trees]
+        self.roots = np.cumsum([0] + sizes[:-1]).astype(np.int64)
+        shift = np.repeat(self.roots, sizes)
+        left = np.concatenate([t["left_children"] for t in trees]).astype(np.int64)
+        right = np.concatenate([t["right_children"] for t in trees]).astype(np.int64)
+        self.is_leaf = left == -1
+        # anak -> indeks global; daun menunjuk dirinya sendiri (berhenti)
+        own = np.arange(len(left))
+        self.left = np.where(self.is_leaf, own, left + shift)
+        self.right = np.where(self.is_leaf, own, right + shift)
+        self.feature = np.concatenate([t["split_indices"] for t in trees]).astype(np.int64)
+        # untuk daun, split_conditions berisi nilai daun
+        self.value = np.concatenate([t["split_conditions"] for t in trees]).astype(np.float32)
+        self.default_left = np.concatenate([t["default_left"] for t in trees]).astype(bool)
+        self.depth = self._max_depth()
+
+    def _max_depth(self):
+        depth, node = 0, self.roots.copy()
+        while not self.is_leaf[node].all():
+            node = np.concatenate([self.left[node], self.right[node]])
+            node = np.unique(node)
+            depth += 1
+        return depth
+
+    def predict(self, X):
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(len(X))[:, None]
+        node = np.broadcast_to(self.roots, (len(X), len(self.roots))).copy()
+        for _ in range(self.depth):
+            x = X[rows, self.feature[node]]
+            go_left = np.where(np.isnan(x), self.default_left[node], x < self.value[node])
+            node = np.where(go_left, self.left[node], self.right[node])
+        return self.base_score + self.value[node].sum(axis=1, dtype=np.float32)
+
+
+class _XGBoostModel:
+    def __init__(self, model_file, iteration_range=(0, 0)):
+        import xgboost as xgb
+        self.booster = xgb.Booster()
+        self.booster.load_model(model_file)
+        self.iteration_range = tuple(iteration_range)
+
+    def predict(self, X):
+        return self.booster.inplace_predict(np.asarray(X, dtype=np.float32), iteration_range=self.iteration_range)
+
+
+class NativePredictor:
+    def __init__(self, export_dir=EXPORT_DIR, engine="numpy", verify=True):
+        """engine: "numpy" (model.json, tanpa import xgboost) atau "xgboost" (model.ubj / model.json)."""
+        with open(os.path.join(export_dir, MANIFEST_FILE), encoding="utf-8") as f:
+            self.manifest = manifest = json.load(f)
+        if manifest.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Versi manifest tidak didukung: {manifest.get('format_version')!r}")
+        files = manifest["model"]["files"]
+        fmt = "json" if engine == "numpy" else ("ubj" if "ubj" in files else "json")
+        if engine not in ("numpy", "xgboost") or fmt not in files:
+            raise ValueError(f"Engine {engine!r} butuh model.{fmt} di {export_dir}")
+        model_path = os.path.join(export_dir, files[fmt])
+        medians_path = os.path.join(export_dir, manifest["imputer"]["file"])
+        if verify:
+            for path, expected in ((model_path, manifest["model"]["sha256"][fmt]),
+                                   (medians_path, manifest["imputer"]["sha256"])):
+                if _sha256(path) != expected:
+                    raise ValueError(f"Checksum tidak cocok: {path}")
+
+        self.features = manifest["features"]
+        self.missing_value = manifest["missing_value"]
+        self.medians = np.load(medians_path)
+        if len(self.medians) != len(self.features):
+            raise ValueError("Jumlah median tidak sama dengan jumlah fitur di manifest")
+        iteration_range = manifest["model"]["iteration_range"]
+        if engine == "numpy":
+            self.model = TreeEnsemble(model_path, iteration_range)
+        else:
+            self.model = _XGBoostModel(model_path, iteration_range)
+
+    def predict_array(self, X):
+        """X: array (n, fitur) dengan urutan kolom manifest["features"]; -200 / NaN diimputasi median."""
+        X = np.array(X, dtype=np.float64)  # salinan, input pemanggil tidak diubah
+        if X.ndim != 2 or X.shape[1] != len(self.features):
+            raise ValueError(f"X harus berukuran (n, {len(self.features)})")
+        X[X == self.missing_value] = np.nan
+        rows, cols = np.nonzero(np.isnan(X))
+        X[rows, cols] = self.medians[cols]
+        return self.model.predict(X)
+
+    def predict_frame(self, df, date_format=None):
+        """DataFrame mentah (Date/Time atau datetime + kolom sensor), langkah fitur sama dengan training."""
+        from AirQualityData import add_time_features, split_features
+        if "hour" not in df:
+            df = add_time_features(df.copy(), date_format)
+        X, _ = split_features(df)
+        return self.predict_array(X[self.features].to_numpy())
+
+def load_native(export_dir=EXPORT_DIR, engine="numpy", verify=True):
+    return NativePredictor(export_dir, engine, verify)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    import subprocess
+
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else EXPORT_DIR
+    manifest = export_from_pickles(out_dir=out_dir)
+    print(f"Export -> {out_dir}/: " + ", ".join(
+        f"{f} ({os.path.getsize(os.path.join(out_dir, f)) / 1e3:.0f} KB)" for f in manifest["model"]["files"].values())
+        + f", {MEDIANS_FILE}, {MANIFEST_FILE}")
+
+    # hasil harus sama dengan jalur pickle (imputer.transform + XGBRegressor.predict)
+    from AirQualityData import load_air_quality
+    from AirQualityPredictor import AirQualityPredictor
+    df = load_air_quality()
+    reference = AirQualityPredictor().predict_frame(df)
+    for engine in ("numpy", "xgboost"):
+        predictor = load_native(out_dir, engine)
+        t0 = time.perf_counter()
+        pred = predictor.predict_frame(df)
+        t = time.perf_counter() - t0
+        print(f"engine={engine:8}: selisih maksimum vs pickle {np.abs(pred - reference).max():.1e}, "
+              f"{len(df)} baris {t * 1000:.0f} ms")
+
+    # cold start di proses baru (import + load + satu prediksi)
+    here = os.path.dirname(os.path.abspath(__file__))
+    row = predictor.medians.tolist()
+    scripts = {
+        "pickle (joblib + sklearn)": "from AirQualityPredictor import AirQualityPredictor as P; "
+                                     "import pandas as pd; p = P(); p.booster.inplace_predict("
+                                     f"p.imputer.transform(pd.DataFrame([{row}], columns=p.imputer.feature_names_in_)))",
+        "native, engine=xgboost": f"from AirQualityExport import load_native; "
+                                  f"load_native({out_dir!r}, 'xgboost').predict_array([{row}])",
+        "native, engine=numpy": f"from AirQualityExport import load_native; "
+                                f"load_native({out_dir!r}).predict_array([{row}])",
+    }
+    for name, code in scripts.items():
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-c", f"import sys; sys.path.insert(0, {here!r}); {code}"], check=True)
+        print(f"Cold start {name:26}: {time.perf_counter() - t0:.2f} s")
@@ -0,0 +1,251 @@
+# ==========================================================
+# Prediksi CO(GT) dari model tersimpan (best_xgb_airquality_co.pkl + imputer.pkl)
+# ----------------------------------------------------------
+# - Model & imputer dimuat SEKALI; preprocessing sama persis dengan training (XGBoot):
+#   split_features() (hour, dayofweek, -200 -> NaN) -> imputer median -> XGBoost
+# - Scoring file CSV (format UCI ';' desimal ',' atau CSV biasa) / Parquet per chunk:
+#   memori ~ satu chunk, hasil ditulis bertahap ke CSV / Parquet
+# - MicroBatcher: banyak request kecil (satu baris) dari banyak thread digabung jadi satu batch
+#   (max_batch baris atau max_wait detik) -> satu panggilan predict per batch
+# - Statistik: throughput (baris/detik) dan latency p50/p95/p99 per request
+# Usage: python AirQualityPredictor.py [file_input]
+# ==========================================================
+
+import time
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from AirQualityData import FEATURE_COLUMNS, add_time_features, split_features
+
+MODEL_FILE = "best_xgb_airquality_co.pkl"
+IMPUTER_FILE = "imputer.pkl"
+UCI_DATE_FORMAT = "%d/%m/%Y %H.%M.%S"
+
+# -------------------------
+# Latency
+# -------------------------
+class LatencyRecorder:
+    """Simpan latency terakhir (maxlen) + total baris & waktu untuk throughput."""
+    def __init__(self, maxlen=100_000):
+        self.latencies = deque(maxlen=maxlen)
+        self.rows = 0
+        self.busy = 0.0  # detik di dalam predict
+
+    def record(self, seconds):
+        self.latencies.append(seconds)
+
+    def summary(self):
+        if not self.latencies:
+            return {"requests": 0, "rows": self.rows}
+        p50, p95, p99 = np.percentile(np.fromiter(self.latencies, float), [50, 95, 99])
+        return {"requests": len(self.latencies), "rows": self.rows,
+                "rows_per_s": self.rows / self.busy if self.busy else float("nan"),
+                "p50_ms": float(p50) * 1000, "p95_ms": float(p95) * 1000, "p99_ms": float(p99) * 1000}
+
+# -------------------------
+# Predictor
+# -------------------------
+class AirQualityPredictor:
+    def __init__(self, model_file=MODEL_FILE, imputer_file=IMPUTER_FILE):
+        model = joblib.load(model_file)
+        self.imputer = joblib.load(imputer_file)
+        names = list(getattr(self.imputer, "feature_names_in_", FEATURE_COLUMNS))
+        if names != FEATURE_COLUMNS:
+            raise ValueError(f"Kolom imputer {names} tidak sama dengan FEATURE_COLUMNS {FEATURE_COLUMNS}")
+        self.booster = model.get_booster()
+        # sama dengan XGBRegressor.predict: pakai best_iteration jika model dilatih dengan early stopping
+        try:
+            self.iteration_range = (0, model.best_iteration + 1)
+        except AttributeError:
+            self.iteration_range = (0, 0)
+        self.stats = LatencyRecorder()
+
+    def transform(self, df, date_format=None):
+        """DataFrame mentah (Date/Time atau datetime + kolom sensor) -> matriks fitur float32 terimputasi."""
+        if "hour" not in df:
+            df = add_time_features(df.copy(), date_format)
+        X, _ = split_features(df)
+        return self.imputer.transform(X).astype(np.float32)
+
+    def predict_frame(self, df, date_format=None):
+        t0 = time.perf_counter()
+        X = self.transform(df, date_format)
+        pred = self.booster.inplace_predict(X, iteration_range=self.iteration_range)
+        elapsed = time.perf_counter() - t0
+        self.stats.record(elapsed)
+        self.stats.rows += len(pred)
+        self.stats.busy += elapsed
+        return pred
+
+    def iter_file(self, path, chunksize=50_000):
+        """Yield (chunk, prediksi) per chunk. Parquet dibaca per batch, CSV per chunk."""
+        if path.endswith(".parquet"):
+            import pyarrow.parquet as pq
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+                chunk = batch.to_pandas()
+                yield chunk, self.predict_frame(chunk)
+            return
+        with open(path, encoding="utf-8") as f:
+            header = f.readline()
+        uci = ";" in header  # file asli UCI: ';' + desimal ','
+        reader = pd.read_csv(path, sep=";" if uci else ",", decimal="," if uci else ".", chunksize=chunksize)
+        for chunk in reader:
+            if uci:
+                chunk = chunk.loc[:, ~chunk.columns.str.startswith("Unnamed")].dropna(subset=["Date"])
+            yield chunk, self.predict_frame(chunk, UCI_DATE_FORMAT if uci else None)
+
+    def predict_file(self, path, output=None, chunksize=50_000, keep_columns=("Date", "Time", "datetime")):
+        """
+        Score seluruh file per chunk; output (.csv / .parquet) ditulis bertahap (None = tidak disimpan).
+        Returns statistik {"rows", "seconds", "rows_per_s"}.
+        """
+        writer = None
+        rows = 0
+        t0 = time.perf_counter()
+        try:
+            for chunk, pred in self.iter_file(path, chunksize):
+                rows += len(pred)
+                if output is None:
+                    continue
+                out = pd.DataFrame({c: chunk[c].to_numpy() for c in keep_columns if c in chunk})
+                out["CO(GT)_pred"] = pred
+                if output.endswith(".parquet"):
+                    import pyarrow as pa
+                    import pyarrow.parquet as pq
+                    table = pa.Table.from_pandas(out, preserve_index=False)
+                    writer = writer or pq.ParquetWriter(output, table.schema)
+                    writer.write_table(table)
+                else:
+                    out.to_csv(output, mode="a" if writer else "w", header=not writer, index=False)
+                    writer = writer or True
+        finally:
+            if writer not in (None, True):
+                writer.close()
+        seconds = time.perf_counter() - t0
+        return {"rows": rows, "seconds": seconds, "rows_per_s": rows / seconds if seconds else float("nan")}
+
+# -------------------------
+# Micro-batching untuk request kecil
+# -------------------------
+class MicroBatcher:
+    def __init__(self, predictor, max_batch=64, max_wait=0.002):
+        """
+        max_batch: baris maksimum per panggilan predict
+        max_wait: detik maksimum request pertama menunggu batch terisi
+        """
+        self.predictor = predictor
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.requests = queue.Queue()
+        self.latency = LatencyRecorder()
+        self.batches = 0
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, record):
+        """record: dict satu baris (Date/Time atau datetime + kolom sensor). Returns Future -> prediksi."""
+        if self._closed:
+            raise RuntimeError("MicroBatcher sudah ditutup")
+        future = Future()
+        self.requests.put((time.perf_counter(), record, future))
+        return future
+
+    def predict(self, record, timeout=None):
+        return self.submit(record).result(timeout)
+
+    def _run(self):
+        while True:
+            item = self.requests.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.perf_counter() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = self.requests.get(timeout=remaining) if remaining > 0 else self.requests.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self.requests.put(None)  # proses batch ini dulu, lalu berhenti
+                    break
+                batch.append(item)
+            self._process(batch)
+
+    def _process(self, batch):
+        t0 = time.perf_counter()
+        try:
+            pred = self.predictor.predict_frame(pd.DataFrame([record for _, record, _ in batch]))
+        except Exception as exc:  # error diteruskan ke semua pemanggil di batch ini
+            for _, _, future in batch:
+                future.set_exception(exc)
+            return
+        now = time.perf_counter()
+        for (submitted, _, future), value in zip(batch, pred.tolist()):
+            future.set_result(value)
+            self.latency.record(now - submitted)
+        self.latency.rows += len(batch)
+        self.latency.busy += now - t0
+        self.batches += 1
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self.requests.put(None)
+            self._worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def stats(self):
+        summary = self.latency.summary()
+        summary["batches"] = self.batches
+        summary["mean_batch"] = self.latency.rows / self.batches if self.batches else 0.0
+        return summary
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+
+    from AirQualityData import find_raw, load_air_quality
+
+    predictor = AirQualityPredictor()
+    path = sys.argv[1] if len(sys.argv) > 1 else find_raw()
+
+    # 1) Scoring file per chunk
+    if path:
+        out = os.path.splitext(os.path.basename(path))[0] + "_pred.parquet"
+        stats = predictor.predict_file(path, out, chunksize=2_000)
+        print(f"{path}: {stats['rows']} baris dalam {stats['seconds']:.2f} s "
+              f"({stats['rows_per_s']:.0f} baris/s) -> {out}")
+
+    # 2) Request kecil: satu predict per request vs micro-batching
+    records = load_air_quality().drop(columns=["CO(GT)"]).head(2_000).to_dict("records")
+
+    t0 = time.perf_counter()
+    single = [predictor.predict_frame(pd.DataFrame([r]))[0] for r in records]
+    t_single = time.perf_counter() - t0
+    print(f"\nTanpa batching : {len(records) / t_single:8.0f} request/s")
+
+    with MicroBatcher(predictor, max_batch=64, max_wait=0.002) as batcher:
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(32) as pool:
+            batched = list(pool.map(batcher.predict, records))
+        t_batch = time.perf_counter() - t0
+        s = batcher.stats()
+    assert np.allclose(single, batched)
+    print(f"Micro-batching : {len(records) / t_batch:8.0f} request/s, {s['batches']} batch "
+          f"(rata-rata {s['mean_batch']:.1f} baris), latency p50 {s['p50_ms']:.2f} ms, "
+          f"p95 {s['p95_ms']:.2f} ms, p99 {s['p99_ms']:.2f} ms")
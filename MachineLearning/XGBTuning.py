@@ -0,0 +1,173 @@
+# ==========================================================
+# Tuning XGBoost: Successive Halving + Early Stopping
+# ----------------------------------------------------------
+# - Pengganti RandomizedSearchCV di XGBoot (50 konfigurasi x 3 fold, semuanya dilatih penuh
+#   sampai 500 pohon / depth 12 walaupun jelas buruk setelah puluhan pohon)
+# - Resource = jumlah pohon (n_estimators):
+#     rung 0: semua kandidat dilatih min_resource pohon, rung berikutnya hanya 1/eta terbaik
+#     dengan pohon x eta, sampai max_resource
+# - Setiap trial (konfigurasi x fold) memakai early_stopping_rounds pada fold validasi;
+#   booster rung sebelumnya dipotong sampai pohon terbaiknya lalu dilanjutkan (xgb_model),
+#   bukan dilatih ulang dari nol; skor & pohon terbaik per fold dibawa antar rung dan hanya
+#   diganti jika rung baru lebih baik; fold yang sudah berhenti (early stop / tidak membaik)
+#   tidak dilatih lagi
+# - Biaya per trial dicatat: pohon yang dibangun, waktu fit, skor R2 validasi
+# - Atribut mirip RandomizedSearchCV: best_params_, best_score_, best_estimator_, cv_results_
+# Usage: python XGBTuning.py [folder_data]
+# ==========================================================
+
+import time
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+from sklearn.model_selection import KFold, ParameterSampler
+from xgboost import XGBRegressor
+
+class SuccessiveHalvingSearch:
+    def __init__(self, param_distributions, n_candidates=50, min_resource=30, max_resource=None, eta=3,
+                 cv=3, early_stopping_rounds=20, random_state=42, verbose=1, **model_params):
+        """
+        param_distributions: sama dengan param_dist RandomizedSearchCV; "n_estimators" dipakai
+            sebagai batas resource (max_resource = nilai terbesar) dan tidak di-sample
+        n_candidates: jumlah konfigurasi awal (setara n_iter)
+        model_params: parameter tetap XGBRegressor (objective, random_state, ...)
+        """
+        self.param_distributions = dict(param_distributions)
+        n_estimators = self.param_distributions.pop("n_estimators", None)
+        self.max_resource = max_resource or (max(n_estimators) if n_estimators is not None else 500)
+        self.n_candidates = n_candidates
+        self.min_resource = min_resource
+        self.eta = eta
+        self.cv = cv
+        self.early_stopping_rounds = early_stopping_rounds
+        self.random_state = random_state
+        self.verbose = verbose
+        self.model_params = {"random_state": random_state, **model_params}
+
+    def _resources(self):
+        resources, r = [], self.min_resource
+        while r < self.max_resource:
+            resources.append(r)
+            r *= self.eta
+        return resources + [self.max_resource]
+
+    def _fit_trial(self, params, dtrain, dval, rounds, booster):
+        """Returns booster, (pohon terbaik, RMSE terbaik) dari rung ini, waktu fit."""
+        t0 = time.perf_counter()
+        booster = xgb.train({**self.model_params, **params, "eval_metric": "rmse"}, dtrain, rounds,
+                            evals=[(dval, "val")], early_stopping_rounds=self.early_stopping_rounds,
+                            verbose_eval=False, xgb_model=booster)
+        seconds = time.perf_counter() - t0
+        # best_iteration absolut (termasuk pohon lanjutan), tapi tracker early stopping mulai
+        # dari nol setiap xgb.train -> dibandingkan dengan terbaik rung sebelumnya di fit()
+        return booster, booster.best_iteration + 1, booster.best_score, seconds
+
+    def fit(self, X, y):
+        X, y = pd.DataFrame(X), np.asarray(y, dtype=float)
+        # DMatrix per fold dibangun sekali, dipakai ulang oleh semua trial
+        folds = [(xgb.DMatrix(X.iloc[tr], y[tr]), xgb.DMatrix(X.iloc[val], y[val]), float(np.var(y[val])))
+                 for tr, val in KFold(self.cv).split(X)]
+        candidates = list(ParameterSampler(self.param_distributions, self.n_candidates,
+                                           random_state=self.random_state))
+        # state per kandidat & fold: booster, pohon terbaik + RMSE-nya (dibawa antar rung),
+        # total pohon yang pernah dibangun (biaya), skor R2, sudah konvergen?
+        state = [{"boosters": [None] * self.cv, "trees": [0] * self.cv, "rmse": [np.inf] * self.cv,
+                  "built": [0] * self.cv, "scores": [np.nan] * self.cv, "converged": [False] * self.cv}
+                 for _ in candidates]
+        trials = []
+        alive = list(range(len(candidates)))
+        t_start = time.perf_counter()
+
+        resources = self._resources()
+        for rung, resource in enumerate(resources):
+            for c in alive:
+                st = state[c]
+                for f, (dtrain, dval, val_var) in enumerate(folds):
+                    if st["converged"][f] or st["trees"][f] >= resource:
+                        continue
+                    # lanjutkan dari pohon terbaik, pohon sesudahnya (sudah lewat best) dibuang
+                    booster = st["boosters"][f]
+                    if booster is not None:
+                        booster = booster[:st["trees"][f]]
+                    rounds = resource - st["trees"][f]
+                    booster, best, rmse, seconds = self._fit_trial(
+                        candidates[c], dtrain, dval, rounds, booster)
+                    added = booster.num_boosted_rounds() - st["trees"][f]
+                    improved = rmse < st["rmse"][f]
+                    # early stopping berhenti, atau rung ini tidak memperbaiki yang terbaik -> selesai
+                    st["converged"][f] = added < rounds or not improved
+                    st["built"][f] += added
+                    if improved:
+                        st["boosters"][f], st["trees"][f], st["rmse"][f] = booster, best, rmse
+                    # R2 validasi dari RMSE terbaik (tanpa predict ulang): 1 - MSE / Var(y_val)
+                    st["scores"][f] = 1.0 - st["rmse"][f] ** 2 / val_var
+                    trials.append({"candidate": c, "rung": rung, "fold": f, "resource": resource,
+                                   "trees_built": st["built"][f], "best_trees": st["trees"][f],
+                                   "fit_seconds": seconds, "r2": st["scores"][f],
+                                   "early_stopped": st["converged"][f], **candidates[c]})
+            ranked = sorted(alive, key=lambda c: np.mean(state[c]["scores"]), reverse=True)
+            if self.verbose:
+                print(f"Rung {rung}: {len(alive)} kandidat x {resource} pohon, "
+                      f"terbaik R2={np.mean(state[ranked[0]]['scores']):.4f}")
+            if rung < len(resources) - 1:
+                alive = ranked[:max(1, len(alive) // self.eta)]
+        self.search_seconds_ = time.perf_counter() - t_start
+
+        best = ranked[0]
+        self.best_index_ = best
+        self.best_score_ = float(np.mean(state[best]["scores"]))
+        # jumlah pohon final = rata-rata best_iteration antar fold
+        n_estimators = int(round(np.mean(state[best]["trees"])))
+        self.best_params_ = {**candidates[best], "n_estimators": max(n_estimators, 1)}
+        self.cv_results_ = pd.DataFrame(trials)
+        self.trees_built_ = int(sum(sum(st["built"]) for st in state))
+
+        t0 = time.perf_counter()
+        self.best_estimator_ = XGBRegressor(**self.model_params, **self.best_params_)
+        self.best_estimator_.fit(X, y)
+        self.refit_time_ = time.perf_counter() - t0
+        return self
+
+
+if __name__ == "__main__":
+    import sys
+
+    from sklearn.impute import SimpleImputer
+    from sklearn.metrics import r2_score
+    from sklearn.model_selection import RandomizedSearchCV, train_test_split
+
+    from AirQualityData import DATA_DIR, load_air_quality, split_features
+
+    X, y = split_features(load_air_quality(sys.argv[1] if len(sys.argv) > 1 else DATA_DIR))
+    X = pd.DataFrame(SimpleImputer(strategy="median").fit_transform(X), columns=X.columns, index=X.index)
+    mask = y.notna()
+    X_train, X_test, y_train, y_test = train_test_split(
+        X.loc[mask].reset_index(drop=True), y.loc[mask].reset_index(drop=True), test_size=0.2, random_state=42)
+
+    param_dist = {
+        "n_estimators": [100, 200, 300, 500],
+        "max_depth": [3, 5, 7, 9, 12],
+        "learning_rate": [0.01, 0.05, 0.1, 0.2],
+        "subsample": [0.6, 0.8, 1.0],
+        "colsample_bytree": [0.6, 0.8, 1.0],
+        "min_child_weight": [1, 3, 5, 7],
+        "gamma": [0, 0.1, 0.3, 0.5],
+        "reg_alpha": [0, 0.01, 0.1, 1],
+        "reg_lambda": [0.5, 1, 2, 5]
+    }
+    model_params = {"objective": "reg:squarederror", "random_state": 42, "verbosity": 0}
+
+    search = SuccessiveHalvingSearch(param_dist, n_candidates=50, **model_params).fit(X_train, y_train)
+    r2_sh = r2_score(y_test, search.best_estimator_.predict(X_test))
+    print(f"Successive halving: {search.search_seconds_:.1f} s + refit {search.refit_time_:.1f} s, "
+          f"{len(search.cv_results_)} trial, {search.trees_built_} pohon, CV R2={search.best_score_:.4f}, "
+          f"test R2={r2_sh:.4f}")
+    print("Best Parameters:", search.best_params_)
+
+    t0 = time.perf_counter()
+    random_search = RandomizedSearchCV(XGBRegressor(**model_params), param_dist, n_iter=50, scoring="r2",
+                                       cv=3, n_jobs=-1, random_state=42).fit(X_train, y_train)
+    t_rs = time.perf_counter() - t0
+    r2_rs = r2_score(y_test, random_search.best_estimator_.predict(X_test))
+    print(f"RandomizedSearchCV: {t_rs:.1f} s, CV R2={random_search.best_score_:.4f}, test R2={r2_rs:.4f}")
@@ -0,0 +1,348 @@
+# benchmark_learners.py
+# Benchmark sample-efficiency untuk learning agent single-agent (3 ruangan)
+# - LearningAgent.py, LearningAgentWithCritic.py, LearningAgentWithCriticdanEpsilon.py
+#   (+ PrioritizedSweepingAgent) dijalankan pada konfigurasi ruangan yang sama (seeded), output dibungkam
+# - Diukur: episode & langkah environment sampai greedy policy = policy optimal (value iteration
+#   atas model reward masing-masing learner) atau sampai reward rata-rata >= threshold,
+#   waktu per 10k langkah, ukuran tabel, tingkat keberhasilan greedy policy, variasi antar seed
+# Usage: python BenchmarkLearners.py
+
+import os
+import random
+import statistics
+import time
+import itertools
+import contextlib
+
+import LearningAgent as critic_module
+import LearningAgentWithCritic as critic_table_module
+import LearningAgentWithCriticdanEpsilon as epsilon_module
+from QTableInstrumentation import deep_sizeof
+
+ROOMS = ["room-A", "room-B", "room-C"]
+ACTIONS = ["clean", "move"]
+
+# -------------------------
+# Konfigurasi ruangan (sama untuk semua learner)
+# -------------------------
+def make_configs(n, seed):
+    rng = random.Random(seed)
+    return [(tuple(rng.choice(["dirty", "clean"]) for _ in ROOMS), rng.choice(ROOMS)) for _ in range(n)]
+
+def all_full_states():
+    return [(st, loc) for st in itertools.product(["dirty", "clean"], repeat=len(ROOMS)) for loc in ROOMS]
+
+def is_terminal(full_state):
+    return all(s == "clean" for s in full_state[0])
+
+def _with(statuses, room, value):
+    return tuple(value if r == room else s for r, s in zip(ROOMS, statuses))
+
+# -------------------------
+# Adapter per learner
+# Setiap adapter: reset(config), step() (pilih aksi + act + learn), act(action) (tanpa learn),
+# observe(), greedy(full_state), dynamics(full_state, action) -> [(p, reward, next_full_state)], table()
+# -------------------------
+class CriticAdapter:
+    """LearningAgent.py: Q(s, a) <- Q + 0.5 (r - Q), state = (lokasi, kondisi ruangan sekarang)."""
+    name = "LearningAgent (critic)"
+    gamma = 0.0  # tidak ada bootstrap -> policy optimalnya greedy terhadap reward langsung
+
+    def __init__(self):
+        self.agent = critic_module.LearningAgent(ROOMS[0], [[r, "clean"] for r in ROOMS])
+
+    def reset(self, config):
+        statuses, loc = config
+        self.agent.environment = [[r, s] for r, s in zip(ROOMS, statuses)]
+        self.agent.location = loc
+        self.agent.model = {r: s for r, s in zip(ROOMS, statuses)}
+
+    def done(self):
+        return all(r[1] == "clean" for r in self.agent.environment)
+
+    def act(self, action):
+        ag = self.agent
+        perception = ag.perceive()
+        ag.update_model(perception)
+        if action == "clean":
+            ag.clean(perception)
+        else:
+            ag.move()
+        return ag.critic(action, perception), perception
+
+    def step(self):
+        ag = self.agent
+        perception = ag.perceive()
+        state = (ag.location, perception[1])
+        action = ag.choose_action(perception)
+        reward, _ = self.act(action)
+        ag.learn(state, action, reward)
+        return reward, self.done()
+
+    def greedy(self, full_state):
+        statuses, loc = full_state
+        q = self.agent.q_values.get((loc, dict(zip(ROOMS, statuses))[loc]), {})
+        return _unique_best({a: q[a] for a in q})
+
+    def dynamics(self, full_state, action):
+        # Catatan: critic dipanggil SETELAH clean dengan list perception yang sama,
+        # sehingga clean selalu bernilai -5 (perilaku kode apa adanya).
+        statuses, loc = full_state
+        if action == "clean":
+            return [(1.0, -5, (_with(statuses, loc, "clean"), loc))]
+        reward = 1 if "dirty" in statuses else -2
+        others = [r for r in ROOMS if r != loc]
+        return [(1 / len(others), reward, (statuses, r)) for r in others]
+
+    def table(self):
+        return self.agent.q_values
+
+    def observe(self):
+        """(kondisi semua ruangan, lokasi) dari environment yang sedang berjalan."""
+        return tuple(s for _, s in self.agent.environment), self.agent.location
+
+    def end_episode(self):
+        pass
+
+
+class CriticTableAdapter(CriticAdapter):
+    """LearningAgentWithCritic.py: Q-learning, epsilon tetap, state = (lokasi, semua ruangan)."""
+    name = "LearningAgentWithCritic"
+    gamma = 0.8
+
+    def __init__(self):
+        self.agent = critic_table_module.LearningAgent(ROOMS[0], [[r, "clean"] for r in ROOMS])
+
+    def reset(self, config):
+        statuses, loc = config
+        self.agent.environment = [[r, s] for r, s in zip(ROOMS, statuses)]
+        self.agent.location = loc
+
+    def act(self, action):
+        perception = self.agent.perceive()
+        return self.agent.act(action, perception), perception
+
+    def step(self):
+        ag = self.agent
+        state = ag.get_state()
+        action = ag.choose_action(state)
+        reward, _ = self.act(action)
+        ag.learn(state, action, reward, ag.get_state())
+        return reward, self.done()
+
+    def greedy(self, full_state):
+        statuses, loc = full_state
+        state = (loc, tuple(zip(ROOMS, statuses)))
+        return _unique_best({a: self.agent.q_table.get((state, a), 0) for a in ACTIONS})
+
+    def dynamics(self, full_state, action):
+        # sama seperti CriticAdapter: clean selalu -5 karena urutan act -> critic
+        statuses, loc = full_state
+        if action == "clean":
+            return [(1.0, -5, (_with(statuses, loc, "clean"), loc))]
+        reward = 3 if "dirty" in statuses else -10
+        others = [r for r in ROOMS if r != loc]
+        return [(1 / len(others), reward, (statuses, r)) for r in others]
+
+    def table(self):
+        return self.agent.q_table
+
+
+class EpsilonAdapter:
+    """LearningAgentWithCriticdanEpsilon.py: Q-learning + epsilon decay + Environment sendiri."""
+    name = "LearningAgentWithCriticdanEpsilon"
+    gamma = 0.9
+    agent_cls = epsilon_module.LearningAgent
+
+    def __init__(self):
+        self.agent = self.agent_cls(ACTIONS, qtable_file="qtable_benchmark.pkl")
+        self.agent.q_table = {}  # selalu mulai dari nol walaupun file Q-table ada
+        self.env = epsilon_module.Environment()
+
+    def reset(self, config):
+        statuses, loc = config
+        self.env.environment = [[r, s] for r, s in zip(ROOMS, statuses)]
+        self.env.location = loc
+        self.state = self.env.get_state()
+
+    def done(self):
+        return all(r[1] == "clean" for r in self.env.environment)
+
+    def act(self, action):
+        self.state, reward, _ = self.env.step(action)
+        return reward, None
+
+    def step(self):
+        state = self.state
+        action = self.agent.choose_action(state)
+        next_state, reward, done = self.env.step(action)
+        self.agent.update_q(state, action, reward, next_state)
+        self.state = next_state
+        return reward, done
+
+    def greedy(self, full_state):
+        statuses, loc = full_state
+        state = (tuple(zip(ROOMS, statuses)), loc)
+        return _unique_best({a: self.agent.q_table.get((state, a), 0) for a in ACTIONS})
+
+    def dynamics(self, full_state, action):
+        statuses, loc = full_state
+        if action == "clean":
+            if dict(zip(ROOMS, statuses))[loc] == "dirty":
+                return [(1.0, 10, (_with(statuses, loc, "clean"), loc))]
+            return [(1.0, -2, full_state)]
+        dirty = [r for r, s in zip(ROOMS, statuses) if s == "dirty"]
+        if not dirty:
+            return [(1.0, -10, full_state)]
+        return [(1 / len(dirty), 5, (statuses, r)) for r in dirty]
+
+    def table(self):
+        return self.agent.q_table
+
+    def observe(self):
+        return tuple(s for _, s in self.env.environment), self.env.location
+
+    def end_episode(self):
+        self.agent.decay_epsilon()
+
+
+class PrioritizedSweepingAdapter(EpsilonAdapter):
+    name = "PrioritizedSweepingAgent"
+    agent_cls = epsilon_module.PrioritizedSweepingAgent
+
+
+LEARNERS = [CriticAdapter, CriticTableAdapter, EpsilonAdapter, PrioritizedSweepingAdapter]
+
+def _unique_best(qvals):
+    if not qvals:
+        return None
+    best = max(qvals.values())
+    winners = [a for a, q in qvals.items() if q == best]
+    return winners[0] if len(winners) == 1 else None
+
+# -------------------------
+# Policy optimal (value iteration atas model reward learner)
+# -------------------------
+def optimal_actions(adapter, iterations=500, tol=1e-9):
+    states = [s for s in all_full_states() if not is_terminal(s)]
+    q = {(s, a): 0.0 for s in states for a in ACTIONS}
+    value = lambda s: 0.0 if is_terminal(s) else max(q[(s, a)] for a in ACTIONS)
+    for _ in range(iterations):
+        delta = 0.0
+        for s in states:
+            for a in ACTIONS:
+                new = sum(p * (r + adapter.gamma * value(s2)) for p, r, s2 in adapter.dynamics(s, a))
+                delta = max(delta, abs(new - q[(s, a)]))
+                q[(s, a)] = new
+        if delta < tol:
+            break
+    best = {}
+    for s in states:
+        top = max(q[(s, a)] for a in ACTIONS)
+        best[s] = {a for a in ACTIONS if abs(q[(s, a)] - top) < 1e-6}
+    return best
+
+def policy_matches(adapter, optimal):
+    return all(adapter.greedy(s) in acts for s, acts in optimal.items())
+
+def greedy_success(adapter, configs, max_steps=20):
+    """Persentase konfigurasi yang berhasil dibersihkan seluruhnya oleh greedy policy (tanpa learning)."""
+    success = 0
+    for config in configs:
+        if is_terminal(config):
+            success += 1
+            continue
+        adapter.reset(config)
+        for _ in range(max_steps):
+            action = adapter.greedy(adapter.observe()) or random.choice(ACTIONS)
+            adapter.act(action)
+            if adapter.done():
+                success += 1
+                break
+    return success / len(configs)
+
+# -------------------------
+# Benchmark
+# -------------------------
+def run_learner(adapter_cls, seed, max_episodes=1000, max_steps=20, reward_threshold=None, window=20):
+    random.seed(seed)
+    configs = make_configs(max_episodes, seed)
+    adapter = adapter_cls()
+    optimal = optimal_actions(adapter)
+
+    episodes_to_optimal = steps_to_optimal = episodes_to_threshold = None
+    total_steps = 0
+    step_time = 0.0
+    recent = []
+    for ep, config in enumerate(configs, start=1):
+        adapter.reset(config)
+        total = 0
+        t0 = time.perf_counter()
+        for _ in range(max_steps):
+            if adapter.done():
+                break
+            reward, done = adapter.step()
+            total += reward
+            total_steps += 1
+            if done:
+                break
+        step_time += time.perf_counter() - t0
+        adapter.end_episode()
+
+        recent = (recent + [total])[-window:]
+        if (reward_threshold is not None and episodes_to_threshold is None
+                and len(recent) == window and sum(recent) / window >= reward_threshold):
+            episodes_to_threshold = ep
+        if episodes_to_optimal is None and policy_matches(adapter, optimal):
+            episodes_to_optimal, steps_to_optimal = ep, total_steps
+        if episodes_to_optimal is not None and (reward_threshold is None or episodes_to_threshold is not None):
+            break
+
+    table = adapter.table()
+    return {
+        "episodes_to_optimal": episodes_to_optimal,
+        "steps_to_optimal": steps_to_optimal,
+        "episodes_to_threshold": episodes_to_threshold,
+        "sec_per_10k_steps": step_time / total_steps * 10_000 if total_steps else 0.0,
+        "table_entries": len(table),
+        "table_bytes": deep_sizeof(table),
+        "greedy_success": greedy_success(adapter, make_configs(50, seed + 10_000), max_steps),
+    }
+
+def _fmt(values, digits=1):
+    values = [v for v in values if v is not None]
+    if not values:
+        return "-"
+    if len(values) == 1:
+        return f"{values[0]:.{digits}f}"
+    return f"{statistics.mean(values):.{digits}f}±{statistics.stdev(values):.{digits}f}"
+
+def benchmark(seeds=range(5), max_episodes=1000, max_steps=20, reward_thresholds=None, learners=LEARNERS):
+    reward_thresholds = reward_thresholds or {}
+    results = {}
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for cls in learners:
+            results[cls.name] = [run_learner(cls, seed, max_episodes, max_steps,
+                                             reward_thresholds.get(cls.name)) for seed in seeds]
+    print_table(results, max_episodes)
+    return results
+
+def print_table(results, max_episodes):
+    header = (f"{'Learner':34} {'ep->optimal':>14} {'steps->optimal':>16} {'ep->threshold':>14} "
+              f"{'gagal':>6} {'s/10k langkah':>14} {'entri':>7} {'KB':>7} {'greedy sukses':>14}")
+    print(header)
+    print("-" * len(header))
+    for name, runs in results.items():
+        failed = sum(1 for r in runs if r["episodes_to_optimal"] is None)
+        print(f"{name:34} {_fmt([r['episodes_to_optimal'] for r in runs]):>14} "
+              f"{_fmt([r['steps_to_optimal'] for r in runs], 0):>16} "
+              f"{_fmt([r['episodes_to_threshold'] for r in runs]):>14} "
+              f"{failed:>6} {_fmt([r['sec_per_10k_steps'] for r in runs], 3):>14} "
+              f"{_fmt([r['table_entries'] for r in runs], 0):>7} "
+              f"{_fmt([r['table_bytes'] / 1024 for r in runs]):>7} "
+              f"{_fmt([r['greedy_success'] * 100 for r in runs], 0) + '%':>14}")
+    print(f"(gagal = seed yang tidak mencapai policy optimal dalam {max_episodes} episode)")
+
+
+if __name__ == "__main__":
+    benchmark(seeds=range(5), max_episodes=1000)
@@ -0,0 +1,184 @@
+# bounded_q_table.py
+# Q-table dengan batas memori untuk MASAgent, LearningAgent (LearningAgentWithCriticdanEpsilon.py)
+# dan QLearningAgent (MASQLearningShare&Com.py)
+# - Jumlah entri maksimum bisa diatur, entri dibuang (evict) saat penuh:
+#     policy="lru" -> paling lama tidak dipakai, policy="lfu" -> jumlah kunjungan paling sedikit
+# - Entri yang nilainya jauh dari default (sudah "belajar sesuatu") dilindungi dari eviction
+# - Counter: hits, default_hits (lookup yang jatuh ke nilai default), inserts, evictions
+
+import heapq
+import itertools
+from collections import OrderedDict, defaultdict
+from collections.abc import MutableMapping
+
+class BoundedQTable(MutableMapping):
+    def __init__(self, max_entries=100_000, policy="lru", default=0, protect_threshold=None,
+                 default_factory=None, scan_limit=32):
+        """
+        max_entries: jumlah entri maksimum
+        policy: "lru" atau "lfu"
+        default: nilai Q default (0 pada semua agent di repo ini)
+        protect_threshold: entri dengan |nilai - default| > threshold tidak di-evict (None = tanpa proteksi)
+        default_factory: seperti defaultdict, untuk Q-table berbentuk state -> {action: value}
+        scan_limit: maksimum kandidat terlindungi yang dilewati sebelum tetap melakukan eviction
+        """
+        if policy not in ("lru", "lfu"):
+            raise ValueError("policy harus 'lru' atau 'lfu'")
+        if max_entries < 1:
+            raise ValueError(f"max_entries minimal 1, bukan {max_entries}")
+        self.max_entries = max_entries
+        self.policy = policy
+        self.default = default
+        self.protect_threshold = protect_threshold
+        self.default_factory = default_factory
+        self.scan_limit = scan_limit
+        self._data = OrderedDict()
+        self._visits = {}
+        self._heap = []  # (visits, seq, key) untuk lfu, entri basi dibuang secara lazy
+        self._seq = itertools.count()
+        self.hits = 0
+        self.default_hits = 0
+        self.inserts = 0
+        self.evictions = 0
+        self.protected_skips = 0
+
+    # -------------------------
+    # Mapping API
+    # -------------------------
+    def get(self, key, default=None):
+        if key in self._data:
+            self.hits += 1
+            self._touch(key)
+            return self._data[key]
+        self.default_hits += 1
+        return default
+
+    def __getitem__(self, key):
+        if key in self._data:
+            self.hits += 1
+            self._touch(key)
+            return self._data[key]
+        self.default_hits += 1
+        if self.default_factory is None:
+            raise KeyError(key)
+        value = self.default_factory()
+        self[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        if key not in self._data:
+            self.inserts += 1
+            self._visits[key] = 0
+            while len(self._data) >= self.max_entries:
+                self._evict()
+        self._data[key] = value
+        self._touch(key)
+
+    def __delitem__(self, key):
+        del self._data[key]
+        del self._visits[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def to_dict(self):
+        return dict(self._data)
+
+    def stats(self):
+        return {"entries": len(self._data), "max_entries": self.max_entries, "hits": self.hits,
+                "default_hits": self.default_hits, "inserts": self.inserts,
+                "evictions": self.evictions, "protected_skips": self.protected_skips}
+
+    # -------------------------
+    # Eviction
+    # -------------------------
+    def _touch(self, key):
+        self._visits[key] += 1
+        if self.policy == "lru":
+            self._data.move_to_end(key)
+        else:
+            heapq.heappush(self._heap, (self._visits[key], next(self._seq), key))
+            if len(self._heap) > 4 * len(self._data) + 64:
+                self._heap = [(v, next(self._seq), k) for k, v in self._visits.items()]
+                heapq.heapify(self._heap)
+
+    def _is_protected(self, value):
+        if self.protect_threshold is None:
+            return False
+        if isinstance(value, dict):
+            return any(abs(v - self.default) > self.protect_threshold for v in value.values())
+        return abs(value - self.default) > self.protect_threshold
+
+    def _candidates(self):
+        # kandidat eviction dari yang paling "dingin"
+        if self.policy == "lru":
+            yield from list(itertools.islice(self._data, self.scan_limit + 1))
+            return
+        while self._heap:
+            visits, _, key = heapq.heappop(self._heap)
+            if key in self._data and self._visits[key] == visits:
+                yield key
+
+    def _evict(self):
+        first = None
+        skipped = []
+        victim = None
+        for key in self._candidates():
+            if first is None:
+                first = key
+            if not self._is_protected(self._data[key]) or len(skipped) >= self.scan_limit:
+                victim = key
+                break
+            skipped.append(key)
+            self.protected_skips += 1
+        if victim is None:
+            victim = first
+        # kandidat terlindungi dikembalikan sebagai entri "hangat"
+        for key in skipped:
+            if key == victim:
+                continue
+            if self.policy == "lru":
+                self._data.move_to_end(key)
+            else:
+                heapq.heappush(self._heap, (self._visits[key], next(self._seq), key))
+        del self._data[victim]
+        del self._visits[victim]
+        self.evictions += 1
+
+
+def bound_q_table(agent, max_entries=100_000, policy="lru", protect_threshold=None):
+    """Ganti agent.q_table (dict / defaultdict) dengan BoundedQTable, entri lama ikut disalin."""
+    old = agent.q_table
+    factory = old.default_factory if isinstance(old, defaultdict) else None
+    table = BoundedQTable(max_entries=max_entries, policy=policy,
+                          protect_threshold=protect_threshold, default_factory=factory)
+    for key, value in old.items():
+        table[key] = value
+    agent.q_table = table
+    return table
+
+
+if __name__ == "__main__":
+    import random
+    import LearningAgentWithCriticdanEpsilon as single
+
+    agent = single.LearningAgent(["clean", "move"], qtable_file="qtable_bounded_demo.pkl")
+    table = bound_q_table(agent, max_entries=20, policy="lfu", protect_threshold=1.0)
+    env = single.Environment()
+    for ep in range(200):
+        state = env.reset()
+        for step in range(20):
+            action = agent.choose_action(state)
+            next_state, reward, done = env.step(action)
+            agent.update_q(state, action, reward, next_state)
+            state = next_state
+            if done:
+                break
+        agent.decay_epsilon()
+    print(table.stats())
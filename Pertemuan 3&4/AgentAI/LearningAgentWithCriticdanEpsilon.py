@@ -4,6 +4,8 @@
 import random
 import pickle
 import os
+import heapq
+import itertools
 import matplotlib.pyplot as plt
 
 class LearningAgent:
@@ -53,6 +55,70 @@ class LearningAgent:
             self.q_table = pickle.load(f)
         print(f"📂 Q-table dimuat dari {self.qtable_file} (size: {len(self.q_table)})")
 
+# ----- Prioritized Sweeping (Dyna) -----
+class PrioritizedSweepingAgent(LearningAgent):
+    """
+    LearningAgent + model tabular (state, action) -> (reward rata-rata, distribusi next_state).
+    Setelah setiap langkah nyata, sampai `planning_steps` update simulasi dijalankan dari
+    priority queue (prioritas = Bellman error), dan perubahan nilai dirambatkan ke predecessor.
+    Cocok ketika langkah di environment nyata adalah bagian yang mahal.
+    """
+    def __init__(self, actions, planning_steps=20, theta=1e-3, **kwargs):
+        super().__init__(actions, **kwargs)
+        self.planning_steps = planning_steps
+        self.theta = theta            # prioritas minimum agar masuk queue
+        self.model = {}               # (state, action) -> [count, reward_sum, {next_state: count}]
+        self.predecessors = {}        # next_state -> set((state, action))
+        self.pqueue = []              # heap (-prioritas, seq, (state, action)), entri basi dibuang saat pop
+        self.queued = {}              # (state, action) -> prioritas terbaru di heap
+        self._seq = itertools.count()
+        self.planning_updates = 0
+
+    def expected_target(self, state, action):
+        count, reward_sum, next_counts = self.model[(state, action)]
+        future = sum(n * max(self.q_table.get((s2, a), 0) for a in self.actions)
+                     for s2, n in next_counts.items()) / count
+        return reward_sum / count + self.gamma * future
+
+    def _push(self, state, action):
+        priority = abs(self.expected_target(state, action) - self.q_table.get((state, action), 0))
+        # satu pasangan hanya masuk lagi jika prioritasnya naik -> ukuran heap mengikuti jumlah pasangan
+        if priority > self.theta and priority > self.queued.get((state, action), 0):
+            self.queued[(state, action)] = priority
+            heapq.heappush(self.pqueue, (-priority, next(self._seq), (state, action)))
+            if len(self.pqueue) > 2 * len(self.queued) + 16:
+                # terlalu banyak entri basi -> bangun ulang heap dari prioritas terbaru
+                self.pqueue = [(-p, next(self._seq), pair) for pair, p in self.queued.items()]
+                heapq.heapify(self.pqueue)
+
+    def update_q(self, state, action, reward, next_state):
+        # update dari pengalaman nyata (sama seperti LearningAgent)
+        super().update_q(state, action, reward, next_state)
+
+        # update model
+        entry = self.model.setdefault((state, action), [0, 0.0, {}])
+        entry[0] += 1
+        entry[1] += reward
+        entry[2][next_state] = entry[2].get(next_state, 0) + 1
+        self.predecessors.setdefault(next_state, set()).add((state, action))
+
+        self._push(state, action)
+        self.plan()
+
+    def plan(self):
+        done = 0
+        while done < self.planning_steps and self.pqueue:
+            neg_priority, _, (state, action) = heapq.heappop(self.pqueue)
+            if self.queued.get((state, action)) != -neg_priority:
+                continue  # entri basi: pasangan ini sudah di-push ulang dengan prioritas lebih tinggi
+            del self.queued[(state, action)]
+            done += 1
+            # expected backup penuh memakai model yang dipelajari
+            self.q_table[(state, action)] = self.expected_target(state, action)
+            self.planning_updates += 1
+            for pred_state, pred_action in self.predecessors.get(state, ()):
+                self._push(pred_state, pred_action)
+
 # ----- Environment -----
 class Environment:
     def __init__(self):
@@ -2,10 +2,12 @@
 # Implementasi Model-Based Reflex Agent untuk Vacuum World
 
 class ModelBasedReflexAgent:
-    def __init__(self, location, environment):
+    def __init__(self, location, environment, topology=None):
         # Environment berbentuk list: [['room-A', 'dirty'], ['room-B', 'clean']]
         self.environment = environment
         self.location = location
+        # Optional RoomTopology (lihat RoomTopology.py) untuk gedung dengan banyak ruangan
+        self.topology = topology
         # Model internal (state) → peta key:room, value:clean/dirty
         self.model = {room[0]: room[1] for room in environment}
 
@@ -34,7 +36,19 @@ class ModelBasedReflexAgent:
 
     def move(self):
         # Pindah ke ruangan lain
-        if self.location == "room-A":
+        if self.topology is not None:
+            # Satu langkah (next-hop) menuju ruangan kotor terdekat menurut model internal
+            dirty_rooms = [r for r, s in self.model.items() if s == "dirty" and r != self.location]
+            target = self.topology.nearest(self.location, dirty_rooms)
+            if target is None:
+                neighbors = self.topology.neighbors(self.location)
+                if not neighbors:
+                    print(f"[Action] Tidak ada ruangan tetangga dari {self.location}")
+                    return
+                target = neighbors[0]
+            self.location = self.topology.next_hop(self.location, target)
+            print(f"[Action] Pindah ke {self.location} (menuju {target})")
+        elif self.location == "room-A":
             self.location = "room-B"
             print("[Action] Pindah ke room-B")
         else:
@@ -16,8 +16,11 @@ import matplotlib.pyplot as plt
 # Environment
 # -------------------------
 class Environment:
-    def __init__(self, room_names):
+    def __init__(self, room_names, topology=None):
         self.room_names = list(room_names)
+        # optional RoomTopology: moves advance one hop along the shortest path
+        # instead of jumping directly to any room
+        self.topology = topology
         self.reset()
 
     def reset(self, init_dirty_prob=0.5):
@@ -52,6 +55,10 @@ class Environment:
             if act == "move":
                 # if target None, pick random other room
                 tgt = target if target else random.choice([r for r in self.room_names if r != self.agent_locations.get(aid)])
+                if self.topology is not None:
+                    # only the next room on the path is entered this step
+                    cur = self.agent_locations.get(aid)
+                    tgt = self.topology.next_hop(cur, tgt) or cur
                 move_requests.setdefault(tgt, []).append(aid)
 
         # Handle move conflicts: if multiple request same target, allow one randomly and penalize others
@@ -187,12 +194,19 @@ class MASAgent:
 # MAS Trainer
 # -------------------------
 def train_multi_agent(num_agents=3, room_names=("room-A","room-B","room-C"),
-                      episodes=200, steps_per_episode=30, enable_comm=True, save_q=True):
-    env = Environment(room_names)
+                      episodes=200, steps_per_episode=30, enable_comm=True, save_q=True, topology=None,
+                      spatial_channel=None, agent_factory=None):
+    if topology is not None:
+        room_names = tuple(topology.room_names)
+    env = Environment(room_names, topology=topology)
     # initialize agents and place randomly
     agents = []
     for i in range(num_agents):
-        a = MASAgent(f"agent{i}", qfile=f"qtable_agent{i}.pkl", comm_enabled=enable_comm)
+        if agent_factory is not None:
+            # custom agent with the MASAgent interface (e.g. LinearQAgent)
+            a = agent_factory(i)
+        else:
+            a = MASAgent(f"agent{i}", qfile=f"qtable_agent{i}.pkl", comm_enabled=enable_comm)
         agents.append(a)
 
     rewards_history = {a.agent_id: [] for a in agents}
@@ -207,14 +221,28 @@ def train_multi_agent(num_agents=3, room_names=("room-A","room-B","room-C"),
         total_rewards = {a.agent_id: 0 for a in agents}
 
         for step in range(steps_per_episode):
-            # each agent perceives local environment (in this simplified setup they perceive all rooms)
-            perceptions = { a.agent_id: env.rooms.copy() for a in agents }
+            if spatial_channel is not None:
+                # spatially partitioned comms: each agent perceives the rooms of its own cell,
+                # broadcasts only to subscribers of that cell and integrates only its own inbox.
+                # all agents re-subscribe to their current cell before anyone publishes
+                for a in agents:
+                    spatial_channel.subscribe(a.agent_id, env.agent_locations.get(a.agent_id))
+                if enable_comm:
+                    for a in agents:
+                        loc = env.agent_locations.get(a.agent_id)
+                        perception = {r: env.rooms[r] for r in spatial_channel.rooms_in_cell(loc)}
+                        spatial_channel.publish(loc, a.broadcast(perception))
+                for a in agents:
+                    a.integrate_knowledge(spatial_channel.receive(a.agent_id))
+            else:
+                # each agent perceives local environment (in this simplified setup they perceive all rooms)
+                perceptions = { a.agent_id: env.rooms.copy() for a in agents }
 
-            # agents optionally broadcast their known dirty rooms
-            messages = [ a.broadcast(perceptions[a.agent_id]) for a in agents ] if enable_comm else [None]*len(agents)
-            # integrate shared knowledge
-            for a in agents:
-                a.integrate_knowledge(messages)
+                # agents optionally broadcast their known dirty rooms
+                messages = [ a.broadcast(perceptions[a.agent_id]) for a in agents ] if enable_comm else [None]*len(agents)
+                # integrate shared knowledge
+                for a in agents:
+                    a.integrate_knowledge(messages)
 
             # agents form state and pick actions (move->target chosen later)
             chosen_actions = {}
@@ -230,7 +258,11 @@ def train_multi_agent(num_agents=3, room_names=("room-A","room-B","room-C"),
                     # prefer a dirty room not current
                     candidates = [r for r in known_dirty if r != env.agent_locations.get(a.agent_id)]
                     if candidates:
-                        target = random.choice(candidates)
+                        if topology is not None:
+                            # nearest known dirty room by true travel distance
+                            target = topology.nearest(env.agent_locations.get(a.agent_id), candidates)
+                        else:
+                            target = random.choice(candidates)
                     else:
                         # pick random other room
                         target = random.choice([r for r in room_names if r != env.agent_locations.get(a.agent_id)])
@@ -257,6 +289,9 @@ def train_multi_agent(num_agents=3, room_names=("room-A","room-B","room-C"),
         for a in agents:
             a.decay_epsilon()
             rewards_history[a.agent_id].append(total_rewards[a.agent_id])
+            # instrumented Q-tables (QTableInstrumentation.py) record per-episode table stats
+            if hasattr(a.q_table, "end_episode"):
+                a.q_table.end_episode()
             if save_q:
                 a.save_q_table()
 
@@ -0,0 +1,193 @@
+# mas_async.py
+# Mode konkuren (asyncio) untuk MASimulation di MultiAgentSystemSharedAndChannel.py
+# - Setiap agent berjalan sebagai task asyncio, ribuan agent dalam satu event loop
+# - Komunikasi lewat AsyncChannel dengan latency yang bisa diatur (tanpa lock)
+# - Aksi dikumpulkan per tick; konflik clean di ruangan yang sama diselesaikan oleh environment,
+#   bukan oleh siapa yang jalan duluan
+# Usage: python MultiAgentSystemAsync.py
+
+import asyncio
+import random
+import time
+
+from MultiAgentSystemSharedAndChannel import Environment, RewardLedger
+
+# -------------------------
+# Channel komunikasi
+# -------------------------
+class AsyncChannel:
+    """
+    Channel tanpa lock: semua task berjalan di satu thread event loop, jadi tulis/baca dict
+    bersifat atomik. Pesan baru terlihat oleh agent lain setelah `latency` detik.
+    """
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.view = {}  # room -> state yang sudah sampai ke penerima
+        self.sent = 0
+        self.delivered = 0
+
+    def publish(self, room, state):
+        self.sent += 1
+        if self.latency > 0:
+            asyncio.get_running_loop().call_later(self.latency, self._deliver, room, state)
+        else:
+            self._deliver(room, state)
+
+    def _deliver(self, room, state):
+        self.view[room] = state
+        self.delivered += 1
+
+    def get(self, room, default=None):
+        return self.view.get(room, default)
+
+    def clear(self):
+        self.view.clear()
+
+# -------------------------
+# Environment konkuren (per tick)
+# -------------------------
+class ConcurrentEnvironment:
+    """
+    Mengumpulkan aksi semua agent dalam satu tick lalu menyelesaikannya sekaligus.
+    Beberapa agent yang membersihkan ruangan kotor yang sama: satu pemenang acak (+10),
+    sisanya dianggap membersihkan ruangan bersih (-2), sama seperti aturan sinkron.
+    """
+    def __init__(self, env, n_agents, channel, ledger, verbose=False):
+        self.env = env
+        self.n_agents = n_agents
+        self.channel = channel
+        self.ledger = ledger
+        self.verbose = verbose
+        self.ticks = 0
+        self.actions = 0
+        self.conflicts = 0
+        self._begin_tick()
+
+    def _begin_tick(self):
+        self._cleaners = {}  # room -> [agent]
+        self._movers = []    # (agent, target)
+        self._submitted = 0
+        self._resolved = asyncio.get_running_loop().create_future()
+
+    async def submit(self, agent, action, target=None):
+        if action == "clean":
+            self._cleaners.setdefault(agent.location, []).append(agent)
+        else:
+            self._movers.append((agent, target))
+        self._submitted += 1
+        tick_done = self._resolved
+        if self._submitted == self.n_agents:
+            self._resolve()
+        await tick_done
+
+    def _resolve(self):
+        for room, cleaners in self._cleaners.items():
+            winner = random.choice(cleaners) if self.env.is_dirty(room) else None
+            if winner is not None:
+                self.env.clean(room)
+                self.channel.publish(room, "clean")
+            for ag in cleaners:
+                reward = 10 if ag is winner else -2
+                if ag is not winner and winner is not None:
+                    self.conflicts += 1
+                self.ledger.record(ag.name, reward)
+                if self.verbose:
+                    print(f"{ag.name} clean {room} ({reward:+d})")
+
+        for ag, target in self._movers:
+            if target is not None:
+                ag.location = target
+                self.ledger.record(ag.name, 5)
+            else:
+                self.ledger.record(ag.name, -5)
+            if self.verbose:
+                print(f"{ag.name} pindah ke {ag.location}" if target else f"{ag.name} tidak bisa pindah (-5)")
+
+        self.ticks += 1
+        self.actions += self._submitted
+        done = self._resolved
+        self._begin_tick()
+        done.set_result(None)
+
+# -------------------------
+# Agent konkuren
+# -------------------------
+class AsyncAgent:
+    def __init__(self, name, location):
+        self.name = name
+        self.location = location
+
+    async def run(self, cenv, steps, think_time=0.0):
+        env, channel = cenv.env, cenv.channel
+        for _ in range(steps):
+            if env.all_clean():
+                break
+            # waktu berpikir acak -> urutan agent di dalam tick tidak deterministik
+            await asyncio.sleep(random.uniform(0, think_time) if think_time else 0)
+            if env.is_dirty(self.location):
+                await cenv.submit(self, "clean")
+            else:
+                # informasi channel bisa basi sebesar latency
+                possible_rooms = [room for room in env.rooms if channel.get(room, "dirty") == "dirty"]
+                target = random.choice(possible_rooms) if possible_rooms else None
+                await cenv.submit(self, "move", target)
+
+# -------------------------
+# Simulasi
+# -------------------------
+class AsyncMASimulation:
+    def __init__(self, num_agents=3, rooms=("room-A", "room-B", "room-C"), latency=0.0,
+                 think_time=0.0, verbose=False):
+        self.rooms = list(rooms)
+        self.latency = latency
+        self.think_time = think_time
+        self.verbose = verbose
+        self.ledger = RewardLedger()
+        self.agents = [AsyncAgent(f"Agent-{i}", random.choice(self.rooms)) for i in range(num_agents)]
+
+    async def run_episode(self, steps=10):
+        env = Environment(self.rooms)
+        channel = AsyncChannel(latency=self.latency)
+        self.ledger.reset()
+        for ag in self.agents:
+            ag.location = random.choice(self.rooms)
+        cenv = ConcurrentEnvironment(env, len(self.agents), channel, self.ledger, verbose=self.verbose)
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(ag.run(cenv, steps, self.think_time) for ag in self.agents))
+        elapsed = time.perf_counter() - t0
+
+        rewards = [self.ledger.reward_of(ag.name) for ag in self.agents]
+        return {
+            "ticks": cenv.ticks,
+            "actions": cenv.actions,
+            "conflicts": cenv.conflicts,
+            "messages_sent": channel.sent,
+            "messages_delivered": channel.delivered,
+            "all_clean": env.all_clean(),
+            "team_reward": sum(rewards),
+            "runtime": elapsed,
+            "actions_per_sec": cenv.actions / elapsed if elapsed > 0 else float("inf"),
+        }
+
+    async def _run(self, episodes, steps):
+        history = []
+        for ep in range(1, episodes + 1):
+            stats = await self.run_episode(steps)
+            history.append(stats)
+            print(f"Episode {ep}: ticks={stats['ticks']} actions={stats['actions']} "
+                  f"conflicts={stats['conflicts']} team_reward={stats['team_reward']} "
+                  f"throughput={stats['actions_per_sec']:.0f} aksi/detik")
+        return history
+
+    def run(self, episodes=5, steps=10):
+        return asyncio.run(self._run(episodes, steps))
+
+
+if __name__ == "__main__":
+    print("=== 3 agent, verbose ===")
+    AsyncMASimulation(num_agents=3, verbose=True).run(episodes=1, steps=10)
+
+    print("\n=== 2000 agent, 1000 ruangan, latency 5 ms ===")
+    rooms = [f"room-{i}" for i in range(1000)]
+    AsyncMASimulation(num_agents=2000, rooms=rooms, latency=0.005).run(episodes=3, steps=20)
@@ -15,14 +15,52 @@ class Environment:
         return all(state == "clean" for state in self.rooms.values())
 
 
+class RewardLedger:
+    """
+    Pool reward tim: setiap aksi dicatat sekali (O(1)), bagian tiap agent dihitung saat dibaca.
+    Hasilnya sama dengan aturan lama (50% reward masuk ke setiap agent lain):
+       reward(agent) = reward sendiri + (total share tim - share yang berasal dari agent itu)
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.pool = 0     # total share yang sudah dibagikan ke tim
+        self.own = {}     # name -> total base reward milik sendiri
+        self.given = {}   # name -> total share yang berasal dari agent tsb
+
+    def record(self, name, base_reward):
+        share = base_reward // 2
+        self.own[name] = self.own.get(name, 0) + base_reward
+        self.given[name] = self.given.get(name, 0) + share
+        self.pool += share
+
+    def reward_of(self, name):
+        return self.own.get(name, 0) + self.pool - self.given.get(name, 0)
+
+
 class Agent:
-    def __init__(self, name, env, location, comm_channel, agents_list):
+    def __init__(self, name, env, location, comm_channel, agents_list, ledger=None, verbose=True):
         self.name = name
         self.env = env
         self.location = location
-        self.reward = 0
         self.comm_channel = comm_channel  # shared communication channel
         self.agents_list = agents_list    # reference to all agents
+        self.ledger = ledger              # optional RewardLedger bersama (O(1) per aksi)
+        self.verbose = verbose            # False = quiet mode, tanpa print per aksi
+        self._reward = 0
+        self.reward = 0
+
+    @property
+    def reward(self):
+        if self.ledger is None:
+            return self._reward
+        return self.ledger.reward_of(self.name) + self._reward
+
+    @reward.setter
+    def reward(self, value):
+        # dengan ledger, simpan sebagai offset agar pembacaan berikutnya = value
+        self._reward = value if self.ledger is None else value - self.ledger.reward_of(self.name)
 
     def perceive(self):
         return self.env.rooms[self.location]
@@ -31,31 +69,40 @@ class Agent:
         if self.env.is_dirty(self.location):
             self.env.clean(self.location)
             reward = 10
-            print(f"{self.name} membersihkan {self.location} ✅ (+10)")
+            if self.verbose:
+                print(f"{self.name} membersihkan {self.location} ✅ (+10)")
             # Kirim informasi ke channel
             self.comm_channel[self.location] = "clean"
         else:
             reward = -2
-            print(f"{self.name} mencoba membersihkan {self.location} tapi sudah bersih ❌ (-2)")
+            if self.verbose:
+                print(f"{self.name} mencoba membersihkan {self.location} tapi sudah bersih ❌ (-2)")
         self.add_shared_reward(reward)
 
     def move(self):
         # Hindari ruangan yang sudah ditandai bersih di comm_channel
-        possible_rooms = [room for room, state in self.env.rooms.items() 
+        # (dengan SpatialChannel hanya ruangan di sel sendiri + tetangga yang dipertimbangkan)
+        rooms = self.comm_channel.nearby_rooms() if hasattr(self.comm_channel, "nearby_rooms") else self.env.rooms
+        possible_rooms = [room for room in rooms
                           if self.comm_channel.get(room, "dirty") == "dirty"]
 
         if possible_rooms:
             self.location = random.choice(possible_rooms)
             reward = 5
-            print(f"{self.name} pindah ke {self.location} 🚶 (+5)")
+            if self.verbose:
+                print(f"{self.name} pindah ke {self.location} 🚶 (+5)")
         else:
             reward = -5
-            print(f"{self.name} pindah tapi semua sudah bersih ❌ (-5)")
+            if self.verbose:
+                print(f"{self.name} pindah tapi semua sudah bersih ❌ (-5)")
 
         self.add_shared_reward(reward)
 
     def add_shared_reward(self, base_reward):
         # Shared reward system (50% ke agent lain)
+        if self.ledger is not None:
+            self.ledger.record(self.name, base_reward)
+            return
         share = base_reward // 2
         self.reward += base_reward
         for ag in self.agents_list:
@@ -70,21 +117,29 @@ class Agent:
 
 
 class MASimulation:
-    def __init__(self, num_agents=3):
-        rooms = ["room-A", "room-B", "room-C"]
+    def __init__(self, num_agents=3, verbose=True, rooms=None, spatial_channel=None):
+        rooms = list(rooms) if rooms else ["room-A", "room-B", "room-C"]
+        self.rooms = rooms
         self.env = Environment(rooms)
-        self.comm_channel = {}  # global channel
+        # global channel, atau SpatialChannel (lihat SpatialChannel.py) untuk lantai besar
+        self.comm_channel = spatial_channel if spatial_channel is not None else {}
+        self.ledger = RewardLedger()  # shared reward pool, linear per step
+        self.verbose = verbose
         self.agents = []
         for i in range(num_agents):
-            agent = Agent(f"Agent-{i}", self.env, random.choice(rooms), self.comm_channel, self.agents)
+            agent = Agent(f"Agent-{i}", self.env, random.choice(rooms), self.comm_channel, self.agents,
+                          ledger=self.ledger, verbose=verbose)
+            if spatial_channel is not None:
+                agent.comm_channel = spatial_channel.view(agent)
             self.agents.append(agent)
 
     def run(self, episodes=5, steps=10):
         for ep in range(1, episodes+1):
             print(f"\n=== Episode {ep} ===")
             # Reset environment dan komunikasi
-            self.env = Environment(["room-A", "room-B", "room-C"])
+            self.env = Environment(self.rooms)
             self.comm_channel.clear()
+            self.ledger.reset()
             for ag in self.agents:
                 ag.reward = 0
                 ag.location = random.choice(list(self.env.rooms.keys()))
@@ -98,8 +153,13 @@ class MASimulation:
 
             # Hasil akhir episode
             print(f"\n[Episode {ep} Result]")
-            for ag in self.agents:
-                print(f"{ag.name} total reward: {ag.reward}")
+            if self.verbose:
+                for ag in self.agents:
+                    print(f"{ag.name} total reward: {ag.reward}")
+            else:
+                rewards = [ag.reward for ag in self.agents]
+                print(f"{len(rewards)} agent | total reward tim: {sum(rewards)} | "
+                      f"min: {min(rewards)} | max: {max(rewards)}")
 
 
 if __name__ == "__main__":
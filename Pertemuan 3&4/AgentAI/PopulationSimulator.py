@@ -0,0 +1,167 @@
+# population_simulator.py
+# Simulasi populasi untuk Simple Reflex Agent dan Model-Based Reflex Agent
+# - Ribuan "world" vacuum dijalankan bersamaan dalam satu run
+# - Aturan reflex dan update model ditulis sebagai operasi array NumPy atas batch world
+# - Hasil: distribusi langkah sampai selesai + jumlah aksi (clean / move)
+# Usage: python PopulationSimulator.py
+
+import time
+import numpy as np
+
+# -------------------------
+# Batch World
+# -------------------------
+def random_worlds(n_worlds, n_rooms=2, dirty_prob=0.5, seed=None):
+    """
+    Buat n_worlds konfigurasi awal acak.
+    Returns:
+       dirty: bool array (n_worlds, n_rooms), True = ruangan kotor
+       location: int array (n_worlds,), indeks ruangan posisi awal agent
+    Ruangan ke-i setara dengan 'room-A', 'room-B', ... pada versi single agent.
+    """
+    rng = np.random.default_rng(seed)
+    dirty = rng.random((n_worlds, n_rooms)) < dirty_prob
+    location = rng.integers(0, n_rooms, size=n_worlds)
+    return dirty, location
+
+# -------------------------
+# Simple Reflex Agent (lihat SimpleReflexAgent.py)
+# -------------------------
+def simulate_reflex(dirty, location, max_steps=1000):
+    """
+    Versi vektor dari Reflex_Cleaning_Agent.Run_Until_Everywhere_Is_Clean:
+       if state = dirty -> clean
+       else -> pindah ke ruangan berikutnya (A -> B -> A untuk 2 ruangan)
+    Agent berhenti ketika semua flag room_x_is_dirty miliknya False. Flag ruangan
+    di-set False saat ruangan dibersihkan atau saat agent meninggalkannya dalam keadaan bersih.
+    """
+    env = dirty.copy()
+    loc = location.copy()
+    n_worlds, n_rooms = env.shape
+    believed_dirty = np.ones_like(env)
+    steps = np.zeros(n_worlds, dtype=np.int64)
+    n_clean = 0
+    n_move = 0
+
+    active = np.arange(n_worlds)
+    for _ in range(max_steps):
+        active = active[believed_dirty[active].any(axis=1)]
+        if active.size == 0:
+            break
+        here = loc[active]
+        is_dirty = env[active, here]
+
+        # clean
+        cleaners = active[is_dirty]
+        env[cleaners, loc[cleaners]] = False
+        believed_dirty[cleaners, loc[cleaners]] = False
+
+        # move (ruangan yang ditinggalkan dianggap bersih)
+        movers = active[~is_dirty]
+        believed_dirty[movers, loc[movers]] = False
+        loc[movers] = (loc[movers] + 1) % n_rooms
+
+        steps[active] += 1
+        n_clean += cleaners.size
+        n_move += movers.size
+
+    unfinished = int(believed_dirty.any(axis=1).sum())
+    return {"steps": steps, "env": env, "location": loc,
+            "actions": {"clean": n_clean, "move": n_move}, "unfinished": unfinished}
+
+# -------------------------
+# Model-Based Reflex Agent (lihat ModelBasedReflexAgent.py)
+# -------------------------
+def simulate_model_based(dirty, location, max_steps=1000):
+    """
+    Versi vektor dari ModelBasedReflexAgent.run_until_clean:
+       perceive -> update_model (model[lokasi] = kondisi) -> clean jika kotor, selain itu move
+    Model internal diinisialisasi dari environment (sama seperti versi single agent)
+    dan berjalan sampai semua ruangan di environment bersih.
+    """
+    env = dirty.copy()
+    loc = location.copy()
+    n_worlds, n_rooms = env.shape
+    model = env.copy()
+    steps = np.zeros(n_worlds, dtype=np.int64)
+    n_clean = 0
+    n_move = 0
+
+    active = np.arange(n_worlds)
+    for _ in range(max_steps):
+        active = active[env[active].any(axis=1)]
+        if active.size == 0:
+            break
+        here = loc[active]
+
+        # perceive + update_model
+        perception = env[active, here]
+        model[active, here] = perception
+
+        # clean
+        cleaners = active[perception]
+        env[cleaners, loc[cleaners]] = False
+        model[cleaners, loc[cleaners]] = False
+
+        # move
+        movers = active[~perception]
+        loc[movers] = (loc[movers] + 1) % n_rooms
+
+        steps[active] += 1
+        n_clean += cleaners.size
+        n_move += movers.size
+
+    unfinished = int(env.any(axis=1).sum())
+    model_accuracy = float((model == env).all(axis=1).mean()) if n_worlds else 1.0
+    return {"steps": steps, "env": env, "location": loc, "model": model,
+            "actions": {"clean": n_clean, "move": n_move}, "unfinished": unfinished,
+            "model_accuracy": model_accuracy}
+
+# -------------------------
+# Laporan
+# -------------------------
+def summarize(result):
+    steps = result["steps"]
+    return {
+        "worlds": int(steps.size),
+        "mean": float(steps.mean()) if steps.size else 0.0,
+        "std": float(steps.std()) if steps.size else 0.0,
+        "median": float(np.median(steps)) if steps.size else 0.0,
+        "p90": float(np.percentile(steps, 90)) if steps.size else 0.0,
+        "max": int(steps.max()) if steps.size else 0,
+        "histogram": np.bincount(steps),
+        "actions": dict(result["actions"]),
+        "unfinished": result["unfinished"],
+    }
+
+def print_report(name, summary, runtime=None):
+    print(f"\n=== {name} ===")
+    print(f"Jumlah world : {summary['worlds']}")
+    if runtime is not None:
+        print(f"Runtime      : {runtime:.3f}s")
+    print(f"Langkah sampai selesai: mean={summary['mean']:.3f} std={summary['std']:.3f} "
+          f"median={summary['median']:.1f} p90={summary['p90']:.1f} max={summary['max']}")
+    print("Distribusi langkah:")
+    for n_steps, count in enumerate(summary["histogram"]):
+        if count:
+            print(f"  {n_steps:3d} langkah : {count} world ({count / summary['worlds']:.1%})")
+    print(f"Aksi: clean={summary['actions']['clean']} move={summary['actions']['move']}")
+    if summary["unfinished"]:
+        print(f"⚠️  {summary['unfinished']} world belum selesai (batas max_steps tercapai)")
+
+def run_population(n_worlds=100_000, n_rooms=2, dirty_prob=0.5, seed=42, max_steps=1000):
+    dirty, location = random_worlds(n_worlds, n_rooms, dirty_prob, seed)
+    reports = {}
+    for name, simulate in (("Simple Reflex Agent", simulate_reflex),
+                           ("Model-Based Reflex Agent", simulate_model_based)):
+        t0 = time.perf_counter()
+        result = simulate(dirty, location, max_steps=max_steps)
+        t1 = time.perf_counter()
+        summary = summarize(result)
+        print_report(name, summary, runtime=t1 - t0)
+        reports[name] = summary
+    return reports
+
+
+if __name__ == "__main__":
+    run_population(n_worlds=100_000, n_rooms=2)
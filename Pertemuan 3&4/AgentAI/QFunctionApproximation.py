@@ -0,0 +1,163 @@
+# q_function_approximation.py
+# Q-function approximation (linear + tile coding) untuk Vacuum World dengan banyak ruangan
+# - Tabel Q tabular butuh hingga 2^rooms x lokasi entri -> tidak mungkin di atas ~20 ruangan
+# - Di sini Q(s, a) = W[a] . phi(s), phi = fitur buatan tangan + tile coding:
+#     dirty count, jarak ke ruangan kotor terdekat, kotoran lokal, jumlah known-dirty (shared knowledge)
+# - Update TD dilakukan dengan operasi vektor NumPy, memori tetap konstan berapa pun jumlah ruangan
+# - Antarmuka sama dengan MASAgent / LearningAgent: choose_action(state), update_q(s, a, r, s')
+
+import random
+import pickle
+from functools import lru_cache
+
+import numpy as np
+
+from MultiAgentSystem import MASAgent
+
+# -------------------------
+# Feature extractor
+# -------------------------
+class FeatureExtractor:
+    """
+    Menerima state dari:
+       MASAgent.state_repr      -> (location, ((room, status), ...), shared_summary)
+       LearningAgent.get_state  -> (((room, status), ...), location)
+    topology: optional RoomTopology untuk jarak tempuh dan tetangga sebenarnya.
+    """
+    SCALARS = ("dirty_frac", "distance", "known_frac", "local_dirt")
+
+    def __init__(self, topology=None, n_tilings=4, n_bins=8, cache_size=4096):
+        self.topology = topology
+        self.n_tilings = n_tilings
+        self.n_bins = n_bins
+        self.n_raw = 7
+        self.tile_width = n_bins + 1
+        self.n_features = self.n_raw + len(self.SCALARS) * n_tilings * self.tile_width
+        if topology is not None:
+            finite = topology.dist[np.isfinite(topology.dist)]
+            self.max_distance = max(float(finite.max()), 1.0) if finite.size else 1.0
+        else:
+            self.max_distance = 1.0
+        # cache kecil & terbatas: choose_action dan update_q memanggil state yang sama berulang kali
+        self._cached = lru_cache(maxsize=cache_size)(self._compute)
+
+    def __call__(self, state):
+        return self._cached(state)
+
+    @staticmethod
+    def _parse(state):
+        if isinstance(state[0], str) or state[0] is None:
+            location, rooms_t, shared = state
+        else:
+            rooms_t, location = state
+            shared = ()
+        return location, rooms_t, shared
+
+    def _compute(self, state):
+        location, rooms_t, shared = self._parse(state)
+        n_rooms = max(len(rooms_t), 1)
+        dirty = [r for r, s in rooms_t if s == "dirty"]
+        here_dirty = 1.0 if location in dirty else 0.0
+        dirty_frac = len(dirty) / n_rooms
+        known_frac = len(shared) / n_rooms
+
+        if not dirty:
+            distance = 1.0
+        elif here_dirty:
+            distance = 0.0
+        elif self.topology is not None and location is not None:
+            d = self.topology.dist[self.topology.index[location], [self.topology.index[r] for r in dirty]]
+            distance = min(float(d.min()) / self.max_distance, 1.0)
+        else:
+            distance = 1.0 / self.max_distance
+
+        if self.topology is not None and location is not None:
+            status = dict(rooms_t)
+            nbrs = self.topology.neighbors(location)
+            local = [status.get(r) == "dirty" for r in nbrs] + [bool(here_dirty)]
+            local_dirt = sum(local) / len(local)
+        else:
+            local_dirt = here_dirty
+
+        phi = np.zeros(self.n_features)
+        phi[:self.n_raw] = (1.0, here_dirty, dirty_frac, distance, known_frac, local_dirt,
+                            1.0 if not dirty else 0.0)
+        # tile coding: setiap tiling digeser sedikit, satu tile aktif per tiling
+        base = self.n_raw
+        offsets = np.arange(self.n_tilings) / (self.n_tilings * self.n_bins)
+        for value in (dirty_frac, distance, known_frac, local_dirt):
+            idx = np.minimum(((value + offsets) * self.n_bins).astype(int), self.n_bins)
+            phi[base + np.arange(self.n_tilings) * self.tile_width + idx] = 1.0 / self.n_tilings
+            base += self.n_tilings * self.tile_width
+        phi.setflags(write=False)
+        return phi
+
+# -------------------------
+# Agent
+# -------------------------
+class LinearQAgent(MASAgent):
+    """
+    Pengganti MASAgent (dan LearningAgent) dengan bobot linear W (n_actions x n_features).
+    Update TD dinormalisasi dengan ||phi||^2 agar step size stabil untuk semua jumlah fitur.
+    """
+    def __init__(self, agent_id, actions=("clean", "move", "idle"), alpha=0.1, gamma=0.9,
+                 epsilon=1.0, epsilon_decay=0.995, epsilon_min=0.05, qfile=None, comm_enabled=True,
+                 features=None):
+        self.features = features or FeatureExtractor()
+        self.weights = np.zeros((len(actions), self.features.n_features))
+        super().__init__(agent_id, actions=actions, alpha=alpha, gamma=gamma, epsilon=epsilon,
+                         epsilon_decay=epsilon_decay, epsilon_min=epsilon_min,
+                         qfile=qfile or f"qweights_{agent_id}.pkl", comm_enabled=comm_enabled)
+        self.action_index = {a: i for i, a in enumerate(self.actions)}
+
+    def q_values(self, state):
+        return self.weights @ self.features(state)
+
+    def choose_action(self, state):
+        # epsilon-greedy
+        if random.random() < self.epsilon:
+            return random.choice(self.actions)
+        qvals = self.q_values(state)
+        best = np.flatnonzero(qvals == qvals.max())
+        return self.actions[random.choice(best)]
+
+    def update_q(self, state, action, reward, next_state):
+        phi = self.features(state)
+        a = self.action_index[action]
+        target = reward + self.gamma * self.q_values(next_state).max()
+        td = target - self.weights[a] @ phi
+        self.weights[a] += (self.alpha * td / (phi @ phi)) * phi
+        return td
+
+    def update_q_batch(self, states, actions, rewards, next_states):
+        """Update TD untuk satu batch transisi sekaligus (misal dari replay buffer)."""
+        phi = np.stack([self.features(s) for s in states])
+        phi_next = np.stack([self.features(s) for s in next_states])
+        a = np.array([self.action_index[x] for x in actions])
+        targets = np.asarray(rewards, dtype=float) + self.gamma * (phi_next @ self.weights.T).max(axis=1)
+        td = targets - np.einsum("ij,ij->i", phi, self.weights[a])
+        step = (self.alpha * td / np.einsum("ij,ij->i", phi, phi))[:, None] * phi
+        np.add.at(self.weights, a, step)
+        return td
+
+    def save_q_table(self):
+        with open(self.qtable_file, "wb") as f:
+            pickle.dump({"actions": self.actions, "weights": self.weights}, f)
+
+    def load_q_table(self):
+        with open(self.qtable_file, "rb") as f:
+            data = pickle.load(f)
+        if list(data["actions"]) == self.actions and data["weights"].shape == self.weights.shape:
+            self.weights = data["weights"]
+
+
+if __name__ == "__main__":
+    from RoomTopology import RoomTopology
+    from MultiAgentSystem import train_multi_agent
+
+    topo = RoomTopology.from_grid(8, 8)
+    features = FeatureExtractor(topology=topo)
+    agents, env, history = train_multi_agent(
+        num_agents=4, episodes=100, steps_per_episode=80, save_q=False, topology=topo,
+        agent_factory=lambda i: LinearQAgent(f"agent{i}", features=features))
+    print(f"{len(topo.room_names)} ruangan, bobot per agent: {agents[0].weights.size} angka")
@@ -0,0 +1,248 @@
+# q_table_instrumentation.py
+# Instrumentasi Q-table untuk MASAgent, LearningAgent dan QLearningAgent
+# - Counter murah di setiap akses: lookup, hit, miss (jatuh ke nilai default), insert, update
+# - Bentuk key mengikuti tipe agent: (state, action) untuk MASAgent / LearningAgent,
+#   state_key -> {action: nilai} untuk QLearningAgent (update in-place q[s][a] += ... ikut dihitung)
+# - Histogram kunjungan per state: satu kunjungan per penulisan (state yang benar-benar di-update),
+#   terpisah dari counter lookup/hit/miss; histogram + ukuran key diambil dari SAMPEL state
+#   (hash % sample_every == 0), jadi biaya & memori tambahan hanya ~1/sample_every
+# - Statistik per episode (pertumbuhan tabel, hit rate, dll) bisa diekspor bersama episode stats
+# Bisa membungkus dict, defaultdict, atau BoundedQTable.
+
+import csv
+import sys
+from collections import Counter, defaultdict
+from collections.abc import MutableMapping
+
+_MISSING = object()
+
+def deep_sizeof(obj):
+    """Ukuran (bytes) objek beserta isi tuple/list/dict di dalamnya (batas atas, string tidak di-dedup)."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (tuple, list, frozenset, set)):
+        size += sum(deep_sizeof(x) for x in obj)
+    elif isinstance(obj, dict):
+        size += sum(deep_sizeof(k) + deep_sizeof(v) for k, v in obj.items())
+    return size
+
+
+class _ActionValues(dict):
+    """{action: nilai} milik satu state QLearningAgent; setiap penulisan dihitung sebagai update."""
+    __slots__ = ("owner", "key")
+
+    def __init__(self, owner, key, values):
+        super().__init__(values)
+        self.owner = owner
+        self.key = key
+
+    def __setitem__(self, action, value):
+        self.owner._update_in_place(self.key)
+        super().__setitem__(action, value)
+
+    def __reduce__(self):
+        # di-pickle sebagai dict biasa (tanpa referensi ke tabel instrumentasi)
+        return dict, (dict(self),)
+
+
+class InstrumentedQTable(MutableMapping):
+    def __init__(self, table=None, sample_every=16, key_shape="pair"):
+        """
+        key_shape: "pair" -> key = (state, action) (MASAgent / LearningAgent)
+                   "state" -> key = state_key, nilai = {action: q} (QLearningAgent)
+        """
+        if key_shape not in ("pair", "state"):
+            raise ValueError(f"key_shape harus 'pair' atau 'state', bukan {key_shape!r}")
+        self.table = table if table is not None else {}
+        self.sample_every = max(1, sample_every)
+        self.key_shape = key_shape
+        self.lookups = 0
+        self.hits = 0
+        self.misses = 0
+        self.inserts = 0
+        self.updates = 0
+        self.state_visits = Counter()  # hanya state tersampel
+        self._key_bytes = 0
+        self._value_bytes = 0
+        self._sampled_keys = 0
+        self.episodes = []
+        self._last = {"entries": len(self.table), "lookups": 0, "hits": 0, "misses": 0,
+                      "inserts": 0, "updates": 0}
+
+    def _state_of(self, key):
+        return key[0] if self.key_shape == "pair" else key
+
+    def _visit(self, key):
+        # dipanggil dari jalur tulis saja: satu update Q = satu kunjungan state
+        state = self._state_of(key)
+        if not hash(state) % self.sample_every:
+            self.state_visits[state] += 1
+
+    def _update_in_place(self, key):
+        # QLearningAgent: q[s][a] += ... menulis ke dict aksi, bukan ke tabel
+        self.updates += 1
+        self._visit(key)
+
+    def _wrap(self, key, value):
+        # QLearningAgent: bungkus {action: nilai} sekali agar q[s][a] += ... terhitung sebagai update
+        if self.key_shape == "state" and type(value) is dict:
+            value = _ActionValues(self, key, value)
+            self.table[key] = value
+        return value
+
+    def _measure(self, key, value):
+        if hash(self._state_of(key)) % self.sample_every:
+            return
+        if self._sampled_keys < 10_000:
+            self._key_bytes += deep_sizeof(key)
+            self._value_bytes += deep_sizeof(value)
+            self._sampled_keys += 1
+
+    # -------------------------
+    # Mapping API
+    # -------------------------
+    def get(self, key, default=None):
+        self.lookups += 1
+        value = self.table.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return self._wrap(key, value)
+
+    def __getitem__(self, key):
+        self.lookups += 1
+        if key in self.table:
+            self.hits += 1
+            return self._wrap(key, self.table[key])
+        self.misses += 1
+        value = self.table[key]  # defaultdict / default_factory membuat entri baru
+        self.inserts += 1
+        self._measure(key, value)
+        return self._wrap(key, value)
+
+    def __setitem__(self, key, value):
+        if key in self.table:
+            self.updates += 1
+        else:
+            self.inserts += 1
+            self._measure(key, value)
+        self.table[key] = value
+        self._visit(key)
+
+    def __delitem__(self, key):
+        del self.table[key]
+
+    def __contains__(self, key):
+        return key in self.table
+
+    def __iter__(self):
+        return iter(self.table)
+
+    def __len__(self):
+        return len(self.table)
+
+    def __getattr__(self, name):
+        # teruskan atribut tabel di dalamnya, misal BoundedQTable.stats()
+        if name == "table":
+            raise AttributeError(name)
+        return getattr(self.table, name)
+
+    # -------------------------
+    # Laporan
+    # -------------------------
+    def estimated_bytes(self):
+        if not self._sampled_keys:
+            return sys.getsizeof(self.table)
+        per_entry = (self._key_bytes + self._value_bytes) / self._sampled_keys
+        return int(sys.getsizeof(self.table) + per_entry * len(self.table))
+
+    def visit_histogram(self):
+        """{jumlah_kunjungan: jumlah_state} dari state tersampel."""
+        return dict(sorted(Counter(self.state_visits.values()).items()))
+
+    def report(self):
+        sampled_states = len(self.state_visits)
+        once = sum(1 for v in self.state_visits.values() if v == 1)
+        return {
+            "entries": len(self.table),
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / self.lookups if self.lookups else 0.0,
+            "inserts": self.inserts,
+            "updates": self.updates,
+            "estimated_states": sampled_states * self.sample_every,
+            "share_visited_once": once / sampled_states if sampled_states else 0.0,
+            "estimated_bytes": self.estimated_bytes(),
+        }
+
+    def end_episode(self):
+        """Catat statistik episode ini (delta sejak episode sebelumnya)."""
+        now = {"entries": len(self.table), "lookups": self.lookups, "hits": self.hits,
+               "misses": self.misses, "inserts": self.inserts, "updates": self.updates}
+        row = {"episode": len(self.episodes) + 1, "entries": now["entries"],
+               "growth": now["entries"] - self._last["entries"]}
+        for k in ("lookups", "hits", "misses", "inserts", "updates"):
+            row[k] = now[k] - self._last[k]
+        row["hit_rate"] = row["hits"] / row["lookups"] if row["lookups"] else 0.0
+        row["estimated_bytes"] = self.estimated_bytes()
+        self._last = now
+        self.episodes.append(row)
+        return row
+
+    def export_csv(self, path):
+        if not self.episodes:
+            return
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(self.episodes[0].keys()))
+            writer.writeheader()
+            writer.writerows(self.episodes)
+
+
+def instrument(agent, sample_every=16):
+    """Bungkus agent.q_table dengan InstrumentedQTable (defaultdict tetap berfungsi)."""
+    # QLearningAgent (MASQLearningShare&Com.py) memakai state_key dari get_state_key -> {action: nilai}
+    key_shape = "state" if hasattr(agent, "get_state_key") else "pair"
+    table = InstrumentedQTable(agent.q_table, sample_every=sample_every, key_shape=key_shape)
+    agent.q_table = table
+    return table
+
+
+if __name__ == "__main__":
+    import importlib
+    import pickle
+
+    import LearningAgentWithCriticdanEpsilon as single
+
+    # QLearningAgent: N kali learn pada satu state -> N kunjungan dan N update
+    QLearningAgent = importlib.import_module("MASQLearningShare&Com").QLearningAgent
+    q_agent = QLearningAgent("A", ["clean", "left", "right"])
+    q_table = instrument(q_agent, sample_every=1)
+    state, locs, next_locs = {"R1": "dirty"}, {"A": "R1"}, {"A": "R2"}
+    for _ in range(50):
+        q_agent.learn(state, locs, "clean", 1.0, state, next_locs)
+    key = q_agent.get_state_key(state, locs)
+    assert q_table.state_visits[key] == 50 and q_table.updates == 50, q_table.report()
+    # next state hanya dibaca (lookup), belum pernah di-update -> bukan kunjungan
+    assert q_agent.get_state_key(state, next_locs) not in q_table.state_visits
+    assert type(pickle.loads(pickle.dumps(q_agent.export_q_table()))[key]) is dict
+    print("QLearningAgent 50x learn:", q_table.report())
+
+    agent = single.LearningAgent(["clean", "move"], qtable_file="qtable_instrumented_demo.pkl")
+    table = instrument(agent, sample_every=1)
+    env = single.Environment()
+    for ep in range(100):
+        state = env.reset()
+        for step in range(20):
+            action = agent.choose_action(state)
+            next_state, reward, done = env.step(action)
+            agent.update_q(state, action, reward, next_state)
+            state = next_state
+            if done:
+                break
+        agent.decay_epsilon()
+        table.end_episode()
+    for row in table.episodes[:3] + table.episodes[-2:]:
+        print(row)
+    print(table.report())
+    print("Histogram kunjungan:", table.visit_histogram())
@@ -0,0 +1,293 @@
+# qtable_parameter_server.py
+# Training Q-learning terdistribusi untuk MAS Vacuum World (lihat MultiAgentSystem.py)
+# - Parameter server menyimpan Q-table global + nomor versi
+# - Worker (satu per node) mensimulasikan agent-agentnya sendiri, mengirim batch delta Q-value
+#   lewat TCP / Unix socket, dan menarik snapshot Q-table secara berkala
+# - Delta dari snapshot lama (versi tertinggal) di-diskon sebelum diterapkan
+# - Di satu mesin, beberapa proses lokal berperan sebagai node
+# Catatan: pesan di-serialisasi dengan pickle -> hanya untuk node yang dipercaya.
+# Usage: python QTableParameterServer.py
+
+import os
+import pickle
+import random
+import socket
+import socketserver
+import struct
+import threading
+import multiprocessing as mp
+
+from MultiAgentSystem import Environment, MASAgent
+
+# -------------------------
+# Protokol: pesan pickle dengan prefix panjang 4 byte
+# -------------------------
+def send_msg(sock, obj):
+    data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    sock.sendall(struct.pack("!I", len(data)) + data)
+
+def recv_msg(sock):
+    header = _recv_exact(sock, 4)
+    if header is None:
+        return None
+    (size,) = struct.unpack("!I", header)
+    return pickle.loads(_recv_exact(sock, size))
+
+def _recv_exact(sock, size):
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            return None
+        buf.extend(chunk)
+    return bytes(buf)
+
+# -------------------------
+# Parameter server
+# -------------------------
+class QTableStore:
+    def __init__(self, staleness_discount=0.9, staleness_tolerance=0):
+        self.q_table = {}
+        self.version = 0
+        self.staleness_discount = staleness_discount
+        self.staleness_tolerance = staleness_tolerance
+        self.pushes = 0
+        self.deltas_applied = 0
+        self.lock = threading.Lock()
+
+    def push(self, base_version, deltas):
+        with self.lock:
+            lag = max(0, self.version - base_version - self.staleness_tolerance)
+            factor = self.staleness_discount ** lag
+            for key, delta in deltas.items():
+                self.q_table[key] = self.q_table.get(key, 0) + factor * delta
+            self.version += 1
+            self.pushes += 1
+            self.deltas_applied += len(deltas)
+            return self.version, factor
+
+    def snapshot(self):
+        with self.lock:
+            return self.version, dict(self.q_table)
+
+    def stats(self):
+        with self.lock:
+            return {"version": self.version, "pushes": self.pushes,
+                    "deltas_applied": self.deltas_applied, "entries": len(self.q_table)}
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    def handle(self):
+        store = self.server.store
+        while True:
+            msg = recv_msg(self.request)
+            if msg is None:
+                return
+            cmd = msg[0]
+            if cmd == "push":
+                send_msg(self.request, store.push(msg[1], msg[2]))
+            elif cmd == "pull":
+                send_msg(self.request, store.snapshot())
+            elif cmd == "stats":
+                send_msg(self.request, store.stats())
+            elif cmd == "stop":
+                send_msg(self.request, "ok")
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def serve(address, ready_conn=None, staleness_discount=0.9, staleness_tolerance=0):
+    """
+    Jalankan parameter server sampai menerima perintah "stop".
+    address: (host, port) untuk TCP (port 0 = pilih otomatis) atau path string untuk Unix socket.
+    """
+    if isinstance(address, str):
+        if os.path.exists(address):
+            os.unlink(address)
+        server = _UnixServer(address, _Handler)
+    else:
+        server = _TCPServer(address, _Handler)
+    server.store = QTableStore(staleness_discount, staleness_tolerance)
+    if ready_conn is not None:
+        ready_conn.send(server.server_address)
+        ready_conn.close()
+    with server:
+        server.serve_forever()
+    if isinstance(address, str) and os.path.exists(address):
+        os.unlink(address)
+
+
+class QTableClient:
+    def __init__(self, address):
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        self.sock.connect(address)
+
+    def _call(self, *msg):
+        send_msg(self.sock, msg)
+        return recv_msg(self.sock)
+
+    def push(self, base_version, deltas):
+        """Returns (versi_baru, faktor_diskon)."""
+        return self._call("push", base_version, deltas)
+
+    def pull(self):
+        """Returns (versi, snapshot_q_table)."""
+        return self._call("pull")
+
+    def stats(self):
+        return self._call("stats")
+
+    def stop(self):
+        return self._call("stop")
+
+    def close(self):
+        self.sock.close()
+
+# -------------------------
+# Worker (satu node)
+# -------------------------
+def run_worker(worker_id, address, num_agents=3, room_names=("room-A", "room-B", "room-C"),
+               episodes=100, steps_per_episode=30, push_every=10, pull_every=5, seed=None,
+               result_queue=None):
+    """
+    Simulasi agent-agent satu node dengan Q-table bersama milik node.
+    Delta Q-value dikirim ke server setiap `push_every` langkah, snapshot ditarik setiap `pull_every` episode.
+    """
+    random.seed(seed)
+    client = QTableClient(address)
+    # versi snapshot yang sedang dipakai tabel lokal; hanya pull() yang memajukannya
+    snapshot_version, snapshot = client.pull()
+    q_table = dict(snapshot)
+    env = Environment(room_names)
+    agents = []
+    for i in range(num_agents):
+        a = MASAgent(f"w{worker_id}_agent{i}", qfile=f"qtable_ps_w{worker_id}_agent{i}.pkl")
+        a.q_table = q_table  # semua agent di node berbagi satu tabel
+        agents.append(a)
+
+    pending = {}
+    rewards_history = []
+    steps_done = 0
+    stale_factors = []
+
+    def flush():
+        if pending:
+            # delta dihitung di atas snapshot_version -> basis staleness tetap versi itu,
+            # versi baru hasil push diabaikan
+            _, factor = client.push(snapshot_version, dict(pending))
+            stale_factors.append(factor)
+            pending.clear()
+
+    for ep in range(1, episodes + 1):
+        env.reset()
+        for a in agents:
+            env.place_agent(a.agent_id, random.choice(room_names))
+        total = 0
+
+        for step in range(steps_per_episode):
+            messages = [a.broadcast(env.rooms) for a in agents]
+            chosen, states = {}, {}
+            for a in agents:
+                a.integrate_knowledge(messages)
+                state = a.state_repr(env.rooms, env.agent_locations.get(a.agent_id),
+                                     shared_knowledge=a.knowledge.get("dirty_rooms"))
+                states[a.agent_id] = state
+                action = a.choose_action(state)
+                target = None
+                if action == "move":
+                    loc = env.agent_locations.get(a.agent_id)
+                    candidates = [r for r in a.knowledge.get("dirty_rooms", []) if r != loc]
+                    target = random.choice(candidates) if candidates else None
+                chosen[a.agent_id] = (action, target)
+
+            rewards, info, done = env.step(chosen)
+
+            for a in agents:
+                aid = a.agent_id
+                next_state = a.state_repr(env.rooms, env.agent_locations.get(aid),
+                                          shared_knowledge=a.knowledge.get("dirty_rooms"))
+                key = (states[aid], chosen[aid][0])
+                old = q_table.get(key, 0)
+                a.update_q(states[aid], chosen[aid][0], rewards[aid], next_state)
+                pending[key] = pending.get(key, 0) + q_table[key] - old
+                total += rewards[aid]
+
+            steps_done += 1
+            if steps_done % push_every == 0:
+                flush()
+            if done:
+                break
+
+        for a in agents:
+            a.decay_epsilon()
+        rewards_history.append(total)
+
+        if ep % pull_every == 0:
+            flush()
+            snapshot_version, snapshot = client.pull()
+            q_table.clear()
+            q_table.update(snapshot)
+
+    flush()
+    client.close()
+    result = {"worker": worker_id, "rewards": rewards_history, "steps": steps_done,
+              "mean_stale_factor": sum(stale_factors) / len(stale_factors) if stale_factors else 1.0}
+    if result_queue is not None:
+        result_queue.put(result)
+    return result
+
+# -------------------------
+# Orkestrasi lokal (proses lokal = node)
+# -------------------------
+def run_distributed(n_workers=4, address=("127.0.0.1", 0), staleness_discount=0.9,
+                    staleness_tolerance=None, **worker_kwargs):
+    if staleness_tolerance is None:
+        staleness_tolerance = n_workers  # satu putaran push dari worker lain masih dianggap segar
+    parent_conn, child_conn = mp.Pipe()
+    server = mp.Process(target=serve, args=(address, child_conn, staleness_discount, staleness_tolerance))
+    server.start()
+    address = parent_conn.recv()
+    if isinstance(address, list):
+        address = tuple(address)
+
+    results = mp.Queue()
+    base_seed = worker_kwargs.pop("seed", None)
+    workers = [mp.Process(target=run_worker, args=(wid, address),
+                          kwargs=dict(worker_kwargs, seed=None if base_seed is None else base_seed + wid,
+                                      result_queue=results))
+               for wid in range(n_workers)]
+    for w in workers:
+        w.start()
+    worker_results = sorted((results.get() for _ in workers), key=lambda r: r["worker"])
+    for w in workers:
+        w.join()
+
+    client = QTableClient(address)
+    version, q_table = client.pull()
+    stats = client.stats()
+    client.stop()
+    client.close()
+    server.join()
+    return q_table, stats, worker_results
+
+
+if __name__ == "__main__":
+    q_table, stats, worker_results = run_distributed(n_workers=4, episodes=100, steps_per_episode=30, seed=42)
+    print(f"Server: versi={stats['version']} push={stats['pushes']} entri={stats['entries']}")
+    for r in worker_results:
+        last = r["rewards"][-10:]
+        print(f"Worker {r['worker']}: langkah={r['steps']} rata-rata reward 10 episode terakhir="
+              f"{sum(last) / len(last):.1f} faktor staleness rata-rata={r['mean_stale_factor']:.3f}")
+    with open("qtable_parameter_server.pkl", "wb") as f:
+        pickle.dump(q_table, f)
+    print("💾 Q-table global disimpan ke qtable_parameter_server.pkl")
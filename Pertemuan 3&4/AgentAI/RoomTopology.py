@@ -0,0 +1,156 @@
+# room_topology.py
+# Topologi ruangan untuk Vacuum World
+# - Ruangan = node pada grid 4-arah (seperti Pertemuan 5&6/StateSpace.py) atau graph bebas
+# - All-pairs shortest path (jarak + next-hop) dihitung SEKALI dengan NumPy:
+#     * graph tanpa bobot -> BFS serentak dari semua sumber
+#     * graph berbobot    -> Floyd-Warshall
+# - Setelah itu: jarak(a, b) dan langkah berikutnya menuju target = lookup O(1)
+
+import numpy as np
+
+class RoomTopology:
+    def __init__(self, room_names, edges, weights=None, coords=None):
+        """
+        room_names: list nama ruangan, contoh ['room-A', 'room-B', 'room-C']
+        edges: list pasangan (room_u, room_v), graph tidak berarah
+        weights: optional list bobot per edge (default semua 1 -> BFS)
+        coords: optional dict room -> (x, y) untuk layout/visualisasi
+        """
+        self.room_names = list(room_names)
+        self.index = {r: i for i, r in enumerate(self.room_names)}
+        self.coords = dict(coords) if coords else {}
+        n = len(self.room_names)
+
+        self.adjacency = [[] for _ in range(n)]
+        weight_matrix = np.full((n, n), np.inf)
+        np.fill_diagonal(weight_matrix, 0.0)
+        weights = weights if weights is not None else [1] * len(edges)
+        for (u, v), w in zip(edges, weights):
+            i, j = self.index[u], self.index[v]
+            if w < weight_matrix[i, j]:
+                if not np.isfinite(weight_matrix[i, j]):
+                    self.adjacency[i].append(j)
+                    self.adjacency[j].append(i)
+                weight_matrix[i, j] = weight_matrix[j, i] = w
+
+        self.weighted = any(w != 1 for w in weights)
+        if self.weighted:
+            self.dist, self.next_hop_idx = self._floyd_warshall(weight_matrix)
+        else:
+            self.dist, self.next_hop_idx = self._bfs_all_pairs()
+
+    # -------------------------
+    # Konstruktor
+    # -------------------------
+    @classmethod
+    def from_grid(cls, rows, cols, obstacles=None):
+        """Grid rows x cols, gerakan 4 arah. obstacles: set (x, y) yang bukan ruangan."""
+        obstacles = set(obstacles or ())
+        cells = [(x, y) for x in range(rows) for y in range(cols) if (x, y) not in obstacles]
+        name = {c: f"room-{c[0]}-{c[1]}" for c in cells}
+        edges = []
+        for x, y in cells:
+            for dx, dy in [(0, 1), (1, 0)]:  # cukup kanan & bawah, graph tidak berarah
+                nb = (x + dx, y + dy)
+                if nb in name:
+                    edges.append((name[(x, y)], name[nb]))
+        return cls([name[c] for c in cells], edges, coords={name[c]: c for c in cells})
+
+    @classmethod
+    def fully_connected(cls, room_names):
+        """Perilaku lama: setiap ruangan berjarak satu langkah dari ruangan lain."""
+        rooms = list(room_names)
+        edges = [(a, b) for i, a in enumerate(rooms) for b in rooms[i + 1:]]
+        return cls(rooms, edges)
+
+    # -------------------------
+    # All-pairs shortest path
+    # -------------------------
+    def _neighbor_table(self):
+        # tabel tetangga (n, max_deg), slot kosong menunjuk ke kolom dummy n
+        n = len(self.room_names)
+        max_deg = max((len(a) for a in self.adjacency), default=0)
+        table = np.full((n, max(max_deg, 1)), n, dtype=np.int64)
+        for i, nbrs in enumerate(self.adjacency):
+            table[i, :len(nbrs)] = nbrs
+        return table
+
+    def _bfs_all_pairs(self):
+        n = len(self.room_names)
+        table = self._neighbor_table()
+        dist = np.full((n, n), np.inf)
+        np.fill_diagonal(dist, 0.0)
+        # frontier[s, v] = True jika v ada di level BFS saat ini dari sumber s
+        frontier = np.zeros((n, n + 1), dtype=bool)
+        frontier[np.arange(n), np.arange(n)] = True
+        reached = frontier[:, :n].copy()
+        level = 0
+        while frontier.any():
+            level += 1
+            nxt = np.zeros((n, n + 1), dtype=bool)
+            for c in range(table.shape[1]):
+                nxt[:, :n] |= frontier[:, table[:, c]]
+            nxt[:, :n] &= ~reached
+            reached |= nxt[:, :n]
+            dist[nxt[:, :n]] = level
+            frontier = nxt
+
+        # next_hop[i, j] = tetangga u dari i dengan dist[u, j] == dist[i, j] - 1
+        next_hop = np.full((n, n), -1, dtype=np.int64)
+        padded = np.vstack([dist, np.full((1, n), np.inf)])
+        reachable = np.isfinite(dist)
+        for c in range(table.shape[1]):
+            u = table[:, c]
+            ok = reachable & (padded[u] == dist - 1) & (next_hop < 0)
+            next_hop[ok] = np.broadcast_to(u[:, None], (n, n))[ok]
+        np.fill_diagonal(next_hop, np.arange(n))
+        return dist, next_hop
+
+    def _floyd_warshall(self, weight_matrix):
+        n = len(self.room_names)
+        dist = weight_matrix.copy()
+        next_hop = np.where(np.isfinite(dist), np.arange(n)[None, :], -1)
+        for k in range(n):
+            candidate = dist[:, k, None] + dist[None, k, :]
+            better = candidate < dist
+            dist = np.where(better, candidate, dist)
+            next_hop = np.where(better, next_hop[:, k, None], next_hop)
+        return dist, next_hop
+
+    # -------------------------
+    # Query O(1)
+    # -------------------------
+    def distance(self, a, b):
+        return self.dist[self.index[a], self.index[b]]
+
+    def next_hop(self, a, b):
+        """Ruangan berikutnya dari a menuju b (a sendiri jika a == b, None jika tidak terjangkau)."""
+        hop = self.next_hop_idx[self.index[a], self.index[b]]
+        return self.room_names[hop] if hop >= 0 else None
+
+    def neighbors(self, room):
+        return [self.room_names[j] for j in self.adjacency[self.index[room]]]
+
+    def path(self, a, b):
+        if self.next_hop(a, b) is None:
+            return None
+        path = [a]
+        while path[-1] != b:
+            path.append(self.next_hop(path[-1], b))
+        return path
+
+    def nearest(self, room, candidates):
+        """Kandidat dengan jarak tempuh terdekat dari room (None jika kosong/tidak terjangkau)."""
+        candidates = list(candidates)
+        if not candidates:
+            return None
+        d = self.dist[self.index[room], [self.index[c] for c in candidates]]
+        best = int(np.argmin(d))
+        return candidates[best] if np.isfinite(d[best]) else None
+
+
+if __name__ == "__main__":
+    topo = RoomTopology.from_grid(3, 3)
+    print("Jumlah ruangan:", len(topo.room_names))
+    print("Jarak room-0-0 -> room-2-2:", topo.distance("room-0-0", "room-2-2"))
+    print("Jalur:", " -> ".join(topo.path("room-0-0", "room-2-2")))
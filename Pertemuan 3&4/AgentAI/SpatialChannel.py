@@ -0,0 +1,140 @@
+# spatial_channel.py
+# Channel komunikasi berbasis partisi ruang untuk MAS di lantai yang besar
+# - Setiap ruangan masuk ke satu sel grid (cell_size x cell_size ruangan)
+# - Agent hanya subscribe ke sel tempat ia berada + sel tetangga (radius)
+# - Pesan tentang sebuah ruangan hanya dikirim ke subscriber sel ruangan tsb
+#   -> volume pesan O(agent x tetangga), bukan O(agent^2)
+
+class SpatialChannel:
+    def __init__(self, room_cells, radius=1):
+        """
+        room_cells: dict room -> (cx, cy) sel grid tempat ruangan berada
+        radius: jumlah sel tetangga (jarak Chebyshev) yang ikut di-subscribe
+        """
+        self.room_cells = dict(room_cells)
+        self.radius = radius
+        self.cell_rooms = {}
+        for room, cell in self.room_cells.items():
+            self.cell_rooms.setdefault(cell, []).append(room)
+        self.subscribers = {}  # cell -> set(agent_id)
+        self.agent_cell = {}   # agent_id -> sel yang sedang di-subscribe
+        self.inbox = {}        # agent_id -> list pesan
+        self.views = []
+        self.published = 0
+        self.delivered = 0
+
+    @classmethod
+    def from_coords(cls, coords, cell_size=4, radius=1):
+        """coords: dict room -> (x, y), contoh RoomTopology.coords"""
+        cells = {room: (x // cell_size, y // cell_size) for room, (x, y) in coords.items()}
+        return cls(cells, radius=radius)
+
+    @classmethod
+    def from_topology(cls, topology, cell_size=4, radius=1):
+        return cls.from_coords(topology.coords, cell_size=cell_size, radius=radius)
+
+    def cells_near(self, cell):
+        cx, cy = cell
+        r = self.radius
+        return [(cx + dx, cy + dy) for dx in range(-r, r + 1) for dy in range(-r, r + 1)
+                if (cx + dx, cy + dy) in self.cell_rooms]
+
+    def rooms_near(self, room):
+        """Ruangan di sel sendiri + sel tetangga."""
+        return [r for cell in self.cells_near(self.room_cells[room]) for r in self.cell_rooms[cell]]
+
+    def rooms_in_cell(self, room):
+        return self.cell_rooms[self.room_cells[room]]
+
+    # -------------------------
+    # Subscribe / publish
+    # -------------------------
+    def subscribe(self, agent_id, room):
+        """Pindahkan langganan agent ke sel ruangan `room` (no-op jika selnya sama)."""
+        cell = self.room_cells[room]
+        old = self.agent_cell.get(agent_id)
+        if old == cell:
+            return
+        if old is not None:
+            for c in self.cells_near(old):
+                self.subscribers[c].discard(agent_id)
+        for c in self.cells_near(cell):
+            self.subscribers.setdefault(c, set()).add(agent_id)
+        self.agent_cell[agent_id] = cell
+        self.inbox.setdefault(agent_id, [])
+
+    def publish(self, room, message):
+        """Kirim pesan tentang `room` ke semua subscriber sel ruangan tsb."""
+        self.published += 1
+        subs = self.subscribers.get(self.room_cells[room], ())
+        for aid in subs:
+            self.inbox[aid].append(message)
+        self.delivered += len(subs)
+        return len(subs)
+
+    def receive(self, agent_id):
+        msgs = self.inbox.get(agent_id)
+        if not msgs:
+            return []
+        self.inbox[agent_id] = []
+        return msgs
+
+    def clear(self):
+        for aid in self.inbox:
+            self.inbox[aid] = []
+        for view in self.views:
+            view.known.clear()
+
+    def view(self, agent):
+        """Pengganti dict comm_channel untuk Agent di MultiAgentSystemSharedAndChannel.py."""
+        view = ChannelView(self, agent)
+        self.views.append(view)
+        return view
+
+
+class ChannelView:
+    """
+    Tampilan channel per agent dengan antarmuka seperti dict global lama:
+       view.get(room, "dirty"), view[room] = "clean", view.clear()
+    Langganan mengikuti agent.location secara otomatis.
+    """
+    def __init__(self, channel, agent):
+        self.channel = channel
+        self.agent = agent
+        self.known = {}
+
+    def _sync(self):
+        self.channel.subscribe(self.agent.name, self.agent.location)
+        for room, state in self.channel.receive(self.agent.name):
+            self.known[room] = state
+
+    def get(self, room, default=None):
+        self._sync()
+        return self.known.get(room, default)
+
+    def __setitem__(self, room, state):
+        self._sync()
+        self.known[room] = state
+        self.channel.publish(room, (room, state))
+
+    def clear(self):
+        self.known.clear()
+
+    def nearby_rooms(self):
+        return self.channel.rooms_near(self.agent.location)
+
+
+if __name__ == "__main__":
+    import random
+    from RoomTopology import RoomTopology
+
+    topo = RoomTopology.from_grid(40, 40)
+    channel = SpatialChannel.from_topology(topo, cell_size=4)
+    n_agents = 500
+    for i in range(n_agents):
+        channel.subscribe(f"agent{i}", random.choice(topo.room_names))
+    for i in range(n_agents):
+        channel.publish(random.choice(topo.room_names), {"dirty_rooms": []})
+    print(f"{len(topo.room_names)} ruangan, {len(channel.cell_rooms)} sel, {n_agents} agent")
+    print(f"Pesan terkirim (spatial): {channel.delivered}")
+    print(f"Pesan terkirim (global) : {n_agents * n_agents}")
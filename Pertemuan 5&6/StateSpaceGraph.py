@@ -0,0 +1,232 @@
+# state_space_graph.py
+# State space grid tanpa networkx (lihat StateSpace.py untuk versi networkx 3x3)
+# - GridStateSpace: implisit, tetangga dihitung saat dibutuhkan dari id integer (id = x * cols + y),
+#   obstacle disimpan sebagai bytearray 1 byte per sel -> grid 1000x1000 cukup ~1 MB
+# - CSRGraph: adjacency kompak (offsets & indices int32, bobot float32 opsional), dibangun dengan
+#   operasi vektor NumPy dan bisa disimpan / dimuat ulang sebagai memory-map
+# Keduanya punya API tetangga yang sama untuk algoritma search:
+#   num_nodes, neighbors(u), edges(u) -> [(v, bobot)], coords(u) -> (x, y), node_id(x, y)
+
+import os
+import json
+import math
+
+import numpy as np
+
+MOVES_4 = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # atas, bawah, kiri, kanan (sama seperti StateSpace.py)
+MOVES_8 = MOVES_4 + [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+def _obstacle_mask(rows, cols, obstacles):
+    """obstacles: None, iterable (x, y), atau array boolean (rows, cols). Returns array bool (rows, cols)."""
+    if obstacles is None:
+        return np.zeros((rows, cols), dtype=bool)
+    if isinstance(obstacles, np.ndarray):
+        if obstacles.shape != (rows, cols):
+            raise ValueError(f"mask obstacle harus berukuran {(rows, cols)}")
+        return obstacles.astype(bool, copy=False)
+    mask = np.zeros((rows, cols), dtype=bool)
+    cells = np.array(list(obstacles), dtype=np.int64).reshape(-1, 2)
+    if len(cells):
+        mask[cells[:, 0], cells[:, 1]] = True
+    return mask
+
+# -------------------------
+# Representasi implisit
+# -------------------------
+class GridStateSpace:
+    def __init__(self, rows, cols, obstacles=None, diagonal=False):
+        """
+        rows, cols: ukuran grid
+        obstacles: set (x, y) atau array boolean (rows, cols) berisi sel yang tidak bisa dilewati
+        diagonal: True -> gerakan 8 arah (bobot diagonal = sqrt(2))
+        """
+        self.rows = rows
+        self.cols = cols
+        self.moves = MOVES_8 if diagonal else MOVES_4
+        self.move_cost = [math.hypot(dx, dy) for dx, dy in self.moves]
+        self.blocked = bytearray(_obstacle_mask(rows, cols, obstacles).tobytes())
+
+    @property
+    def num_nodes(self):
+        return self.rows * self.cols
+
+    def node_id(self, x, y):
+        return x * self.cols + y
+
+    def coords(self, u):
+        return divmod(u, self.cols)
+
+    def is_free(self, u):
+        return not self.blocked[u]
+
+    def edges(self, u):
+        if self.blocked[u]:
+            return []
+        x, y = divmod(u, self.cols)
+        rows, cols, blocked = self.rows, self.cols, self.blocked
+        result = []
+        for (dx, dy), w in zip(self.moves, self.move_cost):
+            nx_, ny_ = x + dx, y + dy
+            if 0 <= nx_ < rows and 0 <= ny_ < cols:
+                v = nx_ * cols + ny_
+                if not blocked[v]:
+                    result.append((v, w))
+        return result
+
+    def neighbors(self, u):
+        return [v for v, _ in self.edges(u)]
+
+    def obstacle_mask(self):
+        return np.frombuffer(bytes(self.blocked), dtype=bool).reshape(self.rows, self.cols)
+
+    def to_csr(self):
+        return CSRGraph.from_grid(self.rows, self.cols, self.obstacle_mask(),
+                                  diagonal=len(self.moves) == 8)
+
+# -------------------------
+# Representasi CSR
+# -------------------------
+class CSRGraph:
+    def __init__(self, offsets, indices, weights=None, shape=None, coords_array=None):
+        """
+        offsets: int32 (n + 1), tetangga node u = indices[offsets[u]:offsets[u + 1]]
+        indices: int32 (m)
+        weights: optional float32 (m), default semua 1
+        shape: optional (rows, cols) jika graph berasal dari grid (coords dihitung dari id)
+        coords_array: optional float (n, 2) untuk graph bebas (misal koordinat peta)
+        """
+        self.offsets = offsets
+        self.indices = indices
+        self.weights = weights
+        self.shape = tuple(shape) if shape is not None else None
+        self.coords_array = coords_array
+
+    @property
+    def num_nodes(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.indices)
+
+    def node_id(self, x, y):
+        return x * self.shape[1] + y
+
+    def coords(self, u):
+        if self.coords_array is not None:
+            return tuple(self.coords_array[u])
+        return divmod(u, self.shape[1])
+
+    def degree(self, u):
+        return int(self.offsets[u + 1] - self.offsets[u])
+
+    def neighbors(self, u):
+        return self.indices[self.offsets[u]:self.offsets[u + 1]].tolist()
+
+    def edges(self, u):
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        nbrs = self.indices[lo:hi].tolist()
+        if self.weights is None:
+            return [(v, 1.0) for v in nbrs]
+        return list(zip(nbrs, self.weights[lo:hi].tolist()))
+
+    def nbytes(self):
+        return sum(a.nbytes for a in (self.offsets, self.indices, self.weights, self.coords_array)
+                   if a is not None)
+
+    # -------------------------
+    # Konstruktor (vektor NumPy, tanpa loop per node)
+    # -------------------------
+    @classmethod
+    def from_grid(cls, rows, cols, obstacles=None, diagonal=False):
+        blocked = _obstacle_mask(rows, cols, obstacles)
+        free = ~blocked
+        moves = MOVES_8 if diagonal else MOVES_4
+        n = rows * cols
+        ids = np.arange(n, dtype=np.int32).reshape(rows, cols)
+
+        # nbr[:, k] = id tetangga arah k atau -1
+        nbr = np.full((rows, cols, len(moves)), -1, dtype=np.int32)
+        cost = np.empty(len(moves), dtype=np.float32)
+        for k, (dx, dy) in enumerate(moves):
+            cost[k] = math.hypot(dx, dy)
+            src = (slice(max(0, -dx), rows - max(0, dx)), slice(max(0, -dy), cols - max(0, dy)))
+            dst = (slice(max(0, dx), rows - max(0, -dx)), slice(max(0, dy), cols - max(0, -dy)))
+            ok = free[src] & free[dst]
+            nbr[src + (k,)] = np.where(ok, ids[dst], -1)
+        nbr = nbr.reshape(n, len(moves))
+
+        valid = nbr >= 0
+        offsets = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(valid.sum(axis=1), out=offsets[1:])
+        indices = nbr[valid]  # urutan baris -> tetangga per node berurutan
+        weights = None
+        if diagonal:
+            weights = np.broadcast_to(cost, nbr.shape)[valid]
+        return cls(offsets, indices, weights, shape=(rows, cols))
+
+    @classmethod
+    def from_edges(cls, num_nodes, src, dst, weights=None, directed=False, coords_array=None):
+        """Bangun CSR dari array edge (src[i] -> dst[i]). directed=False menambahkan arah balik."""
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        w = None if weights is None else np.asarray(weights, dtype=np.float32)
+        if not directed:
+            src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+            w = None if w is None else np.concatenate([w, w])
+        order = np.lexsort((dst, src))
+        offsets = np.zeros(num_nodes + 1, dtype=np.int32)
+        np.cumsum(np.bincount(src, minlength=num_nodes), out=offsets[1:])
+        indices = dst[order].astype(np.int32)
+        w = None if w is None else w[order]
+        return cls(offsets, indices, w, coords_array=coords_array)
+
+    # -------------------------
+    # Simpan / muat (memory-map)
+    # -------------------------
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        arrays = {"offsets": self.offsets, "indices": self.indices,
+                  "weights": self.weights, "coords": self.coords_array}
+        for name, arr in arrays.items():
+            if arr is not None:
+                np.save(os.path.join(directory, f"{name}.npy"), np.ascontiguousarray(arr))
+        with open(os.path.join(directory, "meta.json"), "w") as f:
+            json.dump({"shape": self.shape, "arrays": [k for k, v in arrays.items() if v is not None]}, f)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """mmap=True -> array dibaca langsung dari disk sesuai kebutuhan (np.load mmap_mode='r')."""
+        with open(os.path.join(directory, "meta.json")) as f:
+            meta = json.load(f)
+        arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r" if mmap else None)
+                  for name in meta["arrays"]}
+        return cls(arrays["offsets"], arrays["indices"], arrays.get("weights"),
+                   shape=meta["shape"], coords_array=arrays.get("coords"))
+
+
+if __name__ == "__main__":
+    import time
+    import tempfile
+
+    rows = cols = 1000
+    rng = np.random.default_rng(0)
+    obstacles = rng.random((rows, cols)) < 0.2
+    obstacles[0, 0] = obstacles[-1, -1] = obstacles[500, 500] = False
+
+    t0 = time.perf_counter()
+    implicit = GridStateSpace(rows, cols, obstacles)
+    t1 = time.perf_counter()
+    csr = CSRGraph.from_grid(rows, cols, obstacles)
+    t2 = time.perf_counter()
+    print(f"Implisit {rows}x{cols}: {(t1 - t0) * 1000:.1f} ms, {len(implicit.blocked) / 1e6:.1f} MB")
+    print(f"CSR {rows}x{cols}: {(t2 - t1) * 1000:.1f} ms, {csr.num_edges} edge, {csr.nbytes() / 1e6:.1f} MB")
+
+    u = implicit.node_id(500, 500)
+    assert sorted(implicit.neighbors(u)) == sorted(csr.neighbors(u))
+    print(f"Tetangga {implicit.coords(u)}: {[csr.coords(v) for v in csr.neighbors(u)]}")
+
+    with tempfile.TemporaryDirectory() as d:
+        csr.save(d)
+        mapped = CSRGraph.load(d, mmap=True)
+        print("CSR memory-mapped:", type(mapped.indices).__name__, mapped.edges(u))
@@ -0,0 +1,313 @@
+# ===============================================================
+# Routing Engine Jaringan Jalan Jakarta (A* dan Dijkstra)
+# Menghasilkan baris dataset_rute_jakarta.csv dari query yang benar-benar dijalankan
+# ---------------------------------------------------------------
+# - Graph jalan dibaca dari file lokal: jakarta_nodes.csv (name, lat, lon)
+#   dan jakarta_roads.csv (from, to, distance_km, time_min), disimpan dalam bentuk CSR
+#   (graph besar: bundle .npy hasil RoadGraphIngest, dimuat dengan RoadNetwork.from_bundle / mmap)
+# - Bobot edge: jarak (km) atau waktu (menit) dengan pengali kondisi & cuaca
+#   (aturan sama dengan PandasIntroduction2: Banjir x1.5, Macet x1.3, Hujan x1.2, Tutup = ruas ditutup)
+#   "Banjir di Slipi" -> hanya ruas yang terhubung ke Slipi, "Macet" saja -> semua ruas
+# - Heuristik A*: jarak haversine x rasio minimum bobot/haversine di seluruh ruas (admissible)
+# - Waktu_Eksekusi = durasi query yang diukur dengan time.perf_counter (detik)
+# Usage: python JakartaRoutingEngine.py
+# ===============================================================
+
+import os
+import re
+import csv
+import math
+from datetime import datetime
+
+import numpy as np
+
+from SearchEngine import astar, dijkstra, bidirectional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+NODES_FILE = os.path.join(BASE_DIR, "jakarta_nodes.csv")
+ROADS_FILE = os.path.join(BASE_DIR, "jakarta_roads.csv")
+DATA_FILE = "dataset_rute_jakarta.csv"
+
+DATA_COLUMNS = ["Algoritma", "Start", "Goal", "Total_Jarak", "Estimasi_Waktu", "Kondisi",
+                "Waktu_Eksekusi", "Tanggal", "Total_Jarak_km", "Estimasi_Waktu_menit",
+                "Kondisi_Jalan", "Cuaca"]
+
+MULTIPLIERS = {"Banjir": 1.5, "Macet": 1.3, "Hujan": 1.2, "Tutup": math.inf}
+EARTH_RADIUS_KM = 6371.0
+
+# -------------------------------
+# Kondisi jalan & cuaca
+# -------------------------------
+def parse_conditions(kondisi="Normal", cuaca="Cerah"):
+    """
+    'Banjir di Slipi, Macet' + 'Hujan' -> [('Banjir', 'Slipi'), ('Macet', None), ('Hujan', None)]
+    Lokasi None berarti berlaku untuk semua ruas.
+    """
+    result = []
+    for part in re.split(r",|;|\bdan\b", kondisi or ""):
+        part = part.strip()
+        if not part or part.title() == "Normal":
+            continue
+        m = re.match(r"(\w+)(?:\s+di\s+(.+))?$", part, flags=re.IGNORECASE)
+        if not m or m.group(1).title() not in MULTIPLIERS:
+            raise ValueError(f"Kondisi tidak dikenali: {part!r}")
+        result.append((m.group(1).title(), m.group(2).strip() if m.group(2) else None))
+    if cuaca and cuaca.title() in MULTIPLIERS:
+        result.append((cuaca.title(), None))
+    return result
+
+def kondisi_jalan(kondisi):
+    """Kategori untuk kolom Kondisi_Jalan: 'Banjir di Slipi' -> 'Banjir'."""
+    parsed = parse_conditions(kondisi, None)
+    return parsed[0][0] if parsed else "Normal"
+
+def haversine(lat1, lon1, lat2, lon2):
+    dlat, dlon = lat2 - lat1, lon2 - lon1
+    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+# -------------------------------
+# Jaringan jalan (CSR)
+# -------------------------------
+class RoadNetwork:
+    def __init__(self, names, lat, lon, src, dst, distance_km, time_min):
+        """
+        names: nama node; lat, lon: derajat
+        src, dst, distance_km, time_min: satu baris per ruas (tidak berarah)
+        """
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.lat = np.radians(np.asarray(lat, dtype=float))
+        self.lon = np.radians(np.asarray(lon, dtype=float))
+        self.road_src = np.asarray(src, dtype=np.int32)
+        self.road_dst = np.asarray(dst, dtype=np.int32)
+        self.distance_km = np.asarray(distance_km, dtype=float)
+        self.time_min = np.asarray(time_min, dtype=float)
+
+        # CSR dua arah; road_of[k] = nomor ruas untuk slot k
+        n = len(self.names)
+        s = np.concatenate([self.road_src, self.road_dst])
+        d = np.concatenate([self.road_dst, self.road_src])
+        road = np.concatenate([np.arange(len(self.road_src))] * 2)
+        order = np.lexsort((d, s))
+        self.offsets = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(s, minlength=n), out=self.offsets[1:])
+        self.indices = d[order].astype(np.int32)
+        self.road_of = road[order].astype(np.int32)
+
+        # rasio minimum bobot / jarak garis lurus -> skala heuristik yang tetap admissible
+        straight = np.array([self._haversine(u, v) for u, v in zip(self.road_src, self.road_dst)])
+        ok = straight > 0
+        self.h_scale = {
+            "distance": float((self.distance_km[ok] / straight[ok]).min()) if ok.any() else 0.0,
+            "time": float((self.time_min[ok] / straight[ok]).min()) if ok.any() else 0.0,
+        }
+
+    @classmethod
+    def from_csv(cls, nodes_file=NODES_FILE, roads_file=ROADS_FILE):
+        with open(nodes_file, newline="", encoding="utf-8") as f:
+            nodes = list(csv.DictReader(f))
+        names = [r["name"] for r in nodes]
+        index = {name: i for i, name in enumerate(names)}
+        with open(roads_file, newline="", encoding="utf-8") as f:
+            roads = list(csv.DictReader(f))
+        return cls(names, [float(r["lat"]) for r in nodes], [float(r["lon"]) for r in nodes],
+                   [index[r["from"]] for r in roads], [index[r["to"]] for r in roads],
+                   [float(r["distance_km"]) for r in roads], [float(r["time_min"]) for r in roads])
+
+    @classmethod
+    def from_bundle(cls, bundle_dir, mmap=True):
+        """Bundle CSR dari RoadGraphIngest (array np.memmap, tanpa membangun ulang CSR / h_scale)."""
+        from RoadGraphIngest import load_bundle
+        meta, arrays, names, index = load_bundle(bundle_dir, mmap)
+        network = cls.__new__(cls)
+        network.names, network.index = names, index
+        for name in ("lat", "lon", "road_src", "road_dst", "distance_km", "time_min",
+                     "offsets", "indices", "road_of"):
+            setattr(network, name, arrays[name])
+        network.h_scale = meta["h_scale"]
+        return network
+
+    @property
+    def num_nodes(self):
+        return len(self.names)
+
+    def node_id(self, name):
+        if name not in self.index:
+            raise KeyError(f"Lokasi tidak ada di peta: {name!r}")
+        return self.index[name]
+
+    def _haversine(self, u, v):
+        return haversine(self.lat[u], self.lon[u], self.lat[v], self.lon[v])
+
+    def road_between(self, u, v, slot_weights):
+        """Nomor ruas u -> v dengan bobot terkecil (jika ada ruas paralel)."""
+        slots = [k for k in range(self.offsets[u], self.offsets[u + 1]) if self.indices[k] == v]
+        return self.road_of[min(slots, key=lambda k: slot_weights[k])]
+
+    def roads_at(self, name):
+        """Nomor ruas yang terhubung ke lokasi `name`."""
+        u = self.node_id(name)
+        return np.flatnonzero((self.road_src == u) | (self.road_dst == u))
+
+    def road_multipliers(self, kondisi="Normal", cuaca="Cerah"):
+        """Pengali waktu per ruas (inf = ruas ditutup)."""
+        mult = np.ones(len(self.road_src))
+        for name, place in parse_conditions(kondisi, cuaca):
+            if place is None:
+                mask = slice(None)
+            else:
+                mask = self.roads_at(place)
+            mult[mask] *= MULTIPLIERS[name]
+        return mult
+
+    def road_weights(self, metric="time", kondisi="Normal", cuaca="Cerah", extra=None):
+        """Bobot per ruas. extra: optional pengali tambahan per ruas (misal kondisi live)."""
+        if metric not in ("time", "distance"):
+            raise ValueError("metric harus 'time' atau 'distance'")
+        mult = self.road_multipliers(kondisi, cuaca)
+        if extra is not None:
+            mult = mult * extra
+        if metric == "time":
+            return self.time_min * mult
+        return np.where(np.isinf(mult), np.inf, self.distance_km)
+
+    def view(self, metric="time", kondisi="Normal", cuaca="Cerah", extra=None):
+        """Graph berbobot (API tetangga SearchEngine) untuk satu metrik + kondisi."""
+        weights = self.road_weights(metric, kondisi, cuaca, extra)
+        # bobot waktu (dengan extra yang sama) untuk Estimasi_Waktu jika routing per jarak
+        time_weights = weights if metric == "time" else self.road_weights("time", kondisi, cuaca, extra)
+        return RoadView(self, weights, metric, time_weights)
+
+    def heuristic(self, metric="time"):
+        scale = self.h_scale[metric]
+        lat, lon = self.lat.tolist(), self.lon.tolist()
+        def h(u, goal):
+            return scale * haversine(lat[u], lon[u], lat[goal], lon[goal])
+        return h
+
+
+class RoadView:
+    def __init__(self, network, road_weights, metric, time_weights=None):
+        self.network = network
+        self.metric = metric
+        self.road_weights = road_weights
+        self.time_weights = road_weights if time_weights is None else time_weights
+        self.slot_weights = slot_weights = road_weights[network.road_of]
+        offsets, indices = network.offsets.tolist(), network.indices.tolist()
+        weights = slot_weights.tolist()
+        # adjacency list sekali bangun, ruas tertutup (inf) tidak dimasukkan
+        self.adj = [[(indices[k], weights[k]) for k in range(offsets[u], offsets[u + 1])
+                     if weights[k] != math.inf] for u in range(network.num_nodes)]
+
+    @property
+    def num_nodes(self):
+        return self.network.num_nodes
+
+    def edges(self, u):
+        return self.adj[u]
+
+    def neighbors(self, u):
+        return [v for v, _ in self.adj[u]]
+
+    def coords(self, u):
+        return self.network.lat[u], self.network.lon[u]
+
+# -------------------------------
+# Query rute
+# -------------------------------
+ALGORITHMS = {
+    "A*": lambda view, s, t, h: astar(view, s, t, h),
+    "Dijkstra": lambda view, s, t, h: dijkstra(view, s, t),
+    "Bidirectional A*": lambda view, s, t, h: bidirectional(view, s, t, h),
+}
+
+def route(network, start, goal, algorithm="A*", metric="time", kondisi="Normal", cuaca="Cerah", view=None):
+    """
+    Jalankan satu query. Returns dict: path (nama), jarak_km, waktu_menit, expanded, runtime (detik).
+    runtime hanya mencakup search (graph berbobot sudah dibangun sebelumnya).
+    """
+    view = view or network.view(metric, kondisi, cuaca)
+    s, t = network.node_id(start), network.node_id(goal)
+    result = ALGORITHMS[algorithm](view, s, t, network.heuristic(view.metric))
+    path = result["path"]
+
+    jarak = waktu = math.inf
+    roads = []
+    if path:
+        time_w = view.time_weights
+        jarak = waktu = 0.0
+        for u, v in zip(path, path[1:]):
+            r = int(network.road_between(u, v, view.slot_weights))
+            roads.append(r)
+            jarak += network.distance_km[r]
+            waktu += time_w[r]
+    return {"algorithm": algorithm, "start": start, "goal": goal,
+            "path": [network.names[u] for u in path], "roads": roads, "jarak_km": jarak, "waktu_menit": waktu,
+            "cost": result["cost"], "expanded": result["expanded"], "runtime": result["runtime"],
+            "kondisi": kondisi, "cuaca": cuaca}
+
+def to_row(result, tanggal=None):
+    """Hasil route() -> baris dengan kolom dataset_rute_jakarta.csv."""
+    jarak = round(result["jarak_km"], 2)
+    waktu = round(result["waktu_menit"], 2)
+    return {
+        "Algoritma": result["algorithm"],
+        "Start": result["start"],
+        "Goal": result["goal"],
+        "Total_Jarak": jarak,
+        "Estimasi_Waktu": waktu,
+        "Kondisi": result["kondisi"],
+        "Waktu_Eksekusi": f"{result['runtime']:.6f}",
+        "Tanggal": tanggal or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "Total_Jarak_km": jarak,
+        "Estimasi_Waktu_menit": waktu,
+        "Kondisi_Jalan": kondisi_jalan(result["kondisi"]),
+        "Cuaca": result["cuaca"],
+    }
+
+def append_rows(rows, data_file=DATA_FILE):
+    """Tambahkan baris ke CSV (header file yang sudah ada dipertahankan)."""
+    header = DATA_COLUMNS
+    exists = os.path.exists(data_file) and os.path.getsize(data_file) > 0
+    if exists:
+        with open(data_file, newline="", encoding="utf-8") as f:
+            header = next(csv.reader(f))
+    with open(data_file, "a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=header, extrasaction="ignore")
+        if not exists:
+            writer.writeheader()
+        writer.writerows(rows)
+
+def run_experiments(network, queries, algorithms=("A*", "Dijkstra"), metric="time", data_file=DATA_FILE):
+    """
+    queries: list (start, goal, kondisi, cuaca)
+    Setiap query dijalankan dengan semua algoritma, hasilnya ditambahkan ke data_file (None = tidak disimpan).
+    """
+    results = []
+    for start, goal, kondisi, cuaca in queries:
+        view = network.view(metric, kondisi, cuaca)
+        for algorithm in algorithms:
+            results.append(route(network, start, goal, algorithm, metric, kondisi, cuaca, view=view))
+    if data_file:
+        tanggal = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        append_rows([to_row(r, tanggal) for r in results], data_file)
+    return results
+
+
+if __name__ == "__main__":
+    network = RoadNetwork.from_csv()
+    queries = [
+        ("Kebon Jeruk", "Kota Tua", "Normal", "Cerah"),
+        ("Kebon Jeruk", "Kota Tua", "Banjir di Slipi", "Hujan"),
+        ("Kebon Jeruk", "Kota Tua", "Macet di Tanah Abang", "Cerah"),
+        ("Kebon Jeruk", "Kota Tua", "Tutup di Monas", "Hujan"),
+        ("Palmerah", "Senen", "Banjir di Monas, Macet di Kuningan", "Hujan"),
+    ]
+    results = run_experiments(network, queries)
+    print("=== Routing Engine Jakarta ===")
+    for r in results:
+        print(f"{r['algorithm']:9} {r['kondisi']:36} {r['cuaca']:6} {' → '.join(r['path'])}")
+        print(f"{'':9} {r['jarak_km']:.1f} km | {r['waktu_menit']:.1f} menit | "
+              f"ekspansi={r['expanded']} | {r['runtime'] * 1e6:.0f} µs")
+    print(f"\n{len(results)} baris ditambahkan ke '{DATA_FILE}'")
@@ -0,0 +1,390 @@
+# ===============================================================
+# Ingest Graph Jalan -> Bundle CSR Biner (memory-mapped)
+# ---------------------------------------------------------------
+# - Graph jalan nyata (ratusan ribu ruas) terlalu lambat & boros jika dibangun sebagai networkx /
+#   dict Python (seperti StateSpace.py) atau lewat RoadNetwork.from_csv setiap kali program jalan
+# - Konversi SEKALI dari file lokal:
+#     * edge list CSV (format jakarta_roads.csv: from, to, distance_km, [time_min]) + nodes CSV (name, lat, lon)
+#     * ekstrak OSM XML (.osm): way dengan tag highway -> ruas antar node berurutan,
+#       node bernama (misal place "Kebon Jeruk") di-snap ke node jalan terdekat
+# - Bundle = folder berisi .npy + meta.json:
+#     lat, lon (radian, float64), offsets, indices, road_of, road_src, road_dst (int32),
+#     distance_km, time_min (float32), nama node + indeks nama -> node (bytes + offset, terurut)
+# - Load = np.load(mmap_mode="r") (np.memmap): hitungan milidetik, halaman file dibagi antar proses
+#   worker lewat page cache OS (tidak ada salinan per proses)
+# - RoadNetwork.from_bundle(folder) -> RoadNetwork yang langsung bisa dipakai route()/A*/Dijkstra
+# Usage: python RoadGraphIngest.py
+# ===============================================================
+
+import os
+import json
+import math
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pandas as pd
+
+BUNDLE_VERSION = 1
+EARTH_RADIUS_KM = 6371.0
+DEFAULT_SPEED_KMH = 30.0
+# kecepatan default (km/jam) per jenis jalan OSM jika tag maxspeed tidak ada
+HIGHWAY_SPEEDS = {
+    "motorway": 80, "trunk": 60, "primary": 40, "secondary": 35, "tertiary": 30,
+    "unclassified": 25, "residential": 20, "service": 15, "living_street": 10,
+    "motorway_link": 50, "trunk_link": 40, "primary_link": 30, "secondary_link": 30, "tertiary_link": 25,
+}
+
+# -------------------------------
+# Tabel nama (dibaca langsung dari array mmap)
+# -------------------------------
+def _encode_strings(strings):
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return blob, offsets
+
+
+class NameTable:
+    """Urutan nama node (seperti list): names[u], len(names), slicing, iterasi."""
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self.blob[self.offsets[i]:self.offsets[i + 1]].tobytes().decode("utf-8")
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class NameIndex:
+    """Nama -> node (seperti dict): binary search di kunci terurut, tanpa membangun dict di memori."""
+    def __init__(self, blob, offsets, nodes):
+        self.keys = NameTable(blob, offsets)
+        self.nodes = nodes
+
+    def _find(self, name):
+        key = name.encode("utf-8")
+        lo, hi = 0, len(self.keys)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            k = self.keys.blob[self.keys.offsets[mid]:self.keys.offsets[mid + 1]].tobytes()
+            if k < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self.keys) and self.keys[lo] == name:
+            return int(self.nodes[lo])
+        return None
+
+    def __contains__(self, name):
+        return self._find(name) is not None
+
+    def __getitem__(self, name):
+        node = self._find(name)
+        if node is None:
+            raise KeyError(name)
+        return node
+
+    def get(self, name, default=None):
+        node = self._find(name)
+        return default if node is None else node
+
+    def __len__(self):
+        return len(self.keys)
+
+# -------------------------------
+# Helper vektor
+# -------------------------------
+def haversine_array(lat1, lon1, lat2, lon2):
+    """Haversine (km) vektor, input radian."""
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+def build_csr(num_nodes, src, dst):
+    """CSR dua arah (urutan sama dengan RoadNetwork.__init__). Returns offsets, indices, road_of."""
+    s = np.concatenate([src, dst])
+    d = np.concatenate([dst, src])
+    road = np.concatenate([np.arange(len(src), dtype=np.int32)] * 2)
+    order = np.lexsort((d, s))
+    offsets = np.zeros(num_nodes + 1, dtype=np.int32)
+    np.cumsum(np.bincount(s, minlength=num_nodes), out=offsets[1:])
+    return offsets, d[order].astype(np.int32), road[order]
+
+def heuristic_scale(lat, lon, src, dst, distance_km, time_min):
+    """Rasio minimum bobot / jarak garis lurus (sama dengan RoadNetwork.h_scale)."""
+    straight = haversine_array(lat[src], lon[src], lat[dst], lon[dst])
+    ok = straight > 0
+    if not ok.any():
+        return {"distance": 0.0, "time": 0.0}
+    return {"distance": float((distance_km[ok] / straight[ok]).min()),
+            "time": float((time_min[ok] / straight[ok]).min())}
+
+# -------------------------------
+# Tulis / baca bundle
+# -------------------------------
+def write_bundle(out_dir, names, lat, lon, src, dst, distance_km, time_min=None, aliases=None,
+                 speed_kmh=DEFAULT_SPEED_KMH, source=""):
+    """
+    names, lat, lon (derajat): per node; src, dst (indeks node), distance_km, time_min: per ruas.
+    aliases: optional {nama: node} tambahan untuk indeks nama (misal tempat OSM yang di-snap).
+    Returns meta (dict).
+    """
+    lat = np.radians(np.nan_to_num(np.asarray(lat, dtype=np.float64)))
+    lon = np.radians(np.nan_to_num(np.asarray(lon, dtype=np.float64)))
+    src = np.asarray(src, dtype=np.int32)
+    dst = np.asarray(dst, dtype=np.int32)
+    distance_km = np.asarray(distance_km, dtype=np.float64)
+    if time_min is None:
+        time_min = distance_km / speed_kmh * 60.0
+    time_min = np.asarray(time_min, dtype=np.float64)
+    keep = src != dst  # self-loop tidak berguna untuk routing
+    src, dst, distance_km, time_min = src[keep], dst[keep], distance_km[keep], time_min[keep]
+    n = len(names)
+
+    offsets, indices, road_of = build_csr(n, src, dst)
+    name_blob, name_offsets = _encode_strings(names)
+    keys = list(names) + list((aliases or {}).keys())
+    key_nodes = np.concatenate([np.arange(n, dtype=np.int32),
+                                np.asarray(list((aliases or {}).values()), dtype=np.int32)])
+    order = sorted(range(len(keys)), key=lambda i: keys[i].encode("utf-8"))  # stabil: nama node > alias
+    key_blob, key_offsets = _encode_strings([keys[i] for i in order])
+
+    arrays = {
+        "lat": lat, "lon": lon,
+        "offsets": offsets, "indices": indices, "road_of": road_of,
+        "road_src": src, "road_dst": dst,
+        # float32 cukup untuk bobot; koordinat tetap float64 agar heuristik tetap admissible
+        "distance_km": distance_km.astype(np.float32), "time_min": time_min.astype(np.float32),
+        "name_blob": name_blob, "name_offsets": name_offsets,
+        "key_blob": key_blob, "key_offsets": key_offsets, "key_nodes": key_nodes[order],
+    }
+    os.makedirs(out_dir, exist_ok=True)
+    for name, arr in arrays.items():
+        np.save(os.path.join(out_dir, f"{name}.npy"), np.ascontiguousarray(arr))
+    meta = {
+        "version": BUNDLE_VERSION, "source": source, "num_nodes": n, "num_roads": int(len(src)),
+        "h_scale": heuristic_scale(lat, lon, src, dst, arrays["distance_km"].astype(np.float64),
+                                   arrays["time_min"].astype(np.float64)),
+        "arrays": {name: str(arr.dtype) for name, arr in arrays.items()},
+        "nbytes": int(sum(arr.nbytes for arr in arrays.values())),
+    }
+    with open(os.path.join(out_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=1)
+    return meta
+
+def load_bundle(bundle_dir, mmap=True):
+    """
+    Returns (meta, arrays, names, index). mmap=True -> np.load(mmap_mode="r"):
+    data dibaca dari disk sesuai kebutuhan dan halaman dibagi antar proses.
+    """
+    with open(os.path.join(bundle_dir, "meta.json"), encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("version") != BUNDLE_VERSION:
+        raise ValueError(f"Versi bundle tidak didukung: {meta.get('version')!r}")
+    arrays = {name: np.load(os.path.join(bundle_dir, f"{name}.npy"), mmap_mode="r" if mmap else None)
+              for name in meta["arrays"]}
+    names = NameTable(arrays["name_blob"], arrays["name_offsets"])
+    index = NameIndex(arrays["key_blob"], arrays["key_offsets"], arrays["key_nodes"])
+    return meta, arrays, names, index
+
+# -------------------------------
+# Sumber: edge list CSV
+# -------------------------------
+def ingest_edge_list(roads_file, out_dir, nodes_file=None, speed_kmh=DEFAULT_SPEED_KMH):
+    """
+    roads_file: CSV from, to, distance_km, [time_min] (nama lokasi)
+    nodes_file: CSV name, lat, lon (tanpa file ini koordinat 0 -> heuristik A* = 0, tetap benar)
+    """
+    roads = pd.read_csv(roads_file, dtype={"from": str, "to": str})
+    if nodes_file:
+        nodes = pd.read_csv(nodes_file, dtype={"name": str})
+        names = pd.Index(nodes["name"])
+        lat, lon = nodes["lat"].to_numpy(float), nodes["lon"].to_numpy(float)
+    else:
+        names = pd.Index(pd.unique(pd.concat([roads["from"], roads["to"]], ignore_index=True)))
+        lat = lon = np.zeros(len(names))
+    if not names.is_unique:
+        raise ValueError("Nama node di nodes_file harus unik")
+    src, dst = names.get_indexer(roads["from"]), names.get_indexer(roads["to"])
+    unknown = np.concatenate([roads["from"][src < 0], roads["to"][dst < 0]])
+    if len(unknown):
+        raise ValueError(f"{len(unknown)} ujung ruas tidak ada di nodes_file, misal {unknown[:3].tolist()}")
+    time_min = roads["time_min"].to_numpy(float) if "time_min" in roads else None
+    return write_bundle(out_dir, names.tolist(), lat, lon, src, dst, roads["distance_km"].to_numpy(float),
+                        time_min, speed_kmh=speed_kmh, source=os.path.basename(roads_file))
+
+# -------------------------------
+# Sumber: ekstrak OSM XML
+# -------------------------------
+def _speed(tags):
+    maxspeed = tags.get("maxspeed", "").split()[0] if tags.get("maxspeed") else ""
+    if maxspeed.isdigit():
+        return float(maxspeed)
+    return float(HIGHWAY_SPEEDS.get(tags.get("highway"), DEFAULT_SPEED_KMH))
+
+def ingest_osm(osm_file, out_dir, highways=tuple(HIGHWAY_SPEEDS)):
+    """
+    Ekstrak OSM XML dibaca streaming (iterparse, elemen dibuang setelah diproses).
+    Hanya node yang dipakai way jalan yang menjadi node graph (nama "osm:<id>");
+    node bertag name (tempat/POI) menjadi alias di indeks nama, di-snap ke node jalan terdekat.
+    """
+    node_ids, node_lat, node_lon = [], [], []
+    places = []  # (nama, lat, lon)
+    edge_a, edge_b, edge_speed = [], [], []
+    highways = set(highways)
+
+    context = ET.iterparse(osm_file, events=("start", "end"))
+    _, root = next(context)
+    for event, elem in context:
+        if event != "end":
+            continue
+        if elem.tag == "node":
+            node_ids.append(int(elem.get("id")))
+            node_lat.append(float(elem.get("lat")))
+            node_lon.append(float(elem.get("lon")))
+            for tag in elem.iter("tag"):
+                if tag.get("k") == "name":
+                    places.append((tag.get("v"), node_lat[-1], node_lon[-1]))
+            root.clear()
+        elif elem.tag == "way":
+            tags = {t.get("k"): t.get("v") for t in elem.iter("tag")}
+            if tags.get("highway") in highways:
+                refs = [int(nd.get("ref")) for nd in elem.iter("nd")]
+                speed = _speed(tags)
+                edge_a.extend(refs[:-1])
+                edge_b.extend(refs[1:])
+                edge_speed.extend([speed] * (len(refs) - 1))
+            root.clear()
+
+    # id OSM -> indeks node, hanya node yang dipakai ruas
+    all_ids = np.asarray(node_ids, dtype=np.int64)
+    order = np.argsort(all_ids)
+    a, b = np.asarray(edge_a, dtype=np.int64), np.asarray(edge_b, dtype=np.int64)
+    pos_a = np.searchsorted(all_ids, a, sorter=order)
+    pos_b = np.searchsorted(all_ids, b, sorter=order)
+    pos_a, pos_b = np.minimum(pos_a, len(order) - 1), np.minimum(pos_b, len(order) - 1)
+    found = (all_ids[order[pos_a]] == a) & (all_ids[order[pos_b]] == b)  # ekstrak terpotong di batas
+    a_rows, b_rows = order[pos_a[found]], order[pos_b[found]]
+    used, inverse = np.unique(np.concatenate([a_rows, b_rows]), return_inverse=True)
+    src, dst = inverse[:len(a_rows)], inverse[len(a_rows):]
+
+    lat = np.asarray(node_lat)[used]
+    lon = np.asarray(node_lon)[used]
+    rad_lat, rad_lon = np.radians(lat), np.radians(lon)
+    distance = haversine_array(rad_lat[src], rad_lon[src], rad_lat[dst], rad_lon[dst])
+    time_min = distance / np.asarray(edge_speed)[found] * 60.0
+    names = [f"osm:{i}" for i in all_ids[used].tolist()]
+
+    # snap tempat bernama ke node jalan terdekat (proyeksi equirectangular, cukup untuk skala kota)
+    aliases = {}
+    coslat = math.cos(np.radians(lat.mean())) if len(lat) else 1.0
+    for name, plat, plon in places:
+        if name in aliases or not len(lat):
+            continue
+        aliases[name] = int(np.argmin((lat - plat) ** 2 + ((lon - plon) * coslat) ** 2))
+    return write_bundle(out_dir, names, lat, lon, src, dst, distance, time_min, aliases,
+                        source=os.path.basename(osm_file))
+
+
+if __name__ == "__main__":
+    import time
+    import tempfile
+    import multiprocessing as mp
+
+    from JakartaRoutingEngine import NODES_FILE, ROADS_FILE, RoadNetwork, route
+
+    def _worker(bundle_dir):
+        t0 = time.perf_counter()
+        network = RoadNetwork.from_bundle(bundle_dir)
+        t_load = time.perf_counter() - t0
+        r = route(network, network.names[0], network.names[-1], "A*")
+        return os.getpid(), t_load, r["waktu_menit"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 1) Jaringan Jakarta dari file CSV yang ada
+        small = os.path.join(tmp, "jakarta")
+        ingest_edge_list(ROADS_FILE, small, NODES_FILE)
+        network = RoadNetwork.from_bundle(small)
+        r = route(network, "Kebon Jeruk", "Kota Tua", "A*", "time", "Banjir di Slipi", "Hujan")
+        ref = route(RoadNetwork.from_csv(), "Kebon Jeruk", "Kota Tua", "A*", "time", "Banjir di Slipi", "Hujan")
+        print(f"Bundle Jakarta: {' → '.join(r['path'])} | {r['waktu_menit']:.1f} menit "
+              f"(from_csv: {ref['waktu_menit']:.1f} menit)")
+
+        # 2) Edge list sintetis ~320 ribu ruas
+        rows = cols = 400
+        rng = np.random.default_rng(0)
+        ids = np.arange(rows * cols).reshape(rows, cols)
+        names = np.array([f"N{i}" for i in range(rows * cols)])
+        src = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+        dst = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+        distance = 0.5 * rng.uniform(1.0, 1.6, len(src))
+        nodes_csv, roads_csv = os.path.join(tmp, "nodes.csv"), os.path.join(tmp, "roads.csv")
+        pd.DataFrame({"name": names, "lat": -6.30 + np.repeat(np.arange(rows), cols) * 0.5 / 111.0,
+                      "lon": 106.70 + np.tile(np.arange(cols), rows) * 0.5 / 111.0}).to_csv(nodes_csv, index=False)
+        pd.DataFrame({"from": names[src], "to": names[dst], "distance_km": distance.round(3),
+                      "time_min": (distance * rng.uniform(1.5, 4.0, len(src))).round(3)}).to_csv(roads_csv, index=False)
+
+        t0 = time.perf_counter()
+        baseline = RoadNetwork.from_csv(nodes_csv, roads_csv)
+        t_csv = time.perf_counter() - t0
+        big = os.path.join(tmp, "grid")
+        t0 = time.perf_counter()
+        meta = ingest_edge_list(roads_csv, big, nodes_csv)
+        t_ingest = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        network = RoadNetwork.from_bundle(big)
+        t_load = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        node = network.node_id("N123456")
+        t_lookup = time.perf_counter() - t0
+        assert network.names[node] == "N123456" and np.array_equal(network.indices, baseline.indices)
+        print(f"\nGrid {rows}x{cols}: {meta['num_nodes']} node, {meta['num_roads']} ruas, "
+              f"bundle {meta['nbytes'] / 1e6:.1f} MB")
+        print(f"  RoadNetwork.from_csv   : {t_csv * 1000:8.1f} ms (setiap program jalan)")
+        print(f"  ingest (sekali)        : {t_ingest * 1000:8.1f} ms")
+        print(f"  RoadNetwork.from_bundle: {t_load * 1000:8.1f} ms, lookup nama {t_lookup * 1e6:.0f} µs")
+        try:
+            import networkx as nx
+            t0 = time.perf_counter()
+            nx.from_pandas_edgelist(pd.read_csv(roads_csv), "from", "to", ["distance_km", "time_min"])
+            print(f"  networkx dari CSV      : {(time.perf_counter() - t0) * 1000:8.1f} ms")
+        except ImportError:
+            pass
+
+        # 3) Worker process memakai bundle yang sama (mmap -> page cache bersama)
+        with mp.Pool(2) as pool:
+            for pid, t, waktu in pool.map(_worker, [big, big]):
+                print(f"  worker {pid}: load {t * 1000:.1f} ms, N0 → N{rows * cols - 1} {waktu:.1f} menit")
+
+        # 4) Ekstrak OSM kecil
+        osm = os.path.join(tmp, "mini.osm")
+        with open(osm, "w", encoding="utf-8") as f:
+            f.write("""<?xml version="1.0" encoding="UTF-8"?>
+<osm version="0.6">
+ <node id="1" lat="-6.1930" lon="106.7690"/>
+ <node id="2" lat="-6.2000" lon="106.7800"/>
+ <node id="3" lat="-6.2070" lon="106.7970"/>
+ <node id="4" lat="-6.1870" lon="106.8000"/>
+ <node id="10" lat="-6.1931" lon="106.7692"><tag k="place" v="suburb"/><tag k="name" v="Kebon Jeruk"/></node>
+ <node id="11" lat="-6.2069" lon="106.7968"><tag k="place" v="suburb"/><tag k="name" v="Palmerah"/></node>
+ <way id="100"><nd ref="1"/><nd ref="2"/><nd ref="3"/><tag k="highway" v="primary"/></way>
+ <way id="101"><nd ref="1"/><nd ref="4"/><nd ref="3"/><tag k="highway" v="residential"/><tag k="maxspeed" v="20"/></way>
+ <way id="102"><nd ref="2"/><nd ref="4"/><tag k="waterway" v="canal"/></way>
+</osm>""")
+        ingest_osm(osm, os.path.join(tmp, "osm"))
+        network = RoadNetwork.from_bundle(os.path.join(tmp, "osm"))
+        r = route(network, "Kebon Jeruk", "Palmerah", "A*")
+        print(f"\nOSM: Kebon Jeruk → Palmerah = {' → '.join(r['path'])} | "
+              f"{r['jarak_km']:.2f} km | {r['waktu_menit']:.1f} menit")
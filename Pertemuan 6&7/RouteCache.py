@@ -0,0 +1,166 @@
+# ===============================================================
+# Route Cache di depan A* / Dijkstra (JakartaRoutingEngine)
+# ---------------------------------------------------------------
+# - Key: (Start, Goal, Algoritma, profil kondisi) dengan profil = (metric, Kondisi, Cuaca)
+# - Eviction: LRU (kapasitas) + TTL (umur entri)
+# - Reverse index ruas -> key: saat kondisi satu ruas berubah (laporan banjir/macet live),
+#   hanya rute yang melewati ruas tersebut yang dibuang dari cache
+# - Metrik: hits, misses, evictions, expirations, invalidations, hit_rate
+# ===============================================================
+
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from JakartaRoutingEngine import RoadNetwork, route
+
+class RouteCache:
+    def __init__(self, capacity=10_000, ttl=300.0, clock=time.monotonic):
+        """
+        capacity: jumlah rute maksimum (LRU)
+        ttl: umur maksimum entri dalam detik (None = tanpa TTL)
+        clock: sumber waktu (bisa diganti untuk simulasi)
+        """
+        self.capacity = capacity
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = OrderedDict()  # key -> (expires_at, value, roads)
+        self._by_road = {}  # ruas -> set key
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value, _ = entry
+        if expires_at is not None and self.clock() >= expires_at:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value, roads=()):
+        if key in self._entries:
+            self._remove(key)
+        while len(self._entries) >= self.capacity:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+        expires_at = self.clock() + self.ttl if self.ttl is not None else None
+        roads = frozenset(roads)
+        self._entries[key] = (expires_at, value, roads)
+        for r in roads:
+            self._by_road.setdefault(r, set()).add(key)
+
+    def _remove(self, key):
+        _, _, roads = self._entries.pop(key)
+        for r in roads:
+            keys = self._by_road.get(r)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_road[r]
+
+    def invalidate_roads(self, roads):
+        """Buang semua rute yang melewati salah satu ruas. Returns jumlah rute yang dibuang."""
+        keys = set()
+        for r in roads:
+            keys |= self._by_road.get(int(r), set())
+        for key in keys:
+            self._remove(key)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self):
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._by_road.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0, "evictions": self.evictions,
+                "expirations": self.expirations, "invalidations": self.invalidations,
+                "indexed_roads": len(self._by_road)}
+
+
+class CachedRouter:
+    """route() dengan cache + kondisi live per ruas (pengali tambahan di atas Kondisi/Cuaca)."""
+    def __init__(self, network, capacity=10_000, ttl=300.0, clock=time.monotonic):
+        self.network = network
+        self.cache = RouteCache(capacity, ttl, clock)
+        self.live = np.ones(len(network.road_src))  # pengali live per ruas
+        self._views = {}  # profil -> RoadView (bangun graph berbobot hanya sekali per profil)
+
+    def _view(self, profile):
+        view = self._views.get(profile)
+        if view is None:
+            view = self._views[profile] = self.network.view(*profile, extra=self.live)
+        return view
+
+    def route(self, start, goal, algorithm="A*", metric="time", kondisi="Normal", cuaca="Cerah"):
+        profile = (metric, kondisi, cuaca)
+        key = (start, goal, algorithm, profile)
+        result = self.cache.get(key)
+        if result is not None:
+            return dict(result, cached=True)
+        result = route(self.network, start, goal, algorithm, metric, kondisi, cuaca,
+                       view=self._view(profile))
+        self.cache.put(key, result, result["roads"])
+        return dict(result, cached=False)
+
+    def set_live_condition(self, roads=None, place=None, multiplier=1.0):
+        """
+        Ubah pengali live untuk ruas tertentu (atau semua ruas di `place`), misal banjir mendadak.
+        Kenaikan bobot: hanya rute yang melewati ruas itu yang dibuang.
+        Penurunan bobot (kondisi pulih): rute lain bisa jadi lebih murah lewat ruas itu,
+        jadi seluruh cache dibuang.
+        """
+        roads = list(roads or []) + (list(self.network.roads_at(place)) if place else [])
+        roads = np.asarray(roads, dtype=int)
+        old = self.live[roads].copy()
+        self.live[roads] = multiplier
+        self._views.clear()
+        if np.any(multiplier < old):
+            n = len(self.cache)
+            self.cache.clear()
+            return n
+        return self.cache.invalidate_roads(roads[multiplier != old])
+
+    def stats(self):
+        return self.cache.stats()
+
+
+if __name__ == "__main__":
+    import random
+
+    router = CachedRouter(RoadNetwork.from_csv(), capacity=100, ttl=60.0)
+    places = router.network.names
+    rng = random.Random(0)
+    profiles = [("Normal", "Cerah"), ("Banjir di Slipi", "Hujan"), ("Macet di Senen", "Cerah")]
+    for _ in range(500):
+        start, goal = rng.sample(places, 2)
+        kondisi, cuaca = rng.choice(profiles)
+        router.route(start, goal, rng.choice(["A*", "Dijkstra"]), "time", kondisi, cuaca)
+    print("Setelah 500 query :", router.stats())
+
+    r = router.route("Kebon Jeruk", "Kota Tua")
+    print(f"Kebon Jeruk → Kota Tua: {' → '.join(r['path'])} | {r['waktu_menit']:.1f} menit | cached={r['cached']}")
+    removed = router.set_live_condition(place="Tanah Abang", multiplier=3.0)
+    print(f"Banjir live di Tanah Abang -> {removed} rute dibuang, sisa {len(router.cache)}")
+    r = router.route("Kebon Jeruk", "Kota Tua")
+    print(f"Kebon Jeruk → Kota Tua: {' → '.join(r['path'])} | {r['waktu_menit']:.1f} menit | cached={r['cached']}")
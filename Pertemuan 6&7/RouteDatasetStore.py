@@ -0,0 +1,247 @@
+# ==========================================================
+# Penyimpanan Dataset Rute Jakarta dalam format Parquet (kolumnar, terpartisi)
+# ----------------------------------------------------------
+# - Pengganti df.to_csv("dataset_rute_jakarta.csv") yang menulis ulang seluruh file:
+#   hasil baru ditambahkan sebagai file Parquet baru per partisi tanggal (tanggal=YYYY-MM-DD)
+# - Kolom ganda dari CSV digabung: Total_Jarak -> Total_Jarak_km, Estimasi_Waktu -> Estimasi_Waktu_menit
+#   (Kondisi = teks lengkap "Banjir di Slipi", Kondisi_Jalan = kategori "Banjir" untuk filter,
+#   Banjir = True jika teks Kondisi memuat "Banjir" di posisi mana pun, dihitung saat ditulis)
+# - Algoritma, Start, Goal, Kondisi, Kondisi_Jalan, Cuaca disimpan sebagai kategori (dictionary),
+#   angka di-downcast ke float32
+# - Baca dengan proyeksi kolom + predicate pushdown (partisi & statistik row group)
+# - Importer CSV satu kali, dibaca per chunk sehingga memori tetap kecil
+# Usage: python RouteDatasetStore.py
+# ==========================================================
+
+import os
+import re
+import uuid
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+CSV_FILE = "dataset_rute_jakarta.csv"
+STORE_DIR = "dataset_rute_jakarta_parquet"
+
+CATEGORY_COLUMNS = ["Algoritma", "Start", "Goal", "Kondisi", "Kondisi_Jalan", "Cuaca"]
+SCHEMA = pa.schema(
+    [(c, pa.dictionary(pa.int32(), pa.string())) for c in CATEGORY_COLUMNS]
+    + [("Banjir", pa.bool_()),  # setara Kondisi.str.contains("Banjir"), statistik row group untuk pushdown
+       ("Total_Jarak_km", pa.float32()),
+       ("Estimasi_Waktu_menit", pa.float32()),
+       ("Waktu_Eksekusi", pa.float32()),  # detik (durasi query)
+       ("Tanggal", pa.timestamp("s")),
+       ("tanggal", pa.string())]  # kolom partisi (hive)
+)
+PARTITIONING = ds.partitioning(pa.schema([("tanggal", pa.string())]), flavor="hive")
+
+# -------------------------------
+# Normalisasi kolom CSV lama
+# -------------------------------
+def first_word(kondisi):
+    """Kategori Kondisi_Jalan dari teks Kondisi: 'Banjir di Slipi' -> 'Banjir'."""
+    m = re.match(r"\s*(\w+)", str(kondisi))
+    return m.group(1).title() if m else "Normal"
+
+def is_banjir(kondisi):
+    """Nilai kolom Banjir: setara str.contains("Banjir") pada teks Kondisi lengkap."""
+    return "Banjir" in str(kondisi)
+
+def _parse_datetime(values):
+    # format standar dulu (cepat), format lain hanya untuk sisa yang gagal
+    parsed = pd.to_datetime(values, errors="coerce", format="%Y-%m-%d %H:%M:%S")
+    rest = parsed.isna() & values.notna()
+    if rest.any():
+        parsed[rest] = pd.to_datetime(values[rest], errors="coerce", format="mixed")
+    return parsed
+
+def normalize(df):
+    """DataFrame berformat CSV (kolom lama/baru campur) -> DataFrame sesuai SCHEMA."""
+    out = pd.DataFrame(index=df.index)
+    def col(name):
+        if name not in df:
+            return pd.Series(pd.NA, index=df.index, dtype="object")
+        # import_csv membaca kolom kategori sebagai category -> fillna dengan nilai baru gagal
+        values = df[name]
+        return values.astype("object") if isinstance(values.dtype, pd.CategoricalDtype) else values
+
+    jarak = pd.to_numeric(col("Total_Jarak_km"), errors="coerce")
+    jarak = jarak.fillna(pd.to_numeric(col("Total_Jarak"), errors="coerce"))
+    waktu = pd.to_numeric(col("Estimasi_Waktu_menit"), errors="coerce")
+    waktu = waktu.fillna(pd.to_numeric(col("Estimasi_Waktu"), errors="coerce"))
+    # Waktu_Eksekusi lama kadang berisi timestamp (PandasIntroduction.py), bukan durasi
+    eksekusi = pd.to_numeric(col("Waktu_Eksekusi"), errors="coerce")
+    tanggal = _parse_datetime(col("Tanggal"))
+    tanggal = tanggal.fillna(_parse_datetime(col("Waktu_Eksekusi").where(eksekusi.isna())))
+
+    kondisi = col("Kondisi").fillna(col("Kondisi_Jalan")).fillna("Normal").astype(str)
+    kondisi_jalan = col("Kondisi_Jalan").astype("object")
+    missing = kondisi_jalan.isna()
+    if missing.any():
+        kondisi_jalan[missing] = kondisi[missing].map(first_word)
+
+    for name, values in [("Algoritma", col("Algoritma")), ("Start", col("Start")), ("Goal", col("Goal")),
+                         ("Kondisi", kondisi), ("Kondisi_Jalan", kondisi_jalan),
+                         ("Cuaca", col("Cuaca").fillna("Cerah"))]:
+        out[name] = values.astype("string").astype("category")
+    out["Banjir"] = kondisi.str.contains("Banjir", regex=False)
+    out["Total_Jarak_km"] = jarak.astype("float32")
+    out["Estimasi_Waktu_menit"] = waktu.astype("float32")
+    out["Waktu_Eksekusi"] = eksekusi.astype("float32")
+    out["Tanggal"] = tanggal.dt.floor("s").astype("datetime64[s]")
+    out["tanggal"] = tanggal.dt.strftime("%Y-%m-%d").fillna("unknown")
+    return out
+
+def to_legacy_frame(df):
+    """Tambahkan kembali kolom ganda agar skrip lama (PandasIntroduction*) tetap jalan."""
+    df = df.copy()
+    if "Total_Jarak_km" in df:
+        df["Total_Jarak"] = df["Total_Jarak_km"]
+    if "Estimasi_Waktu_menit" in df:
+        df["Estimasi_Waktu"] = df["Estimasi_Waktu_menit"]
+    return df
+
+# -------------------------------
+# Store
+# -------------------------------
+class RouteDatasetStore:
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+
+    def _dataset(self):
+        return ds.dataset(self.root, format="parquet", partitioning=PARTITIONING, schema=SCHEMA)
+
+    def exists(self):
+        return os.path.isdir(self.root) and any(
+            name.startswith("tanggal=") for name in os.listdir(self.root))
+
+    # ---- tulis ----
+    def append(self, df):
+        """Tambahkan DataFrame (format CSV atau sudah dinormalisasi) sebagai file Parquet baru."""
+        if not len(df):
+            return 0
+        if list(df.columns) != SCHEMA.names:
+            df = normalize(df)
+        table = pa.Table.from_pandas(df, schema=SCHEMA, preserve_index=False)
+        pq.write_to_dataset(table, self.root, partition_cols=["tanggal"],
+                            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+                            existing_data_behavior="overwrite_or_ignore")
+        return len(df)
+
+    def append_rows(self, rows):
+        """rows: list dict berkolom CSV (misal JakartaRoutingEngine.to_row)."""
+        return self.append(pd.DataFrame(rows))
+
+    def import_csv(self, csv_file=CSV_FILE, chunksize=500_000):
+        """Impor CSV sekali jalan, per chunk (memori ~ satu chunk). Returns jumlah baris."""
+        dtypes = {c: "category" for c in CATEGORY_COLUMNS}
+        dtypes.update({"Tanggal": "string", "Waktu_Eksekusi": "string"})
+        total = 0
+        for chunk in pd.read_csv(csv_file, chunksize=chunksize, dtype=dtypes):
+            total += self.append(chunk)
+        return total
+
+    # ---- baca ----
+    def read(self, columns=None, filter=None):
+        """
+        columns: proyeksi kolom (hanya kolom ini yang dibaca dari disk)
+        filter: ekspresi pyarrow, misal ds.field("Kondisi_Jalan") == "Banjir" atau ds.field("Banjir")
+        Returns pandas DataFrame (kolom kategori tetap kategori).
+        """
+        table = self._dataset().to_table(columns=columns, filter=filter)
+        return table.to_pandas()
+
+    def banjir(self, columns=("Algoritma", "Start", "Goal", "Kondisi", "Estimasi_Waktu_menit", "Tanggal")):
+        """
+        Setara df[df["Kondisi"].str.contains("Banjir")] di PandasIntroduction.py: substring pada
+        teks lengkap, jadi "Macet di Senen, Banjir di Slipi" ikut (Kondisi_Jalan hanya kata pertama).
+        Filter pada kolom bool Banjir -> row group tanpa banjir dilewati lewat statistik (pushdown).
+        """
+        # file dari versi lama belum punya kolom Banjir (null): substring pada Kondisi saat scan,
+        # match_substring belum punya kernel untuk dictionary -> decode Kondisi dulu
+        legacy = ds.field("Banjir").is_null() & pc.match_substring(
+            ds.field("Kondisi").cast(pa.string()), "Banjir")
+        return self.read(list(columns), ds.field("Banjir") | legacy)
+
+    def mean_by(self, keys=("Algoritma",), value="Estimasi_Waktu_menit", filter=None):
+        """Groupby rata-rata di Arrow (tanpa memuat kolom lain), contoh: waktu rata-rata per algoritma."""
+        keys = list(keys)
+        table = self._dataset().to_table(columns=keys + [value], filter=filter)
+        # group_by tidak mendukung key dictionary di semua versi -> decode key saja
+        table = pa.table({**{k: table[k].cast(pa.string()) for k in keys}, value: table[value]})
+        result = table.group_by(keys).aggregate([(value, "mean"), (value, "count")])
+        return result.to_pandas().sort_values(keys).reset_index(drop=True)
+
+    def count(self, filter=None):
+        return self._dataset().count_rows(filter=filter)
+
+
+if __name__ == "__main__":
+    import time
+    import shutil
+    import tempfile
+    import numpy as np
+
+    # 1) Impor dataset_rute_jakarta.csv yang ada
+    store = RouteDatasetStore()
+    if not store.exists() and os.path.exists(CSV_FILE):
+        print(f"Impor {CSV_FILE}: {store.import_csv()} baris -> {STORE_DIR}/")
+    if store.exists():
+        print(store.banjir())
+        print(store.mean_by())
+
+    # 2) Benchmark 1 juta baris sintetis: CSV + pandas vs Parquet + pushdown
+    n = 1_000_000
+    rng = np.random.default_rng(0)
+    places = ["Kebon Jeruk", "Palmerah", "Slipi", "Tanah Abang", "Monas", "Kuningan", "Setiabudi",
+              "Senen", "Kota Tua"]
+    kondisi = np.array(["Normal", "Banjir di Slipi", "Macet di Senen", "Normal", "Banjir",
+                        "Macet di Senen, Banjir di Slipi"])
+    pick = rng.integers(0, len(kondisi), n)
+    jarak = rng.uniform(3, 25, n).round(1)
+    synthetic = pd.DataFrame({
+        "Algoritma": rng.choice(["A*", "Dijkstra", "Greedy"], n),
+        "Start": rng.choice(places, n), "Goal": rng.choice(places, n),
+        "Total_Jarak": jarak, "Estimasi_Waktu": (jarak * 2).round(2), "Kondisi": kondisi[pick],
+        "Waktu_Eksekusi": rng.exponential(1e-4, n).round(6),
+        "Tanggal": (pd.Timestamp("2025-10-01") + pd.to_timedelta(rng.integers(0, 30 * 86400, n), unit="s"))
+        .strftime("%Y-%m-%d %H:%M:%S"),
+        "Total_Jarak_km": jarak, "Estimasi_Waktu_menit": (jarak * 2).round(2),
+        "Kondisi_Jalan": pd.Series(kondisi[pick]).str.split().str[0],
+        "Cuaca": rng.choice(["Cerah", "Hujan"], n),
+    })
+    tmp = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(tmp, "rute.csv")
+        synthetic.to_csv(csv_path, index=False)
+
+        t0 = time.perf_counter()
+        df = pd.read_csv(csv_path)
+        banjir_csv = df[df["Kondisi"].str.contains("Banjir")]
+        mean_csv = df.groupby("Algoritma")["Estimasi_Waktu_menit"].mean()
+        t_csv = time.perf_counter() - t0
+        mem_csv = df.memory_usage(deep=True).sum()
+
+        big = RouteDatasetStore(os.path.join(tmp, "store"))
+        t0 = time.perf_counter()
+        big.import_csv(csv_path)
+        t_import = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        banjir_pq = big.banjir()
+        mean_pq = big.mean_by()
+        t_pq = time.perf_counter() - t0
+        mem_pq = banjir_pq.memory_usage(deep=True).sum()
+
+        size_csv = os.path.getsize(csv_path)
+        size_pq = sum(os.path.getsize(os.path.join(d, f)) for d, _, fs in os.walk(big.root) for f in fs)
+        assert len(banjir_csv) == len(banjir_pq)
+        print(f"\n{n} baris: CSV {size_csv / 1e6:.0f} MB, Parquet {size_pq / 1e6:.0f} MB (impor {t_import:.1f} s)")
+        print(f"Filter Banjir + groupby: CSV/pandas {t_csv:.2f} s ({mem_csv / 1e6:.0f} MB DataFrame), "
+              f"Parquet {t_pq:.2f} s ({mem_pq / 1e6:.0f} MB hasil)")
+        print(mean_pq)
+    finally:
+        shutil.rmtree(tmp)
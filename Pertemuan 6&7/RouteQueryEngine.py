@@ -0,0 +1,344 @@
+# ===============================================================
+# Route Query Engine: ALT landmark + Contraction Hierarchies + batch many-to-many
+# ---------------------------------------------------------------
+# - Preprocessing sekali untuk satu profil bobot (metric + Kondisi + Cuaca) dari RoadNetwork:
+#     * ALT: beberapa landmark dipilih (farthest selection), jarak landmark -> semua node disimpan
+#       sebagai array float32; heuristik h(u, t) = max_L |d(L, t) - d(L, u)| (admissible, konsisten)
+#     * CH (opsional, untuk bobot statis): node dikontraksi berurutan + shortcut, query = dua
+#       search "naik" kecil dari start & goal
+# - Batch API: banyak pasangan (Start, Goal) sekaligus; dengan CH dipakai algoritma bucket
+#   many-to-many sehingga biaya per pasangan turun ke orde mikrodetik
+# Referensi: Goldberg & Harrelson (2005) ALT; Geisberger dkk. (2008) Contraction Hierarchies;
+#            Knopp dkk. (2007) many-to-many shortest paths
+# Usage: python RouteQueryEngine.py
+# ===============================================================
+
+import math
+import time
+import heapq
+import random
+
+import numpy as np
+
+from SearchEngine import astar, dijkstra
+
+INF = math.inf
+
+def _dijkstra_all(adj, source):
+    """Jarak dari source ke semua node (list)."""
+    dist = [INF] * len(adj)
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        for v, w in adj[u]:
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+    return dist
+
+# -------------------------------
+# Contraction Hierarchies
+# -------------------------------
+class ContractionHierarchy:
+    def __init__(self, adj, witness_settle_limit=60):
+        """adj: list [(v, w)] per node (graph tidak berarah, bobot statis)."""
+        n = len(adj)
+        self.witness_settle_limit = witness_settle_limit
+        graph = [dict() for _ in range(n)]
+        for u in range(n):
+            for v, w in adj[u]:
+                if v != u and w < graph[u].get(v, INF):
+                    graph[u][v] = graph[v][u] = w
+        self.middle = {}  # (u, v) shortcut -> node yang dilewati
+        self.rank = [0] * n
+        self.shortcuts = 0
+        self._contract_all(graph)
+
+        # graph "naik": hanya edge ke node dengan rank lebih tinggi
+        self.up = [[(v, w) for v, w in graph_u.items() if self.rank[v] > self.rank[u]]
+                   for u, graph_u in enumerate(self._full)]
+        del self._full
+
+    def _witness(self, graph, source, skip, max_cost, contracted):
+        dist = {source: 0.0}
+        heap = [(0.0, source)]
+        settled = 0
+        while heap and settled < self.witness_settle_limit:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            if d > max_cost:
+                break
+            settled += 1
+            for v, w in graph[u].items():
+                if v == skip or contracted[v]:
+                    continue
+                nd = d + w
+                if nd < dist.get(v, INF):
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+        return dist
+
+    def _shortcuts_for(self, graph, v, contracted):
+        nbrs = [(u, w) for u, w in graph[v].items() if not contracted[u]]
+        result = []
+        for i, (u, wu) in enumerate(nbrs):
+            targets = nbrs[i + 1:]
+            if not targets:
+                continue
+            max_cost = wu + max(w for _, w in targets)
+            dist = self._witness(graph, u, v, max_cost, contracted)
+            for x, wx in targets:
+                cost = wu + wx
+                if dist.get(x, INF) > cost:
+                    result.append((u, x, cost))
+        return result, len(nbrs)
+
+    def _priority(self, shortcuts, degree, v, deleted, level):
+        # edge difference + tetangga yang sudah dikontraksi + level -> kontraksi merata di seluruh graph
+        return 2 * (len(shortcuts) - degree) + deleted[v] + level[v]
+
+    def _contract_all(self, graph):
+        n = len(graph)
+        contracted = bytearray(n)
+        deleted = [0] * n  # jumlah tetangga yang sudah dikontraksi
+        level = [0] * n
+        heap = []
+        for v in range(n):
+            shortcuts, degree = self._shortcuts_for(graph, v, contracted)
+            heap.append((self._priority(shortcuts, degree, v, deleted, level), v))
+        heapq.heapify(heap)
+        order = 0
+        while heap:
+            _, v = heapq.heappop(heap)
+            if contracted[v]:
+                continue
+            # lazy update: hitung ulang prioritas, kontraksi hanya jika masih yang terkecil
+            shortcuts, degree = self._shortcuts_for(graph, v, contracted)
+            prio = self._priority(shortcuts, degree, v, deleted, level)
+            if heap and prio > heap[0][0]:
+                heapq.heappush(heap, (prio, v))
+                continue
+            for u, x, cost in shortcuts:
+                if cost < graph[u].get(x, INF):
+                    graph[u][x] = graph[x][u] = cost
+                    self.middle[(u, x)] = self.middle[(x, u)] = v
+                    self.shortcuts += 1
+            contracted[v] = 1
+            self.rank[v] = order
+            order += 1
+            for u in graph[v]:
+                deleted[u] += 1
+                level[u] = max(level[u], level[v] + 1)
+        self._full = graph
+
+    # -------------------------------
+    # Query
+    # -------------------------------
+    def upward_search(self, source):
+        """
+        Dijkstra pada graph naik dengan stall-on-demand: node yang bisa dicapai lebih murah lewat
+        tetangga ber-rank lebih tinggi tidak diteruskan (dan tidak dikembalikan).
+        Returns ({node: jarak}, {node: parent}).
+        """
+        up = self.up
+        dist = {source: 0.0}
+        parent = {source: -1}
+        settled = {}
+        heap = [(0.0, source)]
+        pop, push, get = heapq.heappop, heapq.heappush, dist.get
+        while heap:
+            d, u = pop(heap)
+            if d > dist[u] or u in settled:
+                continue
+            edges = up[u]
+            if any(get(v, INF) + w < d for v, w in edges):
+                continue  # stalled
+            settled[u] = d
+            for v, w in edges:
+                nd = d + w
+                if nd < get(v, INF):
+                    dist[v] = nd
+                    parent[v] = u
+                    push(heap, (nd, v))
+        return settled, parent
+
+    def _unpack(self, u, v):
+        mid = self.middle.get((u, v))
+        if mid is None:
+            return [u, v]
+        return self._unpack(u, mid)[:-1] + self._unpack(mid, v)
+
+    def query(self, s, t, with_path=True):
+        (fwd, fwd_parent), (bwd, bwd_parent) = self.upward_search(s), self.upward_search(t)
+        small, large = (fwd, bwd) if len(fwd) < len(bwd) else (bwd, fwd)
+        mu, meet = INF, -1
+        for v, d in small.items():
+            other = large.get(v)
+            if other is not None and d + other < mu:
+                mu, meet = d + other, v
+        if meet == -1 or not with_path:
+            return mu, []
+        def chain(parent, v):
+            nodes = []
+            while v != -1:
+                nodes.append(v)
+                v = parent[v]
+            return nodes
+        up_nodes = chain(fwd_parent, meet)[::-1] + chain(bwd_parent, meet)[1:]
+        path = [up_nodes[0]]
+        for a, b in zip(up_nodes, up_nodes[1:]):
+            path += self._unpack(a, b)[1:]
+        return mu, path
+
+    def many_to_many(self, sources, targets):
+        """Matriks jarak len(sources) x len(targets) dengan bucket (satu search naik per node)."""
+        buckets = {}
+        for j, t in enumerate(targets):
+            for v, d in self.upward_search(t)[0].items():
+                buckets.setdefault(v, []).append((j, d))
+        table = np.full((len(sources), len(targets)), INF)
+        for i, s in enumerate(sources):
+            row = table[i].tolist()
+            for v, d in self.upward_search(s)[0].items():
+                for j, dt in buckets.get(v, ()):
+                    if d + dt < row[j]:
+                        row[j] = d + dt
+            table[i] = row
+        return table
+
+# -------------------------------
+# Query engine
+# -------------------------------
+class RouteQueryEngine:
+    def __init__(self, network, metric="time", kondisi="Normal", cuaca="Cerah",
+                 num_landmarks=8, build_ch=False, seed=0):
+        self.network = network
+        self.view = network.view(metric, kondisi, cuaca)
+        self.profile = (metric, kondisi, cuaca)
+        self.landmarks, self.landmark_dist = self._select_landmarks(num_landmarks, seed)
+        self._ld = [row.tolist() for row in self.landmark_dist]
+        self.ch = ContractionHierarchy(self.view.adj) if build_ch else None
+
+    def _select_landmarks(self, k, seed):
+        """Farthest selection: landmark berikutnya = node terjauh dari landmark yang sudah dipilih."""
+        adj = self.view.adj
+        n = self.view.num_nodes
+        rng = random.Random(seed)
+        # node acak hanya dipakai untuk mencari landmark pertama (titik terjauh darinya)
+        dist = np.array(_dijkstra_all(adj, rng.randrange(n)))
+        score = np.where(np.isfinite(dist), dist, -1.0)
+        landmarks, rows = [], []
+        for _ in range(min(k, n)):
+            current = int(score.argmax())
+            dist = np.array(_dijkstra_all(adj, current))
+            landmarks.append(current)
+            rows.append(dist)
+            score = np.minimum(score, np.where(np.isfinite(dist), dist, -1.0))
+        return landmarks, np.array(rows, dtype=np.float32)
+
+    def alt_heuristic(self):
+        ld = self._ld
+        cache = {}
+        def h(u, goal):
+            goal_d = cache.get(goal)
+            if goal_d is None:
+                goal_d = cache[goal] = [row[goal] for row in ld]
+            best = 0.0
+            for row, dg in zip(ld, goal_d):
+                diff = dg - row[u]
+                if diff < 0:
+                    diff = -diff
+                if diff > best and diff != INF:
+                    best = diff
+            return best
+        return h
+
+    # -------------------------------
+    # Query tunggal
+    # -------------------------------
+    def query(self, start, goal, method=None):
+        """method: 'ch', 'alt' atau 'dijkstra' (default: ch jika sudah dibangun, selain itu alt)."""
+        method = method or ("ch" if self.ch else "alt")
+        s, t = self.network.node_id(start), self.network.node_id(goal)
+        t0 = time.perf_counter()
+        if method == "ch":
+            if self.ch is None:
+                raise ValueError("contraction hierarchy belum dibangun (build_ch=True)")
+            cost, path = self.ch.query(s, t)
+            expanded = None
+        elif method == "alt":
+            r = astar(self.view, s, t, self.alt_heuristic())
+            cost, path, expanded = r["cost"], r["path"], r["expanded"]
+        else:
+            r = dijkstra(self.view, s, t)
+            cost, path, expanded = r["cost"], r["path"], r["expanded"]
+        return {"path": [self.network.names[u] for u in path], "cost": cost,
+                "expanded": expanded, "runtime": time.perf_counter() - t0, "method": method}
+
+    # -------------------------------
+    # Batch
+    # -------------------------------
+    def many_to_many(self, starts, goals):
+        """Matriks biaya len(starts) x len(goals)."""
+        sources = [self.network.node_id(s) for s in starts]
+        targets = [self.network.node_id(g) for g in goals]
+        if self.ch is not None:
+            return self.ch.many_to_many(sources, targets)
+        h = self.alt_heuristic()
+        return np.array([[astar(self.view, s, t, h)["cost"] for t in targets] for s in sources])
+
+    def batch(self, pairs):
+        """
+        pairs: list (Start, Goal). Returns list biaya (urutan sama).
+        Start & Goal unik dikumpulkan lalu dijawab sekaligus dengan many_to_many.
+        """
+        starts = list(dict.fromkeys(s for s, _ in pairs))
+        goals = list(dict.fromkeys(g for _, g in pairs))
+        if self.ch is None and len(starts) * len(goals) > 4 * len(pairs):
+            # matriks terlalu jarang, lebih murah query satu per satu
+            return [self.query(s, g, "alt")["cost"] for s, g in pairs]
+        table = self.many_to_many(starts, goals)
+        si = {s: i for i, s in enumerate(starts)}
+        gi = {g: j for j, g in enumerate(goals)}
+        return [float(table[si[s], gi[g]]) for s, g in pairs]
+
+
+if __name__ == "__main__":
+    from JakartaRoutingEngine import RoadNetwork
+    from IncrementalRouting import synthetic_road_grid
+
+    jakarta = RouteQueryEngine(RoadNetwork.from_csv(), num_landmarks=3, build_ch=True)
+    for method in ("ch", "alt", "dijkstra"):
+        r = jakarta.query("Kebon Jeruk", "Kota Tua", method)
+        print(f"{method:9} {' → '.join(r['path'])} | {r['cost']:.1f} menit")
+    print(jakarta.batch([("Kebon Jeruk", "Kota Tua"), ("Palmerah", "Senen"), ("Kota Tua", "Kuningan")]))
+
+    rows = cols = 80
+    network = synthetic_road_grid(rows, cols)
+    t0 = time.perf_counter()
+    engine = RouteQueryEngine(network, num_landmarks=8)
+    t1 = time.perf_counter()
+    engine.ch = ContractionHierarchy(engine.view.adj)
+    t2 = time.perf_counter()
+    print(f"\nGraph {rows}x{cols}: landmark {t1 - t0:.1f} s, CH {t2 - t1:.1f} s "
+          f"({engine.ch.shortcuts} shortcut)")
+
+    rng = random.Random(1)
+    pairs = [(rng.choice(network.names), rng.choice(network.names)) for _ in range(50)]
+    timings = {}
+    for method in ("dijkstra", "alt", "ch"):
+        results = [engine.query(s, g, method) for s, g in pairs]
+        timings[method] = results
+        print(f"{method:9} median {np.median([r['runtime'] for r in results]) * 1e3:8.3f} ms per query")
+    for a, b in zip(timings["dijkstra"], timings["ch"]):
+        assert abs(a["cost"] - b["cost"]) < 1e-6
+    origins, destinations = network.names[::97][:60], network.names[::89][:60]
+    t0 = time.perf_counter()
+    table = engine.many_to_many(origins, destinations)
+    elapsed = time.perf_counter() - t0
+    print(f"many-to-many {len(origins)}x{len(destinations)}: {elapsed * 1e6 / table.size:.1f} µs per pasangan")
@@ -0,0 +1,327 @@
+# ==========================================================
+# Statistik Rute Streaming (tanpa scan ulang seluruh dataset)
+# ----------------------------------------------------------
+# - Pengganti df.groupby("Algoritma")["Estimasi_Waktu"].mean() dan filter str.contains("Banjir")
+#   yang dihitung ulang dari seluruh DataFrame setiap kali
+# - Setiap baris hasil rute (format to_row / dataset_rute_jakarta.csv) langsung diproses:
+#   per grup (Algoritma, Kondisi_Jalan, Cuaca, Banjir) disimpan count, mean, variance, min, max
+#   (Banjir = teks Kondisi memuat "Banjir" di posisi mana pun, misal "Macet di Senen, Banjir di Slipi")
+#   (algoritma Welford, O(1) per baris) + sketch kuantil untuk jarak, waktu, waktu eksekusi
+# - Sketch kuantil: bucket logaritmik (ala DDSketch), error relatif <= alpha, memori ~ log(max/min)
+# - Query kapan saja: summary(by=..., where=...) menggabungkan state grup (Chan et al.), bukan data mentah
+# - CSV besar dibaca per chunk: memori tetap ~ satu chunk + state grup
+# Usage: python RouteStatsStream.py
+# ==========================================================
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from RouteDatasetStore import CSV_FILE, first_word, is_banjir, normalize
+
+GROUP_KEYS = ("Algoritma", "Kondisi_Jalan", "Cuaca", "Banjir")
+METRICS = {"jarak": "Total_Jarak_km", "waktu": "Estimasi_Waktu_menit", "eksekusi": "Waktu_Eksekusi"}
+
+# -------------------------------
+# Mean / variance streaming (Welford)
+# -------------------------------
+class RunningStats:
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # jumlah kuadrat selisih terhadap mean
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    def merge(self, other):
+        """Gabungkan dua state (rumus paralel Chan et al.), hasil sama dengan add satu per satu."""
+        if other.count == 0:
+            return self
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / n
+        self.m2 += other.m2 + delta * delta * self.count * other.count / n
+        self.count = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @classmethod
+    def from_array(cls, values):
+        """State dari satu blok nilai sekaligus (vektor numpy), untuk pemrosesan per chunk."""
+        stats = cls()
+        if len(values):
+            stats.count = len(values)
+            stats.mean = float(values.mean())
+            stats.m2 = float(((values - stats.mean) ** 2).sum())
+            stats.min = float(values.min())
+            stats.max = float(values.max())
+        return stats
+
+    @property
+    def variance(self):
+        """Variance sampel (ddof=1, sama dengan pandas .var())."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+# -------------------------------
+# Sketch kuantil (bucket logaritmik)
+# -------------------------------
+class QuantileSketch:
+    def __init__(self, alpha=0.01, min_value=1e-9):
+        """
+        alpha: error relatif maksimum estimasi kuantil (0.01 = 1%)
+        min_value: nilai <= min_value (termasuk 0) masuk bucket nol
+        """
+        self.alpha = alpha
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self.log_gamma = math.log(self.gamma)
+        self.min_value = min_value
+        self.buckets = {}  # indeks bucket -> jumlah
+        self.zero_count = 0
+        self.count = 0
+
+    def _index(self, x):
+        return math.ceil(math.log(x) / self.log_gamma)
+
+    def add(self, x, n=1):
+        self.count += n
+        if x <= self.min_value:
+            self.zero_count += n
+            return
+        i = self._index(x)
+        self.buckets[i] = self.buckets.get(i, 0) + n
+
+    def add_array(self, values):
+        values = np.asarray(values, dtype=float)
+        small = values <= self.min_value
+        self.zero_count += int(small.sum())
+        self.count += len(values)
+        idx, counts = np.unique(np.ceil(np.log(values[~small]) / self.log_gamma).astype(np.int64),
+                                return_counts=True)
+        buckets = self.buckets
+        for i, n in zip(idx.tolist(), counts.tolist()):
+            buckets[i] = buckets.get(i, 0) + n
+
+    def merge(self, other):
+        if other.gamma != self.gamma:
+            raise ValueError("Sketch dengan alpha berbeda tidak bisa digabung")
+        self.count += other.count
+        self.zero_count += other.zero_count
+        for i, n in other.buckets.items():
+            self.buckets[i] = self.buckets.get(i, 0) + n
+        return self
+
+    def quantile(self, q):
+        """Estimasi kuantil q (0..1); None jika sketch kosong."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for i in sorted(self.buckets):
+            seen += self.buckets[i]
+            if rank < seen:
+                # titik tengah bucket (gamma^(i-1), gamma^i] -> error relatif <= alpha
+                return 2 * self.gamma ** i / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+# -------------------------------
+# Agregator per grup
+# -------------------------------
+class MetricState:
+    """RunningStats + QuantileSketch untuk satu metrik dalam satu grup."""
+    __slots__ = ("stats", "sketch")
+
+    def __init__(self, alpha):
+        self.stats = RunningStats()
+        self.sketch = QuantileSketch(alpha)
+
+    def add(self, x):
+        self.stats.add(x)
+        self.sketch.add(x)
+
+    def merge(self, other):
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+        return self
+
+
+class RouteStatsStream:
+    def __init__(self, alpha=0.01, quantiles=(0.5, 0.9, 0.99)):
+        self.alpha = alpha
+        self.quantiles = quantiles
+        self.groups = {}  # (Algoritma, Kondisi_Jalan, Cuaca, Banjir) -> {metrik: MetricState}
+        self.records = 0
+        self.skipped = 0  # nilai kosong / tak hingga (rute tidak ditemukan)
+
+    def _group(self, key):
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = {m: MetricState(self.alpha) for m in METRICS}
+        return group
+
+    # ---- input ----
+    def add(self, row):
+        """
+        row: dict berkolom dataset_rute_jakarta.csv (misal JakartaRoutingEngine.to_row).
+        Kolom lama (Total_Jarak, Estimasi_Waktu, Kondisi tanpa Kondisi_Jalan) juga diterima.
+        """
+        kondisi = row.get("Kondisi") or row.get("Kondisi_Jalan") or "Normal"
+        kondisi_jalan = row.get("Kondisi_Jalan") or first_word(kondisi)
+        key = (row["Algoritma"], kondisi_jalan, row.get("Cuaca") or "Cerah", is_banjir(kondisi))
+        group = self._group(key)
+        values = {"jarak": row.get("Total_Jarak_km", row.get("Total_Jarak")),
+                  "waktu": row.get("Estimasi_Waktu_menit", row.get("Estimasi_Waktu")),
+                  "eksekusi": row.get("Waktu_Eksekusi")}
+        for metric, value in values.items():
+            try:
+                x = float(value)
+            except (TypeError, ValueError):
+                x = math.nan  # misal Waktu_Eksekusi lama berisi timestamp
+            if math.isfinite(x):
+                group[metric].add(x)
+            else:
+                self.skipped += 1
+        self.records += 1
+
+    def add_result(self, result):
+        """Langsung dari hasil JakartaRoutingEngine.route()."""
+        from JakartaRoutingEngine import to_row
+        self.add(to_row(result))
+
+    def add_frame(self, df):
+        """Satu chunk DataFrame: statistik per grup dihitung vektor lalu digabung ke state."""
+        df = normalize(df)
+        keys = list(GROUP_KEYS)
+        for key, part in df.groupby(keys, observed=True, sort=False):
+            # numpy.bool_ dari groupby -> bool agar key sama dengan add()
+            group = self._group(tuple(k.item() if isinstance(k, np.generic) else k for k in key))
+            for metric, column in METRICS.items():
+                values = part[column].to_numpy(dtype=float)
+                finite = values[np.isfinite(values)]
+                self.skipped += len(values) - len(finite)
+                state = group[metric]
+                state.stats.merge(RunningStats.from_array(finite))
+                state.sketch.add_array(finite)
+        self.records += len(df)
+        return len(df)
+
+    def consume_csv(self, csv_file=CSV_FILE, chunksize=200_000):
+        """Proses CSV per chunk (memori ~ satu chunk). Returns jumlah baris."""
+        dtypes = {"Tanggal": "string", "Waktu_Eksekusi": "string"}
+        total = 0
+        for chunk in pd.read_csv(csv_file, chunksize=chunksize, dtype=dtypes):
+            total += self.add_frame(chunk)
+        return total
+
+    # ---- query ----
+    def summary(self, by=GROUP_KEYS, where=None, metric="waktu"):
+        """
+        Gabungkan state grup (tanpa scan data) -> DataFrame per kombinasi `by`.
+        where: dict filter, misal {"Banjir": True} (setara str.contains("Banjir")) atau {"Cuaca": "Hujan"}
+        """
+        by = list(by)
+        positions = [GROUP_KEYS.index(k) for k in by]
+        where = {GROUP_KEYS.index(k): v for k, v in (where or {}).items()}
+        merged = {}
+        for key, group in self.groups.items():
+            if any(key[i] != v for i, v in where.items()):
+                continue
+            out_key = tuple(key[i] for i in positions)
+            state = merged.get(out_key)
+            if state is None:
+                state = merged[out_key] = MetricState(self.alpha)
+            state.merge(group[metric])
+
+        rows = []
+        for out_key, state in sorted(merged.items()):
+            s = state.stats
+            row = dict(zip(by, out_key))
+            row.update({"count": s.count, "mean": s.mean if s.count else math.nan, "std": s.std,
+                        "min": s.min if s.count else math.nan, "max": s.max if s.count else math.nan})
+            for q in self.quantiles:
+                value = state.sketch.quantile(q)
+                row[f"p{round(q * 100):g}"] = math.nan if value is None else value
+            rows.append(row)
+        return pd.DataFrame(rows, columns=by + ["count", "mean", "std", "min", "max"]
+                            + [f"p{round(q * 100):g}" for q in self.quantiles])
+
+    def mean_by(self, by=("Algoritma",), metric="waktu", where=None):
+        """Setara df.groupby(by)[kolom].mean(), dari state yang sudah ada."""
+        table = self.summary(by, where, metric)
+        return table.set_index(list(by))["mean"]
+
+
+if __name__ == "__main__":
+    import os
+    import time
+    import tempfile
+
+    # 1) Dataset yang ada
+    stream = RouteStatsStream()
+    if os.path.exists(CSV_FILE):
+        stream.consume_csv(CSV_FILE)
+        print(f"{CSV_FILE}: {stream.records} baris")
+        print(stream.mean_by())
+        print(stream.summary(("Algoritma",), where={"Banjir": True}).to_string())
+
+    # 2) Hasil baru diproses begitu dihasilkan routing engine (O(1) per baris)
+    from JakartaRoutingEngine import RoadNetwork, route
+    network = RoadNetwork.from_csv()
+    for kondisi, cuaca in [("Normal", "Cerah"), ("Banjir di Slipi", "Hujan"), ("Macet di Senen", "Cerah")]:
+        for algorithm in ("A*", "Dijkstra"):
+            stream.add_result(route(network, "Kebon Jeruk", "Kota Tua", algorithm, "time", kondisi, cuaca))
+    print(stream.summary(("Algoritma", "Kondisi_Jalan"), metric="eksekusi").to_string())
+
+    # 3) 1 juta baris sintetis: stream per chunk vs pandas (semua di memori)
+    n = 1_000_000
+    rng = np.random.default_rng(0)
+    jarak = rng.uniform(3, 25, n).round(2)
+    kondisi = np.array(["Normal", "Banjir di Slipi", "Macet di Senen", "Banjir",
+                        "Macet di Senen, Banjir di Slipi"])[rng.integers(0, 5, n)]
+    synthetic = pd.DataFrame({
+        "Algoritma": rng.choice(["A*", "Dijkstra"], n), "Start": "Kebon Jeruk", "Goal": "Kota Tua",
+        "Total_Jarak_km": jarak, "Estimasi_Waktu_menit": (jarak * rng.uniform(1.5, 3.0, n)).round(2),
+        "Kondisi": kondisi, "Kondisi_Jalan": pd.Series(kondisi).str.split().str[0],
+        "Waktu_Eksekusi": rng.exponential(1e-4, n).round(6), "Tanggal": "2025-10-16 14:21:41",
+        "Cuaca": rng.choice(["Cerah", "Hujan"], n),
+    })
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "rute.csv")
+        synthetic.to_csv(csv_path, index=False)
+
+        big = RouteStatsStream()
+        t0 = time.perf_counter()
+        big.consume_csv(csv_path)
+        t_stream = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        exact = big.summary(("Algoritma",), where={"Banjir": True})
+        t_query = time.perf_counter() - t0
+
+        df = synthetic[synthetic["Kondisi"].str.contains("Banjir")]
+        truth = df.groupby("Algoritma")["Estimasi_Waktu_menit"]
+        assert exact.set_index("Algoritma")["count"].to_dict() == truth.count().to_dict()
+        print(f"\n{n} baris: stream per chunk {t_stream:.2f} s, query dari state {t_query * 1000:.2f} ms")
+        print(exact.to_string())
+        print("pandas mean :", truth.mean().round(4).to_dict())
+        print("pandas std  :", truth.std().round(4).to_dict())
+        print("pandas p90  :", truth.quantile(0.9).round(4).to_dict())
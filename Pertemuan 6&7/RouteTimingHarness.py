@@ -0,0 +1,173 @@
+# ===============================================================
+# Timing Harness A* vs Dijkstra (JakartaRoutingEngine)
+# ---------------------------------------------------------------
+# - Waktu_Eksekusi lama (0.00014 vs 0.00005) = satu pengukuran sub-milidetik -> didominasi noise
+# - Per (algoritma, start, goal, kondisi, cuaca):
+#   graph berbobot dibangun sekali, warm-up beberapa kali, lalu `repeat` sampel time.perf_counter_ns
+#   dengan GC dimatikan selama pengukuran
+# - Query yang terlalu cepat untuk resolusi timer diulang `number` kali per sampel (seperti timeit)
+# - Laporan: median, Q1/Q3, IQR, CI 95% median (statistik urutan), ekspansi node
+# - Perbandingan A* vs Dijkstra: rasio median + CI 95% bootstrap; "lebih cepat" hanya jika CI tidak memuat 1
+# - Hasil ditulis kembali sebagai baris dataset (Waktu_Eksekusi = median per query, detik)
+# Usage: python RouteTimingHarness.py
+# ===============================================================
+
+import gc
+import math
+import time
+from datetime import datetime
+
+import numpy as np
+
+from JakartaRoutingEngine import ALGORITHMS, DATA_FILE, RoadNetwork, append_rows, route, to_row
+
+Z_95 = 1.959964
+
+# -------------------------------
+# Statistik sampel
+# -------------------------------
+def median_ci(samples, z=Z_95):
+    """CI median bebas distribusi: statistik urutan ke-j dan ke-k (pendekatan binomial)."""
+    x = np.sort(samples)
+    n = len(x)
+    half = z * math.sqrt(n) / 2
+    lo = max(int(math.floor(n / 2 - half)), 0)
+    hi = min(int(math.ceil(n / 2 + half)), n - 1)
+    return float(x[lo]), float(x[hi])
+
+def summarize(samples_ns):
+    """Sampel (ns per query) -> dict statistik dalam detik."""
+    x = np.asarray(samples_ns, dtype=float) / 1e9
+    q1, median, q3 = np.percentile(x, [25, 50, 75])
+    ci_lo, ci_hi = median_ci(x)
+    return {"n": len(x), "median": float(median), "q1": float(q1), "q3": float(q3), "iqr": float(q3 - q1),
+            "ci_low": ci_lo, "ci_high": ci_hi, "mean": float(x.mean()), "min": float(x.min())}
+
+def ratio_ci(a, b, resamples=2000, seed=0):
+    """Rasio median(a)/median(b) + CI 95% bootstrap."""
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    rng = np.random.default_rng(seed)
+    ma = np.median(a[rng.integers(0, len(a), (resamples, len(a)))], axis=1)
+    mb = np.median(b[rng.integers(0, len(b), (resamples, len(b)))], axis=1)
+    lo, hi = np.percentile(ma / mb, [2.5, 97.5])
+    return float(np.median(a) / np.median(b)), float(lo), float(hi)
+
+# -------------------------------
+# Pengukuran
+# -------------------------------
+def _calibrate(call, min_sample_ns):
+    """Jumlah pemanggilan per sampel agar satu sampel >= min_sample_ns (mirip timeit.autorange)."""
+    number = 1
+    while True:
+        t0 = time.perf_counter_ns()
+        for _ in range(number):
+            call()
+        if time.perf_counter_ns() - t0 >= min_sample_ns or number >= 1 << 20:
+            return number
+        number *= 2
+
+def time_call(call, warmup=10, repeat=51, number=None, min_sample_ns=200_000):
+    """
+    Ukur call() -> list ns per pemanggilan (panjang `repeat`).
+    GC dimatikan selama pengukuran dan dikembalikan ke keadaan semula sesudahnya.
+    """
+    for _ in range(warmup):
+        call()
+    if number is None:
+        number = _calibrate(call, min_sample_ns)
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            t0 = time.perf_counter_ns()
+            for _ in range(number):
+                call()
+            samples.append((time.perf_counter_ns() - t0) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples, number
+
+def time_query(network, start, goal, algorithm="A*", metric="time", kondisi="Normal", cuaca="Cerah",
+               warmup=10, repeat=51, number=None, view=None):
+    """
+    Ukur satu query rute. Hanya search yang diukur (graph berbobot & heuristik dibangun sebelumnya),
+    sama seperti runtime di route().
+    Returns dict: result route() (runtime = median), statistik timing, sampel mentah (ns).
+    """
+    view = view or network.view(metric, kondisi, cuaca)
+    s, t = network.node_id(start), network.node_id(goal)
+    search = ALGORITHMS[algorithm]
+    h = network.heuristic(view.metric)
+    samples, number = time_call(lambda: search(view, s, t, h), warmup, repeat, number)
+
+    result = route(network, start, goal, algorithm, metric, kondisi, cuaca, view=view)
+    timing = summarize(samples)
+    result["runtime"] = timing["median"]
+    return {"result": result, "timing": timing, "number": number, "samples": samples}
+
+def run_harness(network, queries, algorithms=("A*", "Dijkstra"), metric="time", warmup=10, repeat=51,
+                data_file=DATA_FILE):
+    """
+    queries: list (start, goal, kondisi, cuaca). Setiap algoritma diukur pada view yang sama.
+    Baris dataset (Waktu_Eksekusi = median) ditambahkan ke data_file (None = tidak disimpan).
+    """
+    reports = []
+    for start, goal, kondisi, cuaca in queries:
+        view = network.view(metric, kondisi, cuaca)
+        for algorithm in algorithms:
+            reports.append(time_query(network, start, goal, algorithm, metric, kondisi, cuaca,
+                                      warmup, repeat, view=view))
+    if data_file:
+        tanggal = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        append_rows([to_row(r["result"], tanggal) for r in reports], data_file)
+    return reports
+
+def compare(reports, candidate="A*", baseline="Dijkstra"):
+    """Rasio median candidate/baseline per query; verdict hanya jika CI 95% tidak memuat 1."""
+    by_query = {}
+    for r in reports:
+        res = r["result"]
+        by_query.setdefault((res["start"], res["goal"], res["kondisi"], res["cuaca"]), {})[res["algorithm"]] = r
+    out = []
+    for query, algos in by_query.items():
+        if candidate not in algos or baseline not in algos:
+            continue
+        ratio, lo, hi = ratio_ci(algos[candidate]["samples"], algos[baseline]["samples"])
+        if hi < 1:
+            verdict = f"{candidate} lebih cepat"
+        elif lo > 1:
+            verdict = f"{baseline} lebih cepat"
+        else:
+            verdict = "tidak signifikan"
+        out.append({"query": query, "ratio": ratio, "ci_low": lo, "ci_high": hi, "verdict": verdict})
+    return out
+
+def print_report(reports):
+    print(f"{'Algoritma':9} {'Kondisi':30} {'median µs':>10} {'IQR µs':>8} {'CI 95% µs':>17} "
+          f"{'ekspansi':>8} {'n':>4} {'x':>5}")
+    for r in reports:
+        res, t = r["result"], r["timing"]
+        ci = f"[{t['ci_low'] * 1e6:.2f}, {t['ci_high'] * 1e6:.2f}]"
+        print(f"{res['algorithm']:9} {res['kondisi'] + ' / ' + res['cuaca']:30} {t['median'] * 1e6:10.2f} "
+              f"{t['iqr'] * 1e6:8.2f} {ci:>17} {res['expanded']:8} {t['n']:4} {r['number']:5}")
+
+
+if __name__ == "__main__":
+    network = RoadNetwork.from_csv()
+    queries = [
+        ("Kebon Jeruk", "Kota Tua", "Normal", "Cerah"),
+        ("Kebon Jeruk", "Kota Tua", "Banjir di Slipi", "Hujan"),
+        ("Palmerah", "Senen", "Macet di Tanah Abang", "Cerah"),
+    ]
+    reports = run_harness(network, queries)
+    print("=== Timing harness (search saja, GC mati) ===")
+    print_report(reports)
+    print()
+    for c in compare(reports):
+        start, goal, kondisi, cuaca = c["query"]
+        print(f"{start} → {goal} ({kondisi}, {cuaca}): A*/Dijkstra = {c['ratio']:.2f} "
+              f"[{c['ci_low']:.2f}, {c['ci_high']:.2f}] -> {c['verdict']}")
+    print(f"\n{len(reports)} baris ditambahkan ke '{DATA_FILE}' (Waktu_Eksekusi = median)")
@@ -0,0 +1,323 @@
+# search_engine.py
+# Search engine untuk state space (BFS, UCS/Dijkstra, A*, bidirectional Dijkstra/A*)
+# - Bekerja dengan graph apa pun yang punya API tetangga:
+#     num_nodes, edges(u) -> [(v, bobot)], coords(u) (untuk heuristik)
+#   contoh: GridStateSpace / CSRGraph (Pertemuan 5&6/StateSpaceGraph.py) atau DictGraph di bawah
+# - Open list berbasis heap, closed set = bytearray, g & parent = list ber-indeks id node (bukan dict)
+# - Setiap search mengembalikan {"path", "cost", "expanded", "runtime"}
+# Referensi: Russell & Norvig (2021), AI: A Modern Approach
+# Usage: python SearchEngine.py   (benchmark vs networkx.astar_path)
+
+import os
+import sys
+import math
+import time
+import heapq
+from collections import deque
+
+INF = float('inf')
+
+# -------------------------------
+# Graph dari dict (format peta Jakarta di FullCodeSearchA)
+# -------------------------------
+class DictGraph:
+    def __init__(self, graph, coords=None):
+        """graph: {node: {tetangga: bobot}}, coords: optional {node: (x, y)}"""
+        self.names = list(graph)
+        for nbrs in graph.values():
+            self.names += [v for v in nbrs if v not in self.names]
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.adj = [[] for _ in self.names]
+        for u, nbrs in graph.items():
+            self.adj[self.index[u]] = [(self.index[v], w) for v, w in nbrs.items()]
+        self.coords_list = [coords[n] for n in self.names] if coords else None
+
+    @property
+    def num_nodes(self):
+        return len(self.names)
+
+    def node_id(self, name):
+        return self.index[name]
+
+    def edges(self, u):
+        return self.adj[u]
+
+    def neighbors(self, u):
+        return [v for v, _ in self.adj[u]]
+
+    def coords(self, u):
+        return self.coords_list[u]
+
+    def path_names(self, path):
+        return [self.names[u] for u in path]
+
+# -------------------------------
+# Heuristik: h(u, goal) -> estimasi biaya
+# -------------------------------
+def zero_heuristic(graph):
+    return None
+
+def manhattan(graph, scale=1.0):
+    coords = graph.coords
+    def h(u, goal):
+        (x1, y1), (x2, y2) = coords(u), coords(goal)
+        return scale * (abs(x1 - x2) + abs(y1 - y2))
+    return h
+
+def euclidean(graph, scale=1.0):
+    coords = graph.coords
+    def h(u, goal):
+        (x1, y1), (x2, y2) = coords(u), coords(goal)
+        return scale * math.hypot(x1 - x2, y1 - y2)
+    return h
+
+def octile(graph, scale=1.0):
+    """Untuk grid 8 arah dengan biaya diagonal sqrt(2)."""
+    coords = graph.coords
+    def h(u, goal):
+        (x1, y1), (x2, y2) = coords(u), coords(goal)
+        dx, dy = abs(x1 - x2), abs(y1 - y2)
+        return scale * (max(dx, dy) + (math.sqrt(2) - 1) * min(dx, dy))
+    return h
+
+def table_heuristic(graph, table, default=0):
+    """Heuristik tabel seperti `heuristic` di FullCodeSearchA (hanya berlaku untuk goal tabel tersebut)."""
+    values = [table.get(name, default) for name in graph.names]
+    return lambda u, goal: values[u]
+
+# -------------------------------
+# Utilitas
+# -------------------------------
+def _path(parent, goal):
+    path = []
+    u = goal
+    while u != -1:
+        path.append(u)
+        u = parent[u]
+    path.reverse()
+    return path
+
+def _result(path, cost, expanded, t0):
+    return {"path": path, "cost": cost, "expanded": expanded, "runtime": time.perf_counter() - t0}
+
+def path_cost(graph, path):
+    total = 0.0
+    for u, v in zip(path, path[1:]):
+        total += min(w for x, w in graph.edges(u) if x == v)
+    return total
+
+# -------------------------------
+# BFS (jumlah langkah paling sedikit)
+# -------------------------------
+def bfs(graph, start, goal):
+    t0 = time.perf_counter()
+    n = graph.num_nodes
+    parent = [-1] * n
+    seen = bytearray(n)
+    seen[start] = 1
+    queue = deque([start])
+    expanded = 0
+    while queue:
+        u = queue.popleft()
+        expanded += 1
+        if u == goal:
+            path = _path(parent, goal)
+            return _result(path, path_cost(graph, path), expanded, t0)
+        for v, _ in graph.edges(u):
+            if not seen[v]:
+                seen[v] = 1
+                parent[v] = u
+                queue.append(v)
+    return _result([], INF, expanded, t0)
+
+# -------------------------------
+# Uniform-cost / Dijkstra dan A*
+# -------------------------------
+def astar(graph, start, goal, heuristic=None):
+    """heuristic: h(u, goal) konsisten, None = Dijkstra (uniform-cost search)."""
+    t0 = time.perf_counter()
+    n = graph.num_nodes
+    g = [INF] * n
+    parent = [-1] * n
+    closed = bytearray(n)
+    g[start] = 0
+    h = heuristic
+    open_list = [(h(start, goal) if h else 0, start)]
+    edges, push, pop = graph.edges, heapq.heappush, heapq.heappop
+    expanded = 0
+    while open_list:
+        _, u = pop(open_list)
+        if closed[u]:
+            continue  # entri basi (lazy deletion)
+        closed[u] = 1
+        expanded += 1
+        if u == goal:
+            return _result(_path(parent, goal), g[goal], expanded, t0)
+        gu = g[u]
+        for v, w in edges(u):
+            new_g = gu + w
+            if new_g < g[v] and not closed[v]:
+                g[v] = new_g
+                parent[v] = u
+                push(open_list, (new_g + h(v, goal) if h else new_g, v))
+    return _result([], INF, expanded, t0)
+
+def dijkstra(graph, start, goal):
+    return astar(graph, start, goal, None)
+
+uniform_cost = dijkstra
+
+# -------------------------------
+# Bidirectional Dijkstra / A*
+# -------------------------------
+def bidirectional(graph, start, goal, heuristic=None, reverse_graph=None):
+    """
+    Search dari dua arah sekaligus. Dengan heuristik, dipakai potensial seimbang
+    p(v) = (h(v, goal) - h(v, start)) / 2 untuk arah maju dan -p(v) untuk arah mundur,
+    sehingga berhenti saat top_maju + top_mundur >= biaya jalur terbaik (mu).
+    reverse_graph: graph dengan edge dibalik (default: graph sendiri, untuk graph tidak berarah).
+    """
+    t0 = time.perf_counter()
+    if start == goal:
+        return _result([start], 0.0, 0, t0)
+    n = graph.num_nodes
+    graphs = (graph, reverse_graph or graph)
+    h = heuristic
+    if h:
+        potential = (lambda v: (h(v, goal) - h(v, start)) / 2, lambda v: (h(v, start) - h(v, goal)) / 2)
+    else:
+        potential = (lambda v: 0.0, lambda v: 0.0)
+    dist = ([INF] * n, [INF] * n)
+    parent = ([-1] * n, [-1] * n)
+    closed = (bytearray(n), bytearray(n))
+    heaps = ([(potential[0](start), start)], [(potential[1](goal), goal)])
+    dist[0][start] = 0
+    dist[1][goal] = 0
+    mu, meet = INF, -1
+    expanded = 0
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= mu:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        _, u = heapq.heappop(heaps[side])
+        if closed[side][u]:
+            continue
+        closed[side][u] = 1
+        expanded += 1
+        d_side, d_other, p_side = dist[side], dist[1 - side], potential[side]
+        du = d_side[u]
+        for v, w in graphs[side].edges(u):
+            new_d = du + w
+            if new_d < d_side[v] and not closed[side][v]:
+                d_side[v] = new_d
+                parent[side][v] = u
+                heapq.heappush(heaps[side], (new_d + p_side(v), v))
+            if d_side[v] + d_other[v] < mu:
+                mu = d_side[v] + d_other[v]
+                meet = v
+
+    if meet == -1:
+        return _result([], INF, expanded, t0)
+    forward = _path(parent[0], meet)
+    backward = []
+    u = parent[1][meet]
+    while u != -1:
+        backward.append(u)
+        u = parent[1][u]
+    return _result(forward + backward, mu, expanded, t0)
+
+def bidirectional_dijkstra(graph, start, goal, reverse_graph=None):
+    return bidirectional(graph, start, goal, None, reverse_graph)
+
+def bidirectional_astar(graph, start, goal, heuristic, reverse_graph=None):
+    return bidirectional(graph, start, goal, heuristic, reverse_graph)
+
+# -------------------------------
+# Benchmark vs networkx
+# -------------------------------
+def _import_state_space():
+    # StateSpaceGraph ada di folder Pertemuan 5&6
+    folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Pertemuan 5&6")
+    if folder not in sys.path:
+        sys.path.insert(0, os.path.normpath(folder))
+    import StateSpaceGraph
+    return StateSpaceGraph
+
+def benchmark(sizes=(50, 100, 200, 400), obstacle_ratio=0.2, seed=0, include_networkx=True):
+    import numpy as np
+    ss = _import_state_space()
+
+    rows_out = []
+    for size in sizes:
+        # cari seed pertama yang membuat pojok kiri atas & kanan bawah terhubung
+        rng = np.random.default_rng(seed)
+        while True:
+            mask = rng.random((size, size)) < obstacle_ratio
+            mask[0, 0] = mask[-1, -1] = False
+            grid = ss.GridStateSpace(size, size, mask)
+            start, goal = grid.node_id(0, 0), grid.node_id(size - 1, size - 1)
+            if bfs(grid, start, goal)["path"]:
+                break
+        csr = grid.to_csr()
+        h = manhattan(grid)
+
+        runs = {
+            "BFS": lambda: bfs(grid, start, goal),
+            "Dijkstra": lambda: dijkstra(grid, start, goal),
+            "A*": lambda: astar(grid, start, goal, h),
+            "A* (CSR)": lambda: astar(csr, start, goal, h),
+            "Bi-Dijkstra": lambda: bidirectional_dijkstra(grid, start, goal),
+            "Bi-A*": lambda: bidirectional_astar(grid, start, goal, h),
+        }
+        results = {name: fn() for name, fn in runs.items()}
+        if include_networkx:
+            import networkx as nx
+            G = nx.grid_2d_graph(size, size)
+            G.remove_nodes_from(map(tuple, np.argwhere(mask)))
+            t0 = time.perf_counter()
+            try:
+                nx_path = nx.astar_path(G, (0, 0), (size - 1, size - 1),
+                                        heuristic=lambda a, b: abs(a[0] - b[0]) + abs(a[1] - b[1]))
+                nx_cost = len(nx_path) - 1
+            except nx.NetworkXNoPath:
+                nx_cost = INF
+            results["networkx.astar_path"] = {"path": None, "cost": nx_cost, "expanded": None,
+                                              "runtime": time.perf_counter() - t0}
+
+        for name, r in results.items():
+            rows_out.append((size, name, r["cost"], r["expanded"], r["runtime"]))
+    return rows_out
+
+def print_benchmark(rows_out):
+    print(f"{'Grid':>9} {'Algoritma':22} {'Biaya':>8} {'Ekspansi':>10} {'Waktu (ms)':>11}")
+    for size, name, cost, expanded, runtime in rows_out:
+        expanded = "-" if expanded is None else expanded
+        print(f"{f'{size}x{size}':>9} {name:22} {cost:>8} {expanded:>10} {runtime * 1000:>11.2f}")
+
+
+if __name__ == "__main__":
+    graph = {
+        'Kebon Jeruk': {'Palmerah': 4, 'Slipi': 5, 'Kuningan': 9},
+        'Palmerah': {'Kebon Jeruk': 4, 'Slipi': 3, 'Tanah Abang': 5},
+        'Slipi': {'Kebon Jeruk': 5, 'Palmerah': 3, 'Tanah Abang': 4, 'Kuningan': 6},
+        'Tanah Abang': {'Slipi': 4, 'Palmerah': 5, 'Monas': 3},
+        'Monas': {'Tanah Abang': 3, 'Senen': 4, 'Kota Tua': 7},
+        'Kuningan': {'Slipi': 6, 'Setiabudi': 3, 'Senen': 7},
+        'Setiabudi': {'Kuningan': 3, 'Senen': 6},
+        'Senen': {'Monas': 4, 'Setiabudi': 6, 'Kota Tua': 6},
+        'Kota Tua': {'Monas': 7, 'Senen': 6}
+    }
+    heuristic = {
+        'Kebon Jeruk': 9, 'Palmerah': 8, 'Slipi': 7, 'Tanah Abang': 6,
+        'Monas': 4, 'Kuningan': 9, 'Setiabudi': 8, 'Senen': 5, 'Kota Tua': 0
+    }
+    jakarta = DictGraph(graph)
+    s, t = jakarta.node_id('Kebon Jeruk'), jakarta.node_id('Kota Tua')
+    for name, r in [("A*", astar(jakarta, s, t, table_heuristic(jakarta, heuristic))),
+                    ("Dijkstra", dijkstra(jakarta, s, t)),
+                    ("Bi-Dijkstra", bidirectional_dijkstra(jakarta, s, t))]:
+        print(f"{name:12} {' → '.join(jakarta.path_names(r['path']))} | {r['cost']} km | "
+              f"ekspansi={r['expanded']} | {r['runtime'] * 1e6:.0f} µs")
+    print()
+    print_benchmark(benchmark())